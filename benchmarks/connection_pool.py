@@ -0,0 +1,80 @@
+"""Compare throughput of one-connection-per-request calls against the pooled
+keep-alive session owned by ``PaperlessClient``.
+
+A small HTTP/1.1 stub server is started on localhost, so no network access or
+API token is needed. TLS is not involved here; against the real API the gap is
+larger because every new connection also pays for a TLS handshake.
+
+Usage::
+
+    python benchmarks/connection_pool.py [--requests 500] [--threads 8]
+"""
+
+import argparse
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from paperless.client import PaperlessClient
+
+BODY = json.dumps({'id': 1, 'number': 1, 'status': 'outstanding'}).encode()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # keep-alive
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def run(label, fn, total, threads):
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        list(pool.map(lambda _: fn(), range(total)))
+    elapsed = time.perf_counter() - start
+    print(f'{label:<28} {total / elapsed:>10.1f} req/s')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=500)
+    parser.add_argument('--threads', type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = 'http://127.0.0.1:{}'.format(server.server_address[1])
+
+    client = PaperlessClient(
+        access_token='benchmark',
+        base_url=base_url,
+        pool_maxsize=args.threads,
+    )
+    headers = client.get_authenticated_headers()
+
+    def unpooled():
+        requests.get(f'{base_url}/orders/public/1', headers=headers).json()
+
+    def pooled():
+        client.get_resource('orders/public', 1)
+
+    run('new connection per request', unpooled, args.requests, args.threads)
+    run('pooled keep-alive session', pooled, args.requests, args.threads)
+    client.close()
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
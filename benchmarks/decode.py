@@ -0,0 +1,91 @@
+"""Measure how fast API responses are turned into objects.
+
+Decodes the quote and order fixtures of the unit tests over and over and
+reports the number of objects (the top-level resource and everything nested in
+it) built per second, with the attrs validators running and with the payloads
+trusted, then the time it takes to read the first field of a resource decoded
+eagerly and lazily.
+
+Usage::
+
+    python benchmarks/decode.py [--seconds 2]
+"""
+
+import argparse
+import json
+import os
+import time
+
+import attr
+
+from paperless.objects.orders import Order
+from paperless.objects.quotes import Quote
+from paperless.objects.utils import lazily, trusting
+
+MOCK_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'unit', 'mock_data'
+)
+
+
+def count_objects(value):
+    if attr.has(type(value)):
+        return 1 + sum(
+            count_objects(getattr(value, a.name)) for a in attr.fields(type(value))
+        )
+    if isinstance(value, (list, tuple)):
+        return sum(count_objects(v) for v in value)
+    if isinstance(value, dict):
+        return sum(count_objects(v) for v in value.values())
+    return 0
+
+
+def run(label, decode, resource, seconds):
+    objects = count_objects(decode(resource))
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        decode(resource)
+        calls += 1
+    elapsed = time.perf_counter() - start
+    print(
+        f'{label:<16} {objects:>6} objects {calls / elapsed:>10.1f} decodes/s'
+        f' {objects * calls / elapsed:>12.0f} objects/s'
+    )
+
+
+def first_field(label, decode, resource, seconds):
+    calls = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        decode(resource).number
+        calls += 1
+    elapsed = time.perf_counter() - start
+    print(f'{label:<16} {elapsed / calls * 1000:>10.3f} ms to the first field')
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--seconds', type=float, default=2.0)
+    args = parser.parse_args()
+
+    for label, resource_type, name in (
+        ('quote', Quote, 'quote'),
+        ('order', Order, 'order'),
+    ):
+        with open(os.path.join(MOCK_DATA, name + '.json')) as f:
+            resource = json.load(f)
+        run(label, resource_type.from_json, resource, args.seconds)
+        run(
+            label + ' trusted',
+            trusting(resource_type.from_json),
+            resource,
+            args.seconds,
+        )
+        first_field(label, resource_type.from_json, resource, args.seconds)
+        first_field(
+            label + ' lazy', lazily(resource_type.from_json), resource, args.seconds
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+"""Benchmark common integration workloads against the in-memory fake API.
+
+The fake server is filled with copies of the unit test fixtures and adds a
+configurable latency to every request, so the numbers reflect how many round
+trips each workload makes rather than how fast the network is.
+
+Usage::
+
+    python benchmarks/fake_api.py [--latency 0.02] [--components 2000] [--orders 50]
+"""
+
+import argparse
+import copy
+import os
+import tempfile
+import time
+
+from paperless.client import PaperlessClient
+from paperless.fake_server import FakePaperlessServer
+from paperless.listeners import OrderListener
+from paperless.objects.purchased_components import PurchasedComponent
+from paperless.pagination import AdaptivePageSize
+
+MOCK_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'unit', 'mock_data'
+)
+
+
+class CountingOrderListener(OrderListener):
+    processed = 0
+
+    def on_event(self, resource):
+        self.processed += 1
+        return True
+
+
+def run(label, fn, server):
+    requests_before = server.request_count
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    print(
+        f'{label:<32} {elapsed:>8.3f} s {server.request_count - requests_before:>6} requests'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--latency', type=float, default=0.02)
+    parser.add_argument('--components', type=int, default=2000)
+    parser.add_argument('--orders', type=int, default=50)
+    args = parser.parse_args()
+
+    server = FakePaperlessServer.from_fixtures(MOCK_DATA, latency=args.latency)
+    components = server.get_collection('suppliers/public/purchased_components')
+    template = next(iter(components.objects.values()))
+    for i in range(args.components - len(components.objects)):
+        component = dict(template, id=None, oem_part_number='BENCH-{}'.format(i))
+        components.insert(component)
+    orders = server.get_collection('orders/public')
+    template = next(iter(orders.objects.values()))
+    first_order = template['number']
+    for number in range(first_order + 1, first_order + args.orders):
+        orders.insert(dict(copy.deepcopy(template), number=number))
+
+    client = PaperlessClient(
+        access_token='benchmark', group_slug='benchmark', transport=server
+    )
+
+    run(
+        'list purchased components',
+        lambda: PurchasedComponent.list(prefetch=0),
+        server,
+    )
+    run(
+        'list with prefetching',
+        lambda: PurchasedComponent.list(prefetch=2),
+        server,
+    )
+    run(
+        'list with page_size=200',
+        lambda: PurchasedComponent.list(page_size=200),
+        server,
+    )
+    run(
+        'list with adaptive page size',
+        lambda: PurchasedComponent.list(page_size=AdaptivePageSize(initial=20)),
+        server,
+    )
+
+    instances = [
+        PurchasedComponent(oem_part_number='UPSERT-{}'.format(i), piece_price='1.0000')
+        for i in range(args.components)
+    ]
+    run(
+        'upsert purchased components',
+        lambda: PurchasedComponent.upsert_many(instances),
+        server,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        listener = CountingOrderListener(
+            filename=os.path.join(tmp, 'processed.json'),
+            last_record_id=first_order - 1,
+        )
+        run('order listener', listener.listen, server)
+    client.close()
+
+
+if __name__ == '__main__':
+    main()
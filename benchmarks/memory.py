@@ -0,0 +1,70 @@
+"""Measure how much memory hydrated quotes and orders take.
+
+Decodes the quote and order fixtures of the unit tests many times, keeping
+every object, and reports the memory allocated per quote or order along with
+how many of the objects in it still carry a ``__dict__``.
+
+Usage::
+
+    python benchmarks/memory.py [--copies 200]
+"""
+
+import argparse
+import gc
+import json
+import os
+import tracemalloc
+
+import attr
+
+from paperless.objects.orders import Order
+from paperless.objects.quotes import Quote
+
+MOCK_DATA = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '..', 'tests', 'unit', 'mock_data'
+)
+
+
+def iter_objects(value):
+    if attr.has(type(value)):
+        yield value
+        for a in attr.fields(type(value)):
+            yield from iter_objects(getattr(value, a.name))
+    elif isinstance(value, (list, tuple)):
+        for v in value:
+            yield from iter_objects(v)
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from iter_objects(v)
+
+
+def run(label, decode, resource, copies):
+    objects = list(iter_objects(decode(resource)))
+    with_dict = sum(1 for o in objects if hasattr(o, '__dict__'))
+    gc.collect()
+    tracemalloc.start()
+    kept = [decode(resource) for _ in range(copies)]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f'{label:<8} {len(objects):>6} objects {with_dict:>6} with __dict__'
+        f' {size / len(kept) / 1024:>10.1f} KiB each'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--copies', type=int, default=200)
+    args = parser.parse_args()
+
+    for label, resource_type, name in (
+        ('quote', Quote, 'quote'),
+        ('order', Order, 'order'),
+    ):
+        with open(os.path.join(MOCK_DATA, name + '.json')) as f:
+            resource = json.load(f)
+        run(label, resource_type.from_json, resource, args.copies)
+
+
+if __name__ == '__main__':
+    main()
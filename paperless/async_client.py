@@ -0,0 +1,164 @@
+import asyncio
+import contextvars
+import functools
+from concurrent.futures import ThreadPoolExecutor
+
+from .client import PaperlessClient
+
+
+class AsyncPaperlessClient(object):
+    """
+    asyncio front end for ``PaperlessClient``.
+
+    Every coroutine runs the matching ``PaperlessClient`` call on a worker
+    thread, so status code handling, throttling and errors are exactly the same
+    as for synchronous calls, while the event loop stays free to drive many
+    requests at once. At most ``max_concurrency`` calls are in flight at the
+    same time; the rest wait on a semaphore. Keep ``pool_maxsize`` of the
+    underlying client at least as large as ``max_concurrency`` so that every
+    in-flight request can use a pooled connection.
+    """
+
+    DEFAULT_MAX_CONCURRENCY = 10
+
+    __instance = None
+
+    def __init__(self, client=None, max_concurrency=DEFAULT_MAX_CONCURRENCY):
+        """
+        :param client: the PaperlessClient to send requests with. Defaults to
+        the one returned by ``PaperlessClient.get_instance()`` at call time.
+        :param max_concurrency: maximum number of requests in flight at once
+        """
+        self._client = client
+        self.max_concurrency = max_concurrency
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='paperless'
+        )
+        self._semaphores = {}
+
+    @classmethod
+    def get_instance(cls):
+        if AsyncPaperlessClient.__instance is None:
+            AsyncPaperlessClient.__instance = cls()
+        return AsyncPaperlessClient.__instance
+
+    @property
+    def client(self) -> PaperlessClient:
+        if self._client is not None:
+            return self._client
+        return PaperlessClient.get_instance()
+
+    def _get_semaphore(self):
+        # asyncio primitives are bound to the loop they are first used on
+        loop = asyncio.get_running_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._semaphores = {
+                l: s for l, s in self._semaphores.items() if not l.is_closed()
+            }
+            self._semaphores[loop] = semaphore
+        return semaphore
+
+    async def run(self, func, *args, **kwargs):
+        """
+        Run the blocking callable ``func`` on a worker thread once a
+        concurrency slot is free and return its result.
+        """
+        loop = asyncio.get_running_loop()
+        ctx = contextvars.copy_context()
+        call = functools.partial(ctx.run, func, *args, **kwargs)
+        async with self._get_semaphore():
+            return await loop.run_in_executor(self._executor, call)
+
+    def close(self):
+        """
+        Shut down the worker threads. Pending calls are completed first.
+        """
+        self._executor.shutdown(wait=True)
+
+    async def request(
+        self,
+        url=None,
+        method=None,
+        data=None,
+        params=None,
+        headers=None,
+        compress=False,
+        **kwargs,
+    ):
+        return await self.run(
+            self.client.request,
+            url=url,
+            method=method,
+            data=data,
+            params=params,
+            headers=headers,
+            compress=compress,
+            **kwargs,
+        )
+
+    async def get_resource_list(self, list_url, params=None, resource_type=None):
+        return await self.run(
+            self.client.get_resource_list,
+            list_url,
+            params=params,
+            resource_type=resource_type,
+        )
+
+    async def get_resource(self, resource_url, id, params=None, resource_type=None):
+        return await self.run(
+            self.client.get_resource,
+            resource_url,
+            id,
+            params=params,
+            resource_type=resource_type,
+        )
+
+    async def get_resource_object(
+        self, resource_url, id, decode, params=None, resource_type=None
+    ):
+        return await self.run(
+            self.client.get_resource_object,
+            resource_url,
+            id,
+            decode,
+            params=params,
+            resource_type=resource_type,
+        )
+
+    async def get_new_resources(self, resource_url, params=None, resource_type=None):
+        return await self.run(
+            self.client.get_new_resources,
+            resource_url,
+            params=params,
+            resource_type=resource_type,
+        )
+
+    async def create_resource(self, resource_url, data, compress=False):
+        return await self.run(
+            self.client.create_resource, resource_url, data, compress=compress
+        )
+
+    async def patch_resource(self, resource_url, data, compress=False):
+        return await self.run(
+            self.client.patch_resource, resource_url, data, compress=compress
+        )
+
+    async def put_resource(self, resource_url, data, compress=False):
+        return await self.run(
+            self.client.put_resource, resource_url, data, compress=compress
+        )
+
+    async def update_resource(self, resource_url, id, data, params=None):
+        return await self.run(
+            self.client.update_resource, resource_url, id, data, params=params
+        )
+
+    async def delete_resource(self, resource_url, id):
+        return await self.run(self.client.delete_resource, resource_url, id)
+
+    async def download_file(self, resource_url, id, file_path, params=None):
+        return await self.run(
+            self.client.download_file, resource_url, id, file_path, params=params
+        )
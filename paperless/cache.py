@@ -0,0 +1,332 @@
+"""Optional response cache for ``PaperlessClient``.
+
+Reference data such as payment terms or users rarely changes, yet sync jobs
+fetch it over and over. A ``ResponseCache`` given to the client keeps the raw
+response bodies of GET requests for resource types that have a TTL, and drops
+them as soon as the client writes to the same resource URL.
+
+A ``RevalidationStore`` lets the client revalidate single resources with
+conditional requests instead, which suits large payloads such as quotes that
+must never be served stale.
+"""
+
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+
+from .retry import WallClock
+
+
+class MemoryCacheBackend:
+    """In-process LRU store holding at most ``maxsize`` entries."""
+
+    def __init__(self, maxsize=1024):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return ``(url, expires, body)`` or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key, url, expires, body):
+        """Store an entry and return the number of entries evicted."""
+        with self._lock:
+            self._entries[key] = (url, expires, body)
+            self._entries.move_to_end(key)
+            evicted = 0
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+            return evicted
+
+    def delete(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def delete_prefix(self, url_prefix):
+        """Delete entries whose URL starts with ``url_prefix``."""
+        with self._lock:
+            keys = [
+                k
+                for k, (url, _, _) in self._entries.items()
+                if url.startswith(url_prefix)
+            ]
+            for k in keys:
+                del self._entries[k]
+            return len(keys)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class SQLiteCacheBackend:
+    """LRU store in a SQLite database, so cached data survives restarts and can
+    be shared by several processes."""
+
+    def __init__(self, path, maxsize=10000, timeout=30.0):
+        self.path = path
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS response_cache ('
+            'key TEXT PRIMARY KEY, url TEXT, expires REAL, body BLOB, '
+            'accessed INTEGER)'
+        )
+        self._conn.execute(
+            'CREATE INDEX IF NOT EXISTS response_cache_accessed '
+            'ON response_cache (accessed)'
+        )
+
+    def _tick(self):
+        # a monotonically increasing access counter shared by all connections
+        row = self._conn.execute(
+            'SELECT COALESCE(MAX(accessed), 0) + 1 FROM response_cache'
+        ).fetchone()
+        return row[0]
+
+    def get(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                'SELECT url, expires, body FROM response_cache WHERE key = ?', (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                'UPDATE response_cache SET accessed = ? WHERE key = ?',
+                (self._tick(), key),
+            )
+            return row[0], row[1], bytes(row[2])
+
+    def set(self, key, url, expires, body):
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                self._conn.execute(
+                    'INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?)',
+                    (key, url, expires, body, self._tick()),
+                )
+                count = self._conn.execute(
+                    'SELECT COUNT(*) FROM response_cache'
+                ).fetchone()[0]
+                evicted = max(0, count - self.maxsize)
+                if evicted:
+                    self._conn.execute(
+                        'DELETE FROM response_cache WHERE key IN ('
+                        'SELECT key FROM response_cache ORDER BY accessed LIMIT ?)',
+                        (evicted,),
+                    )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+            return evicted
+
+    def delete(self, key):
+        with self._lock:
+            self._conn.execute('DELETE FROM response_cache WHERE key = ?', (key,))
+
+    def delete_prefix(self, url_prefix):
+        with self._lock:
+            cursor = self._conn.execute(
+                'DELETE FROM response_cache WHERE substr(url, 1, ?) = ?',
+                (len(url_prefix), url_prefix),
+            )
+            return cursor.rowcount
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute('DELETE FROM response_cache')
+
+    def __len__(self):
+        with self._lock:
+            row = self._conn.execute('SELECT COUNT(*) FROM response_cache').fetchone()
+            return row[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class ResponseCache:
+    """
+    Caches GET response bodies by URL and query parameters.
+
+    Only requests for resource types with a TTL are cached. The TTL of a
+    resource class is looked up in ``ttls`` first, then in the class's
+    ``_cache_ttl`` attribute, then falls back to ``default_ttl`` (no caching
+    when None).
+
+    :param backend: a ``MemoryCacheBackend`` (the default) or a
+    ``SQLiteCacheBackend``
+    :param ttls: dict mapping resource classes to TTLs in seconds
+    """
+
+    def __init__(self, backend=None, ttls=None, default_ttl=None, clock=None):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+        # expiry times must be comparable between processes for the SQLite backend
+        self.clock = clock or WallClock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._lock = threading.Lock()
+
+    def ttl_for(self, resource_type):
+        if resource_type is None:
+            return None
+        if resource_type in self.ttls:
+            return self.ttls[resource_type]
+        ttl = getattr(resource_type, '_cache_ttl', None)
+        return ttl if ttl is not None else self.default_ttl
+
+    @staticmethod
+    def make_key(url, params=None, scope=None):
+        """
+        Build the key of a request. ``scope`` identifies the client making it
+        (see ``PaperlessClient.cache_scope``), so clients of different groups
+        or tokens sharing a cache never see each other's responses.
+        """
+        key = '{}?{}'.format(url, json.dumps(params, sort_keys=True, default=str))
+        return '{} {}'.format(scope, key) if scope else key
+
+    def get(self, url, params=None, scope=None):
+        """Return the cached body for the request, or None."""
+        key = self.make_key(url, params, scope)
+        entry = self.backend.get(key)
+        if entry is not None and entry[1] < self.clock.time():
+            self.backend.delete(key)
+            entry = None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return entry[2]
+
+    def set(self, url, params, body, ttl, scope=None):
+        key = self.make_key(url, params, scope)
+        evicted = self.backend.set(key, url, self.clock.time() + ttl, body)
+        with self._lock:
+            self.evictions += evicted
+
+    def invalidate(self, url_prefix):
+        """Drop every entry whose URL starts with ``url_prefix``, whatever
+        client it was cached for."""
+        deleted = self.backend.delete_prefix(url_prefix)
+        with self._lock:
+            self.invalidations += deleted
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'size': len(self.backend),
+            }
+
+
+class RevalidationStore:
+    """
+    Keeps the validators (``ETag`` and ``Last-Modified``) of fetched resources
+    together with the response body, so the client can ask the server whether
+    a resource changed instead of downloading it again. When the server
+    answers 304 Not Modified the stored body is decoded again, which gives
+    every caller its own object.
+
+    A 304 therefore saves the download but not the decoding. Handing out the
+    object decoded the first time would make callers share, and modify, one
+    instance, and copying it with ``copy.deepcopy`` takes about twice as long
+    as parsing and decoding the body again (28 ms against 13 ms for the quote
+    of the unit tests).
+
+    Entries are keyed like those of ``ResponseCache``, including the scope
+    of the client. Responses without validators are not stored. At most
+    ``maxsize`` bodies are kept, least recently used first out.
+    """
+
+    def __init__(self, maxsize=256):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def conditional_headers(self, url, params=None, scope=None):
+        """Return the headers to revalidate the stored entry, or None."""
+        with self._lock:
+            entry = self._entries.get(ResponseCache.make_key(url, params, scope))
+        if entry is None:
+            return None
+        etag, last_modified = entry[1], entry[2]
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def not_modified(self, url, params=None, scope=None):
+        """Return the stored body after a 304 response, or None if there is
+        none."""
+        key = ResponseCache.make_key(url, params, scope)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[3]
+
+    def store(self, url, params, response, scope=None):
+        """Remember the body of ``response`` if it carries validators."""
+        key = ResponseCache.make_key(url, params, scope)
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._entries.pop(key, None)
+                return
+            self._entries[key] = (url, etag, last_modified, response.content)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, url_prefix):
+        """Drop every entry whose URL starts with ``url_prefix``."""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e[0].startswith(url_prefix)]
+            for k in keys:
+                del self._entries[k]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._entries),
+            }
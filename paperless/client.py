@@ -1,19 +1,57 @@
+import contextlib
+import contextvars
+import functools
+import hashlib
 import json
 import logging
 import sys
-import time
+import threading
 from types import SimpleNamespace
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .exceptions import (
     PaperlessAuthorizationException,
     PaperlessException,
     PaperlessNotFoundException,
 )
+from .retry import RetryPolicy, get_retry_after
+from .singleflight import SingleFlight
+from .transfer import (
+    ACCEPT_ENCODING,
+    body_size,
+    endpoint_name,
+    gzip_body,
+    received_sizes,
+)
+from .transport import HTTPTransport
 
 LOGGER = logging.getLogger(__name__)
 
+_current_client = contextvars.ContextVar('paperless_client', default=None)
+
+
+@contextlib.contextmanager
+def use_client(client):
+    """
+    Make ``client`` the current client for the enclosed block::
+
+        with use_client(PaperlessClient(access_token=..., set_default=False)):
+            order = Order.get(1)
+
+    The setting is stored in a ``contextvars.ContextVar``, so it applies to the
+    current thread or asyncio task only and concurrent blocks using different
+    clients do not interfere. Threads started inside the block do not inherit
+    it; run their work through ``contextvars.copy_context().run`` or
+    activate the client inside the thread.
+    """
+    token = _current_client.set(client)
+    try:
+        yield client
+    finally:
+        _current_client.reset(token)
+
 
 class PaperlessClient(object):
     GET = 'get'
@@ -26,41 +64,207 @@ class PaperlessClient(object):
     VERSION_0 = 'v0.7'
     VALID_VERSIONS = [VERSION_0]
 
-    __instance = None
+    DEFAULT_POOL_CONNECTIONS = 10
+    DEFAULT_POOL_MAXSIZE = 10
+
+    __default_instance = None
     access_token = None
     base_url = "https://api.paperlessparts.com"
     group_slug = None
     version = VERSION_0
 
+    # connection pool settings, see get_session
+    pool_connections = DEFAULT_POOL_CONNECTIONS
+    pool_maxsize = DEFAULT_POOL_MAXSIZE
+    pool_block = False
+    _session = None
+
+    # set per client in __init__, so clients do not share a retry budget
+    retry_policy = None
+    rate_limiter = None
+    coalesce_requests = True
+    cache = None
+    revalidation_store = None
+    # gzip batch request bodies of at least this many bytes, None to disable
+    compress_min_size = None
+    transfer_stats = None
+    transport = None
+
     METHODS = SimpleNamespace(
         DELETE='delete', GET='get', PATCH='patch', POST='post', PUT='put'
     )
 
-    def __new__(cls, **kwargs):
+    def __new__(cls, set_default=None, **kwargs):
         """
-        Create or return the PaperlessClient Singleton.
+        Without ``set_default``, return the default client if there is one, so
+        that ``PaperlessClient(**kwargs)`` keeps updating the configured client
+        as it did when the client was a singleton.
         """
-        if PaperlessClient.__instance is None:
-            PaperlessClient.__instance = object.__new__(cls)
-        instance = PaperlessClient.__instance
+        default = PaperlessClient.__default_instance
+        if set_default is None and default is not None:
+            return default
+        return object.__new__(cls)
+
+    def __init__(self, set_default=None, **kwargs):
+        """
+        Create a client. Clients are independent of each other, so one process
+        can talk to the API on behalf of several supplier groups at once.
+
+        Resource classes send their requests through the client returned by
+        ``PaperlessClient.get_instance()``: the client activated in the current
+        context with ``use_client``, or else the process-wide default client.
+
+        :param set_default: True to create a new client and make it the
+        process-wide default, False to create one that is not. By default the
+        first client created becomes the default, and later calls update it
+        with the given settings and return it.
+        """
+        # the default client returned by __new__ keeps its session
+        if '_session_lock' not in self.__dict__:
+            self._session_lock = threading.Lock()
+            self.singleflight = SingleFlight()
+            self._http_transport = HTTPTransport(self.get_session)
+            self.retry_policy = RetryPolicy()
 
         if 'access_token' in kwargs:
-            instance.access_token = kwargs['access_token']
+            self.access_token = kwargs['access_token']
 
         if 'base_url' in kwargs:
-            instance.base_url = kwargs['base_url']
+            self.base_url = kwargs['base_url']
 
         if 'group_slug' in kwargs:
-            instance.group_slug = kwargs['group_slug']
+            self.group_slug = kwargs['group_slug']
 
         if 'version' in kwargs:  # TODO: ADD VERSION VALIDATION
-            instance.version = kwargs['version']
+            self.version = kwargs['version']
+
+        if 'retry_policy' in kwargs:
+            self.retry_policy = kwargs['retry_policy']
+
+        if 'rate_limiter' in kwargs:
+            self.rate_limiter = kwargs['rate_limiter']
 
-        return instance
+        if 'coalesce_requests' in kwargs:
+            self.coalesce_requests = kwargs['coalesce_requests']
+
+        if 'cache' in kwargs:
+            self.cache = kwargs['cache']
+
+        if 'revalidation_store' in kwargs:
+            self.revalidation_store = kwargs['revalidation_store']
+
+        if 'compress_min_size' in kwargs:
+            self.compress_min_size = kwargs['compress_min_size']
+
+        if 'transfer_stats' in kwargs:
+            self.transfer_stats = kwargs['transfer_stats']
+
+        if 'transport' in kwargs:
+            self.transport = kwargs['transport']
+
+        pool_kwargs = {
+            k: kwargs[k]
+            for k in ('pool_connections', 'pool_maxsize', 'pool_block')
+            if k in kwargs
+        }
+        if pool_kwargs:
+            self.configure_pool(**pool_kwargs)
+
+        if set_default or (
+            set_default is None and PaperlessClient.__default_instance is None
+        ):
+            PaperlessClient.set_default_instance(self)
 
     @classmethod
     def get_instance(cls):
-        return cls.__instance
+        """
+        Return the client to use in the current context: the one activated
+        with ``use_client`` if any, otherwise the default client.
+        """
+        client = _current_client.get()
+        if client is not None:
+            return client
+        return PaperlessClient.__default_instance
+
+    @classmethod
+    def set_default_instance(cls, client):
+        """
+        Set the client used wherever no client was activated with
+        ``use_client``.
+        """
+        PaperlessClient.__default_instance = client
+
+    def activate(self):
+        """
+        Shortcut for ``use_client(self)``.
+        """
+        return use_client(self)
+
+    def configure_pool(self, pool_connections=None, pool_maxsize=None, pool_block=None):
+        """
+        Configure the HTTP connection pool used by this client. The current
+        session, if any, is closed and a new one will be created with the
+        given settings on the next request.
+
+        :param pool_connections: number of per-host connection pools to cache
+        :param pool_maxsize: maximum number of keep-alive connections per host
+        :param pool_block: if True, block when all connections are in use
+        instead of opening an extra, non-pooled connection
+        """
+        with self._session_lock:
+            if pool_connections is not None:
+                self.pool_connections = pool_connections
+            if pool_maxsize is not None:
+                self.pool_maxsize = pool_maxsize
+            if pool_block is not None:
+                self.pool_block = pool_block
+            self._close_session()
+
+    def get_session(self):
+        """
+        Return the ``requests.Session`` shared by every request made through
+        this client. Connections are kept alive and reused from a pool, so
+        consecutive calls to the API skip the TCP and TLS handshakes. The
+        session is created lazily and may be used from several threads.
+        """
+        session = self._session
+        if session is None:
+            with self._session_lock:
+                session = self._session
+                if session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(
+                        pool_connections=self.pool_connections,
+                        pool_maxsize=self.pool_maxsize,
+                        pool_block=self.pool_block,
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    self._session = session
+        return session
+
+    def get_transport(self):
+        """
+        Return the transport requests are sent with: ``self.transport`` if
+        set, otherwise an ``HTTPTransport`` using the pooled session.
+        """
+        if self.transport is not None:
+            return self.transport
+        return self._http_transport
+
+    def close(self):
+        """
+        Close all pooled connections. A new pool is created on the next request.
+        """
+        with self._session_lock:
+            self._close_session()
+        if self.transport is not None:
+            self.transport.close()
+
+    def _close_session(self):
+        if self._session is not None:
+            self._session.close()
+            self._session = None
 
     def get_authenticated_headers(self):
         if not self.access_token:
@@ -71,6 +275,7 @@ class PaperlessClient(object):
 
         return {
             'Accept': 'application/json',
+            'Accept-Encoding': ACCEPT_ENCODING,
             'Authorization': 'API-Token {}'.format(self.access_token),
             'Content-Type': 'application/json',
             'User-Agent': 'python-paperlessSDK {}'.format(self.version),
@@ -84,73 +289,157 @@ class PaperlessClient(object):
         params=None,
         retry_attempt_count=0,
         timeout=300,
+        stream=False,
+        headers=None,
+        compress=False,
     ):
-        req_url = f'{self.base_url}/{url}'
+        """
+        Send a request to the API and return the response. Failed attempts are
+        retried as decided by ``self.retry_policy``; any other error response
+        is raised as a ``PaperlessException``.
+
+        Identical GET requests issued concurrently from several threads are
+        sent only once while ``coalesce_requests`` is enabled; every caller
+        receives the same response. See ``self.singleflight.stats()``.
+
+        :param retry_attempt_count: number of attempts already made for this
+        request, counted against the retry policy's ``max_attempts``
+        :param headers: extra request headers, e.g. for conditional requests
+        :param compress: gzip ``data`` if it is at least ``compress_min_size``
+        bytes long
+        """
+        send = functools.partial(
+            self._send,
+            url=url,
+            method=method,
+            data=data,
+            params=params,
+            retry_attempt_count=retry_attempt_count,
+            timeout=timeout,
+            stream=stream,
+            headers=headers,
+            compress=compress,
+        )
+        if self.coalesce_requests and method == self.METHODS.GET and not stream:
+            key = (
+                url,
+                json.dumps(params, sort_keys=True, default=str),
+                json.dumps(headers, sort_keys=True),
+            )
+            return self.singleflight.do(key, send)
+        return send()
 
-        headers = self.get_authenticated_headers()
+    def _send(
+        self,
+        url,
+        method,
+        data,
+        params,
+        retry_attempt_count,
+        timeout,
+        stream,
+        headers,
+        compress,
+    ):
+        req_url = f'{self.base_url}/{url}'
 
-        method_to_call = getattr(requests, method)
-        if data is not None:
-            resp = method_to_call(
-                req_url, headers=headers, data=data, params=params, timeout=timeout
-            )
-        else:
-            resp = method_to_call(
-                req_url, headers=headers, params=params, timeout=timeout
-            )
+        headers = {**self.get_authenticated_headers(), **(headers or {})}
 
+        raw_size = body_size(data)
         if (
-            resp.status_code == 200
-            or resp.status_code == 201
-            or resp.status_code == 204
+            compress
+            and self.compress_min_size is not None
+            and raw_size >= self.compress_min_size
         ):
-            return resp
-        elif resp.status_code == 429:
+            data = gzip_body(data)
+            headers['Content-Encoding'] = 'gzip'
+
+        retry_state = self.retry_policy.start()
+        retry_state.attempt = retry_attempt_count
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire(self.group_slug)
             try:
-                message = resp.json().get('message')
-                LOGGER.info(message)
-                wait_time = (
-                    int(message[message.find('in') + 3 : message.find('second') - 1])
-                    + 1
+                resp = self.get_transport().send(
+                    method,
+                    req_url,
+                    headers=headers,
+                    data=data,
+                    params=params,
+                    timeout=timeout,
+                    stream=stream,
+                )
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = retry_state.next_delay(method, exception=e)
+                if delay is None:
+                    raise
+                LOGGER.info(
+                    "Request to %s failed (%s). Retrying in %.1f seconds.",
+                    url,
+                    e,
+                    delay,
                 )
-                time.sleep(wait_time)
-            except (
-                TypeError,
-                AttributeError,
-                ValueError,
-            ) as e:  # catch any exception while trying to access the backoff message
-                LOGGER.error(e)
-                time.sleep(60)
-            finally:
-                return self.request(url=url, method=method, data=data, params=params)
-        elif resp.status_code == 400:
+            else:
+                if self.transfer_stats is not None:
+                    self.record_transfer(method, url, data, raw_size, resp, stream)
+                if self.rate_limiter is not None:
+                    if resp.status_code == RetryPolicy.THROTTLED:
+                        self.rate_limiter.on_throttled(
+                            self.group_slug, get_retry_after(resp)
+                        )
+                    else:
+                        self.rate_limiter.on_success(self.group_slug)
+                if resp.status_code in (200, 201, 204, 304):
+                    return resp
+                delay = retry_state.next_delay(method, response=resp)
+                if delay is None:
+                    break
+                LOGGER.info(
+                    "Received %s from %s. Retrying in %.1f seconds.",
+                    resp.status_code,
+                    url,
+                    delay,
+                )
+                resp.close()
+            self.retry_policy.sleep(delay)
+
+        self.raise_for_response(resp, url)
+
+    def record_transfer(self, method, url, data, raw_size, resp, stream):
+        """
+        Add the sizes of a request and its response to ``transfer_stats``.
+        Streamed responses have not been read yet and count as zero bytes
+        received.
+        """
+        if stream:
+            received, received_raw = 0, 0
+        else:
+            received, received_raw = received_sizes(resp)
+        self.transfer_stats.record(
+            endpoint_name(method, url),
+            body_size(data),
+            raw_size,
+            received,
+            received_raw,
+        )
+
+    def raise_for_response(self, resp, url):
+        """
+        Raise the ``PaperlessException`` matching an error response.
+        """
+        if resp.status_code == 400:
             raise PaperlessException(
                 message="Failed to update resource: {}".format(resp.content),
                 error_code=resp.status_code,
             )
         elif resp.status_code == 401 and resp.json()['code'] == 'authentication_failed':
             raise PaperlessAuthorizationException(
-                message="Not authorized to access url: {}".format(req_url)
+                message="Not authorized to access url: {}/{}".format(self.base_url, url)
             )
         elif resp.status_code == 404:
             raise PaperlessNotFoundException(
                 message="Unable to locate object at url: {}".format(url)
             )
-        elif resp.status_code == 502:
-            if retry_attempt_count < 5:
-                LOGGER.info("Received 502. Waiting 30 seconds to retry.")
-                time.sleep(30)
-                return self.request(
-                    url=url,
-                    method=method,
-                    data=data,
-                    params=params,
-                    retry_attempt_count=retry_attempt_count + 1,
-                )
-            else:
-                raise PaperlessException(
-                    message="Request failed", error_code=resp.status_code
-                )
         else:
             try:
                 resp_json = resp.json()
@@ -162,52 +451,145 @@ class PaperlessClient(object):
                 )
             raise PaperlessException(message=message, error_code=resp.status_code)
 
-    def get_resource_list(self, list_url, params=None):
-        resp = self.request(url=list_url, method=self.METHODS.GET, params=params)
-        return resp.json()
+    def get_resource_list(self, list_url, params=None, resource_type=None):
+        return self.get_json(list_url, params=params, resource_type=resource_type)
 
-    def get_resource(self, resource_url, id, params=None):
+    def get_resource(self, resource_url, id, params=None, resource_type=None):
         """
             takes a resource type
             performs GET request for last updated + 1
             will return true if the next object exists, else false
         """
         url = "{}/{}".format(resource_url, id)
-        print(url)
-        resp = self.request(url=url, method=self.METHODS.GET, params=params)
-        return resp.json()
+        return self.get_json(url, params=params, resource_type=resource_type)
 
-    def get_new_resources(self, resource_url, params=None):
+    def get_new_resources(self, resource_url, params=None, resource_type=None):
 
         # req_url = "{}/{}".format(self.base_url, resource_url)
-        resp = self.request(url=resource_url, method=self.METHODS.GET, params=params)
-        return resp.json()
+        return self.get_json(resource_url, params=params, resource_type=resource_type)
+
+    def get_resource_object(
+        self, resource_url, id, decode, params=None, resource_type=None
+    ):
+        """
+        GET a single resource and return ``decode(json)``.
+
+        With a ``revalidation_store`` the request carries ``If-None-Match`` /
+        ``If-Modified-Since`` headers for a resource fetched before, and a 304
+        response is answered by decoding the body stored back then with the
+        ``decode`` of this call. Resources the response ``cache`` holds a TTL
+        for are served by the cache instead.
+        """
+        store = self.revalidation_store
+        cached = self.cache is not None and self.cache.ttl_for(resource_type)
+        if store is None or cached:
+            return decode(
+                self.get_resource(
+                    resource_url, id, params=params, resource_type=resource_type
+                )
+            )
+        url = "{}/{}".format(resource_url, id)
+        scope = self.cache_scope()
+        headers = store.conditional_headers(url, params, scope)
+        resp = self.request(
+            url=url, method=self.METHODS.GET, params=params, headers=headers
+        )
+        if resp.status_code == 304:
+            body = store.not_modified(url, params, scope)
+            if body is not None:
+                # decoded again rather than shared, see RevalidationStore
+                return decode(json.loads(body))
+            # evicted in the meantime, fetch it unconditionally
+            resp = self.request(url=url, method=self.METHODS.GET, params=params)
+        obj = decode(resp.json())
+        store.store(url, params, resp, scope)
+        return obj
+
+    def get_json(self, url, params=None, resource_type=None):
+        """
+        GET ``url`` and return the decoded JSON body. If the client has a
+        ``cache`` with a TTL for ``resource_type``, the body is served from
+        and stored in the cache.
+        """
+        ttl = self.cache.ttl_for(resource_type) if self.cache is not None else None
+        if not ttl:
+            resp = self.request(url=url, method=self.METHODS.GET, params=params)
+            return resp.json()
+        scope = self.cache_scope()
+        body = self.cache.get(url, params, scope)
+        if body is None:
+            resp = self.request(url=url, method=self.METHODS.GET, params=params)
+            body = resp.content
+            self.cache.set(url, params, body, ttl, scope)
+        return json.loads(body)
+
+    def cache_scope(self):
+        """
+        Identify whose data this client fetches, for the keys of ``cache`` and
+        ``revalidation_store``: the API, the group and a fingerprint of the
+        access token. The token itself is never written to the cache.
+        """
+        token = hashlib.sha256((self.access_token or '').encode()).hexdigest()
+        return '{}|{}|{}'.format(self.base_url, self.group_slug or '', token[:16])
 
-    def create_resource(self, resource_url, data):
+    def invalidate_cache(self, resource_url):
+        """
+        Drop cached responses and stored validators for ``resource_url`` and
+        everything below it. Called after every write made through this client.
+        """
+        if resource_url.endswith('/batch'):
+            resource_url = resource_url[: -len('/batch')]
+        if self.cache is not None:
+            self.cache.invalidate(resource_url)
+        if self.revalidation_store is not None:
+            self.revalidation_store.invalidate(resource_url)
+
+    def create_resource(self, resource_url, data, compress=False):
         """
         """
-        resp = self.request(url=resource_url, method=self.METHODS.POST, data=data)
+        try:
+            resp = self.request(
+                url=resource_url, method=self.METHODS.POST, data=data, compress=compress
+            )
+        finally:
+            self.invalidate_cache(resource_url)
         return resp.json()
 
-    def patch_resource(self, resource_url, data):
+    def patch_resource(self, resource_url, data, compress=False):
         """
         """
-        resp = self.request(url=resource_url, method=self.METHODS.PATCH, data=data)
+        try:
+            resp = self.request(
+                url=resource_url,
+                method=self.METHODS.PATCH,
+                data=data,
+                compress=compress,
+            )
+        finally:
+            self.invalidate_cache(resource_url)
         return resp.json()
 
-    def put_resource(self, resource_url, data):
+    def put_resource(self, resource_url, data, compress=False):
         """
         """
-        resp = self.request(url=resource_url, method=self.METHODS.PUT, data=data)
+        try:
+            resp = self.request(
+                url=resource_url, method=self.METHODS.PUT, data=data, compress=compress
+            )
+        finally:
+            self.invalidate_cache(resource_url)
         return resp.json()
 
     def update_resource(self, resource_url, id, data, params=None):
         """
         """
         req_url = '{}/{}'.format(resource_url, id)
-        resp = self.request(
-            url=req_url, method=self.METHODS.PATCH, data=data, params=params
-        )
+        try:
+            resp = self.request(
+                url=req_url, method=self.METHODS.PATCH, data=data, params=params
+            )
+        finally:
+            self.invalidate_cache(resource_url)
 
         return resp.json()
 
@@ -218,7 +600,10 @@ class PaperlessClient(object):
 
         req_url = '{}/{}'.format(resource_url, id)
 
-        resp = self.request(url=req_url, method=self.METHODS.DELETE)
+        try:
+            resp = self.request(url=req_url, method=self.METHODS.DELETE)
+        finally:
+            self.invalidate_cache(resource_url)
         return
 
     def download_file(self, resource_url, id, file_path, params=None):
@@ -227,7 +612,80 @@ class PaperlessClient(object):
         """
 
         req_url = "{}/{}".format(resource_url, id)
-        resp = self.request(req_url, method=self.METHODS.GET, params=params)
-        with open(file_path, 'wb') as f:
-            for chunk in resp.iter_content(1024):
-                f.write(chunk)
+        resp = self.request(
+            req_url, method=self.METHODS.GET, params=params, stream=True
+        )
+        try:
+            with open(file_path, 'wb') as f:
+                for chunk in resp.iter_content(1024):
+                    f.write(chunk)
+        finally:
+            # hand the connection back to the pool
+            resp.close()
+
+
+class ClientRegistry(object):
+    """
+    Holds one ``PaperlessClient`` per supplier group, for processes that
+    work on behalf of several groups at once. Clients created by the registry
+    share its settings (for example ``base_url``, ``retry_policy`` or
+    ``rate_limiter``) and never become the process-wide default::
+
+        registry = ClientRegistry(rate_limiter=RateLimiter())
+        registry.register('acme', access_token=ACME_TOKEN)
+        registry.register('globex', access_token=GLOBEX_TOKEN)
+
+        with registry.use('acme'):
+            orders = Order.list()
+    """
+
+    def __init__(self, **client_kwargs):
+        self.client_kwargs = client_kwargs
+        self._clients = {}
+        self._lock = threading.Lock()
+
+    def register(self, group_slug, access_token, **kwargs):
+        """
+        Create and store the client for ``group_slug``, replacing any
+        existing one. Keyword arguments override the registry's settings.
+        """
+        client_kwargs = {**self.client_kwargs, **kwargs}
+        client = PaperlessClient(
+            set_default=False,
+            access_token=access_token,
+            group_slug=group_slug,
+            **client_kwargs,
+        )
+        with self._lock:
+            previous = self._clients.get(group_slug)
+            self._clients[group_slug] = client
+        if previous is not None:
+            previous.close()
+        return client
+
+    def get(self, group_slug):
+        try:
+            return self._clients[group_slug]
+        except KeyError:
+            raise PaperlessException(
+                message="No client registered for group {}".format(group_slug)
+            )
+
+    def use(self, group_slug):
+        """
+        Make the client for ``group_slug`` current in the enclosed block.
+        """
+        return use_client(self.get(group_slug))
+
+    def __contains__(self, group_slug):
+        return group_slug in self._clients
+
+    def __iter__(self):
+        return iter(list(self._clients))
+
+    def close(self):
+        """
+        Close the connection pools of all clients.
+        """
+        for client in list(self._clients.values()):
+            client.close()
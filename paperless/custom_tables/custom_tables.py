@@ -7,6 +7,8 @@ from paperless.client import PaperlessClient
 class CustomTable:
     config = None
     data = None
+    # seconds to keep responses in the client's response cache, if it has one
+    _cache_ttl = 60 * 5
 
     def __init__(self, config=None, data=None):
         if config is not None:
@@ -114,7 +116,9 @@ class CustomTable:
     def get_list(cls):
         client = PaperlessClient.get_instance()
 
-        return client.get_new_resources(cls.construct_list_url(), params=None)
+        return client.get_new_resources(
+            cls.construct_list_url(), params=None, resource_type=cls
+        )
 
     @classmethod
     def construct_get_url(cls):
@@ -124,7 +128,9 @@ class CustomTable:
     def get(cls, table_name):
         client = PaperlessClient.get_instance()
 
-        return client.get_resource(cls.construct_get_url(), table_name)
+        return client.get_resource(
+            cls.construct_get_url(), table_name, resource_type=cls
+        )
 
     @classmethod
     def construct_delete_url(cls):
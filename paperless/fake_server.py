@@ -0,0 +1,346 @@
+"""An in-memory stand-in for the Paperless Parts API.
+
+``FakePaperlessServer`` is a transport that answers requests from
+collections of JSON objects held in memory, so integrations can be exercised
+and benchmarked without network access or an API token::
+
+    server = FakePaperlessServer.from_fixtures('tests/unit/mock_data', latency=0.05)
+    client = PaperlessClient(access_token='fake', transport=server)
+    orders = Order.list()
+
+It implements the parts of the API the SDK relies on: reading single
+objects, paginated and plain lists, creating, updating and deleting objects,
+batch endpoints, the ``new`` endpoint polled by ``QuoteListener``, and
+throttling with 429 responses. It does not validate payloads or implement
+filters other than ordering with the ``o`` parameter.
+"""
+
+import gzip
+import json
+import math
+import os
+import threading
+from collections import OrderedDict, deque
+from urllib.parse import urlencode, urlsplit
+
+from .retry import SYSTEM_CLOCK
+from .transport import Transport, make_response
+
+
+class FakeCollection:
+    """
+    The objects behind one API resource URL.
+
+    :param url: the resource URL, e.g. ``'suppliers/public/purchased_components'``
+    :param key: the field identifying an object in the URL
+    :param paginated: whether lists are wrapped in ``{'count', 'next',
+    'previous', 'results'}`` pages or returned as plain JSON lists
+    :param list_url: a different URL to list the objects at, where ``*``
+    matches any path segment
+    :param new_name: answer ``<url>/new`` with ``{new_name: key, 'revision':
+    revision_number}`` for every object after ``last_<new_name>``
+    """
+
+    def __init__(
+        self, url, objects=(), key='id', paginated=True, list_url=None, new_name=None
+    ):
+        self.url = url.strip('/')
+        self.key = key
+        self.paginated = paginated
+        self.list_url = list_url.strip('/') if list_url else None
+        self.new_name = new_name
+        self.objects = OrderedDict()
+        self._next_id = 1
+        for obj in objects:
+            self.insert(obj)
+
+    def insert(self, obj):
+        obj = dict(obj)
+        if obj.get(self.key) is None:
+            while str(self._next_id) in self.objects:
+                self._next_id += 1
+            obj[self.key] = self._next_id
+        self.objects[str(obj[self.key])] = obj
+        return obj
+
+    def update(self, id, changes):
+        obj = self.objects.get(str(id))
+        if obj is None:
+            return None
+        obj.update(changes)
+        return obj
+
+    def upsert(self, obj):
+        key = obj.get(self.key)
+        if key is not None and str(key) in self.objects:
+            return self.update(key, obj)
+        return self.insert(obj)
+
+
+def _param(params, name, default=None):
+    value = (params or {}).get(name, default)
+    if isinstance(value, (list, tuple)):
+        value = value[0] if value else default
+    return value
+
+
+def _matches(pattern, path):
+    pattern_segments = pattern.split('/')
+    path_segments = path.split('/')
+    return len(pattern_segments) == len(path_segments) and all(
+        p == '*' or p == s for p, s in zip(pattern_segments, path_segments)
+    )
+
+
+class FakePaperlessServer(Transport):
+    """
+    :param page_size: objects per page of paginated lists, unless the request
+    asks for another ``page_size``
+    :param max_page_size: the most objects per page a request can ask for
+    :param latency: seconds every request takes
+    :param rate_limit: answer 429 once more than this many requests were made
+    within ``rate_period`` seconds
+    :param clock: a ``paperless.retry.Clock`` used for latency and throttling
+    """
+
+    BASE_URL = 'https://fake.paperlessparts.com'
+
+    def __init__(
+        self,
+        page_size=20,
+        latency=0.0,
+        rate_limit=None,
+        rate_period=60.0,
+        clock=None,
+        max_page_size=None,
+    ):
+        self.page_size = page_size
+        self.max_page_size = max_page_size
+        self.latency = latency
+        self.rate_limit = rate_limit
+        self.rate_period = rate_period
+        self.clock = clock or SYSTEM_CLOCK
+        self.collections = []
+        self.request_count = 0
+        self.throttled_count = 0
+        self._requests = deque()
+        self._lock = threading.RLock()
+
+    def add_collection(self, url, objects=(), **kwargs):
+        """
+        Serve ``objects`` at ``url``. Keyword arguments are passed to
+        ``FakeCollection``.
+        """
+        collection = FakeCollection(url, objects, **kwargs)
+        with self._lock:
+            self.collections.append(collection)
+            # longest URLs first, so nested resources win over their parents
+            self.collections.sort(key=lambda c: -len(c.url))
+        return collection
+
+    def get_collection(self, url):
+        url = url.strip('/')
+        for collection in self.collections:
+            if collection.url == url:
+                return collection
+        raise KeyError(url)
+
+    @classmethod
+    def from_fixtures(cls, fixtures_dir, **kwargs):
+        """
+        Create a server holding the objects from the JSON fixtures of the
+        SDK's unit tests (``tests/unit/mock_data``).
+        """
+
+        def load(name):
+            with open(os.path.join(fixtures_dir, name + '.json')) as f:
+                data = json.load(f)
+            if isinstance(data, list):
+                return data
+            # a single object, or a page of them
+            return data.get('results', [data])
+
+        server = cls(**kwargs)
+        server.add_collection(
+            'quotes/public', load('quote'), key='number', new_name='quote'
+        )
+        server.add_collection(
+            'orders/public', load('order'), key='number', list_url='orders/groups/*'
+        )
+        server.add_collection('accounts/public', load('account'))
+        server.add_collection('contacts/public', load('contact'))
+        server.add_collection('events/public', load('event_list'), key='uuid')
+        server.add_collection(
+            'customers/public/payment_terms',
+            load('payment_terms_list'),
+            paginated=False,
+        )
+        server.add_collection(
+            'users/public', load('user_list'), key='uuid', paginated=False
+        )
+        server.add_collection(
+            'suppliers/public/purchased_components', load('purchased_components')
+        )
+        server.add_collection(
+            'suppliers/public/purchased_component_columns',
+            load('purchased_component_columns'),
+            paginated=False,
+        )
+        server.add_collection(
+            'managed_integrations/public',
+            load('managed_integration_list'),
+            key='uuid',
+            paginated=False,
+        )
+        return server
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+        timeout=None,
+        stream=False,
+    ):
+        if self.latency:
+            self.clock.sleep(self.latency)
+        with self._lock:
+            retry_after = self._throttle()
+            if retry_after is not None:
+                self.throttled_count += 1
+                message = 'Request was throttled. Expected available in {} seconds.'
+                return make_response(
+                    429,
+                    {'message': message.format(retry_after)},
+                    headers={'Retry-After': str(retry_after)},
+                    url=url,
+                )
+            self.request_count += 1
+            body = self._decode_body(data, headers or {})
+            status, payload = self._dispatch(
+                method.lower(), urlsplit(url).path.strip('/'), params, body
+            )
+            # serialize while holding the lock, the payload is live server state
+            return make_response(status, b'' if status == 204 else payload, url=url)
+
+    def _throttle(self):
+        """Record a request and return None, or the seconds to wait if the
+        rate limit is exceeded."""
+        if self.rate_limit is None:
+            return None
+        now = self.clock.time()
+        while self._requests and self._requests[0] <= now - self.rate_period:
+            self._requests.popleft()
+        if len(self._requests) >= self.rate_limit:
+            return max(1, math.ceil(self._requests[0] + self.rate_period - now))
+        self._requests.append(now)
+        return None
+
+    @staticmethod
+    def _decode_body(data, headers):
+        if not data:
+            return None
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        if headers.get('Content-Encoding') == 'gzip':
+            data = gzip.decompress(data)
+        return json.loads(data)
+
+    def _route(self, path):
+        """Return ``(collection, rest of the path)`` for a request path."""
+        for collection in self.collections:
+            if collection.list_url and _matches(collection.list_url, path):
+                return collection, ''
+            if path == collection.url:
+                return collection, ''
+            if path.startswith(collection.url + '/'):
+                return collection, path[len(collection.url) + 1 :]
+        return None, None
+
+    def _dispatch(self, method, path, params, body):
+        not_found = (404, {'message': 'Not found.', 'code': 'not_found'})
+        collection, rest = self._route(path)
+        if collection is None:
+            return not_found
+        if rest == '':
+            if method == 'get':
+                return 200, self._list(collection, path, params)
+            if method == 'post':
+                return 201, collection.insert(body)
+        elif rest == 'batch':
+            objects = self._batch_objects(body)
+            if method == 'put':
+                successes = [collection.upsert(obj) for obj in objects]
+                return 200, {'successes': successes, 'failures': []}
+            if method == 'post':
+                return 201, [collection.insert(obj) for obj in objects]
+            if method == 'patch':
+                updated = [
+                    collection.update(obj.get(collection.key), obj) for obj in objects
+                ]
+                return 200, [obj for obj in updated if obj is not None]
+        elif rest == 'new' and collection.new_name and method == 'get':
+            return 200, self._new(collection, params)
+        elif '/' not in rest:
+            obj = collection.objects.get(rest)
+            if obj is None:
+                return not_found
+            if method == 'get':
+                return 200, obj
+            if method == 'patch':
+                return 200, collection.update(rest, body or {})
+            if method == 'delete':
+                del collection.objects[rest]
+                return 204, None
+        return 405, {'message': 'Method "{}" not allowed.'.format(method.upper())}
+
+    @staticmethod
+    def _batch_objects(body):
+        # batch payloads hold the objects under a resource specific key
+        if isinstance(body, dict):
+            for value in body.values():
+                if isinstance(value, list):
+                    return value
+            return []
+        return body or []
+
+    def _list(self, collection, path, params):
+        objects = list(collection.objects.values())
+        ordering = _param(params, 'o')
+        if ordering:
+            field = ordering.lstrip('-')
+            objects.sort(
+                key=lambda o: (o.get(field) is None, o.get(field)),
+                reverse=ordering.startswith('-'),
+            )
+        if not collection.paginated:
+            return objects
+        page = int(_param(params, 'page', 1))
+        page_size = int(_param(params, 'page_size', self.page_size))
+        if self.max_page_size is not None:
+            page_size = min(page_size, self.max_page_size)
+        start = (page - 1) * page_size
+
+        def page_url(number):
+            query = {k: _param(params, k) for k in (params or {}) if k not in ('page',)}
+            query['page'] = number
+            return '{}/{}?{}'.format(self.BASE_URL, path, urlencode(query))
+
+        return {
+            'count': len(objects),
+            'next': page_url(page + 1) if start + page_size < len(objects) else None,
+            'previous': page_url(page - 1) if page > 1 else None,
+            'results': objects[start : start + page_size],
+        }
+
+    @staticmethod
+    def _new(collection, params):
+        name = collection.new_name
+        last = _param(params, 'last_{}'.format(name))
+        return [
+            {name: obj[collection.key], 'revision': obj.get('revision_number')}
+            for obj in collection.objects.values()
+            if last is None or int(obj[collection.key]) > int(last)
+        ]
@@ -5,6 +5,7 @@ SQLite would be an obvious enhancement to provide better data integrity and
 performance for large numbers of records.
 """
 import datetime
+import hashlib
 import json
 import os
 import time
@@ -26,7 +27,8 @@ class LocalStorage:
     def clear_cache(self, resource_type=None):
         """Clear local storage for resources of type ``resource_type``. If
         ``resource_type`` is None, then the entire local storage will be
-        cleared."""
+        cleared. Checkpoints are kept; remove them with
+        ``save_checkpoint(name, None)``."""
         raise NotImplemented
 
     def process(self, resource_type, resource_id, success, dt=None):
@@ -40,6 +42,19 @@ class LocalStorage:
         """
         raise NotImplemented
 
+    def get_checkpoint(self, name):
+        """Get the checkpoint saved under ``name``, or None if there is
+        none."""
+        raise NotImplementedError
+
+    def save_checkpoint(self, name, value):
+        """
+        Save a checkpoint under ``name``, replacing the previous one.
+
+        :param value: JSON serializable data, or None to remove the checkpoint
+        """
+        raise NotImplementedError
+
     @staticmethod
     def get_instance(filename):
         """Factory method for default LocalStorage implementation"""
@@ -92,5 +107,31 @@ class LocalJSONStorage(LocalStorage):
         self.store[key].append({'id': resource_id, 'dt': dt_str, 's': success})
         self._write()
 
+    def _checkpoint_filename(self, name):
+        # each checkpoint has a file of its own next to the storage file, so
+        # saving one does not rewrite the processed records or other checkpoints
+        digest = hashlib.sha256(name.encode()).hexdigest()[:16]
+        return '{}.{}.checkpoint'.format(self.filename, digest)
+
+    def get_checkpoint(self, name):
+        try:
+            with open(self._checkpoint_filename(name), 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+
+    def save_checkpoint(self, name, value):
+        filename = self._checkpoint_filename(name)
+        if value is None:
+            if os.path.exists(filename):
+                os.remove(filename)
+            return
+        # checkpoints are saved often, so replace the file atomically rather
+        # than waiting out a partial write like _write does
+        tmp_filename = filename + '.tmp'
+        with open(tmp_filename, 'w') as f:
+            json.dump(value, f)
+        os.replace(tmp_filename, filename)
+
 
 DEFAULT_IMPLEMENTATION = LocalJSONStorage
@@ -1,15 +1,20 @@
 import json
-import types
-import urllib.parse as urlparse
 from itertools import islice
-from urllib.parse import parse_qs
 
 import attr
 
+from . import pagination, records
 from .api_mappers import BaseMapper
+from .async_client import AsyncPaperlessClient
 from .client import PaperlessClient
 from .json_encoders import BaseJSONEncoder
 from .objects.common import BatchResponse, FailureResponse
+from .objects.utils import (
+    construct,
+    decoding,
+    get_field_names,
+    get_updater,
+)
 
 
 class FromJSONMixin(object):
@@ -30,38 +35,41 @@ class FromJSONMixin(object):
     @classmethod
     def from_json(cls, resource: dict):
         try:
-            d = dict()
-            cls_attrs = [a.name for a in attr.fields(cls)]
-            for k, v in resource.items():
-                if k in cls_attrs:
-                    d[k] = v
+            cls_attrs = get_field_names(cls)
+            d = {k: v for k, v in resource.items() if k in cls_attrs}
         except attr.exceptions.NotAnAttrsClassError:
             d = resource
-        return cls(**cls.from_json_to_dict(d))
+        return construct(cls, cls.from_json_to_dict(d))
 
     def update_with_response_data(self, response_data):
         """
         Update this instance with data from the given API response dictionary.
         """
-        resp_obj = self.from_json(response_data)
-        # This filter is designed to remove methods, properties, and private data members and only let through the
-        # fields explicitly defined in the class definition
-        keys = filter(
-            lambda x: not x.startswith("__")
-            and not x.startswith("_")
-            and type(getattr(resp_obj, x)) != types.MethodType
-            and (
-                not isinstance(getattr(resp_obj.__class__, x), property)
-                if x in dir(resp_obj.__class__)
-                else True
-            ),
-            dir(resp_obj),
-        )
-        for key in keys:
-            setattr(self, key, getattr(resp_obj, key))
+        self.update_instances_with_response_data([self], [response_data])
+
+    @classmethod
+    def update_instances_with_response_data(cls, instances, responses):
+        """
+        Update each of the instances with data from the matching API response dictionary. Only the attrs fields
+        found in the response are set, converted (and mapped) as from_json would, without building a new object.
+        """
+        try:
+            cls_attrs = get_field_names(cls)
+        except attr.exceptions.NotAnAttrsClassError:
+            for instance, response_data in zip(instances, responses):
+                for key, value in cls.from_json_to_dict(response_data).items():
+                    setattr(instance, key, value)
+            return
+        update = get_updater(cls)
+        for instance, response_data in zip(instances, responses):
+            d = {k: v for k, v in response_data.items() if k in cls_attrs}
+            update(instance, cls.from_json_to_dict(d))
 
 
 class ReadMixin(object):
+    # seconds to keep responses in the client's response cache, if it has one
+    _cache_ttl = None
+
     @classmethod
     def construct_get_url(cls):
         """
@@ -85,20 +93,25 @@ class ReadMixin(object):
         return None
 
     @classmethod
-    def get(cls, id):
+    def get(cls, id, validate=True, lazy=False):
         """
         Retrieves the resource specified by the id.
 
 
         :raise PaperlessNotFoundException: Raised when the requested id 404s aka is not found.
         :param id: int
+        :param validate: bool, False to trust the response and skip the attrs validators
+        :param lazy: bool, True to build the objects of nested lists only when they are accessed
         :return: resource
         """
         client = PaperlessClient.get_instance()
-        return cls.from_json(
-            client.get_resource(
-                cls.construct_get_url(), id, params=cls.construct_get_params()
-            )
+        decode = decoding(cls.from_json, validate, lazy)
+        return client.get_resource_object(
+            cls.construct_get_url(),
+            id,
+            decode,
+            params=cls.construct_get_params(),
+            resource_type=cls,
         )
 
     @classmethod
@@ -110,10 +123,19 @@ class ReadMixin(object):
             params=cls.construct_get_new_params(id) if id else None,
         )
 
+    @classmethod
+    async def aget(cls, *args, **kwargs):
+        """
+        Coroutine version of ``get``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(cls.get, *args, **kwargs)
+
 
 class ListMixin(object):
     _list_mapper = BaseMapper
     _list_object_representation = None
+    # seconds to keep responses in the client's response cache, if it has one
+    _cache_ttl = None
 
     @classmethod
     def construct_list_url(cls):
@@ -136,24 +158,48 @@ class ListMixin(object):
         return results
 
     @classmethod
-    def list(cls, params=None):
+    def from_list_json(cls, resource):
+        """
+        Deserialize one item of a list response, as the minimal representation
+        defined by _list_object_representation if there is one.
+        """
+        if cls._list_object_representation:
+            return cls._list_object_representation.from_json(resource)
+        return cls.from_json(resource)
+
+    @classmethod
+    def list_decoder(cls, fields=None):
+        """
+        Returns the function deserializing one item of a list response: from_list_json, or if fields are given, one building a lightweight read-only record of just those fields (see paperless.records).
+        """
+        if fields is None:
+            return cls.from_list_json
+        return records.record_decoder(cls._list_object_representation or cls, fields)
+
+    @classmethod
+    def list(cls, params=None, fields=None):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
+        :param fields: names of the fields to return; if given, each resource is returned as a read-only record of the raw JSON values of these fields instead
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
         resource_list = cls.parse_list_response(
-            client.get_resource_list(cls.construct_list_url(), params=params)
+            client.get_resource_list(
+                cls.construct_list_url(), params=params, resource_type=cls
+            )
         )
-        if cls._list_object_representation:
-            return [
-                cls._list_object_representation.from_json(resource)
-                for resource in resource_list
-            ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
+        decode = cls.list_decoder(fields)
+        return [decode(resource) for resource in resource_list]
+
+    @classmethod
+    async def alist(cls, *args, **kwargs):
+        """
+        Coroutine version of ``list``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(cls.list, *args, **kwargs)
 
 
 class PaginatedListMixin(ListMixin):
@@ -169,33 +215,175 @@ class PaginatedListMixin(ListMixin):
         return results["results"]
 
     @classmethod
-    def list(cls, params=None, pages=None):
+    def iter_pages(
+        cls,
+        params=None,
+        prefetch=0,
+        parallel=0,
+        pages=None,
+        cursor=None,
+        page_size=None,
+    ):
+        """
+        Returns an iterator over the raw JSON responses for each page of the list. A page is requested only once the previous one has been consumed, unless prefetch or parallel is set.
+
+        :param params: dict of params for your list request
+        :param prefetch: number of pages to fetch ahead on a background thread
+        :param parallel: if set, fetch all pages after the first with this many concurrent requests, provided the response gives a total count
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1), in ascending order
+        :param cursor: a paperless.pagination.ListCursor to resume from, which is advanced as pages are consumed
+        :param page_size: number of resources per page to ask for, or a paperless.pagination.AdaptivePageSize to grow the page size while the API answers quickly
+        :return: iterator of dicts
+        """
+        # resolve the client now, not when iteration starts
+        client = PaperlessClient.get_instance()
+        return pagination.paginate(
+            client,
+            cls.construct_list_url(),
+            params=params,
+            resource_type=cls,
+            pages=pages,
+            cursor=cursor,
+            prefetch_pages=prefetch,
+            workers=parallel,
+            page_size=page_size,
+        )
+
+    @classmethod
+    def iter_list(
+        cls,
+        params=None,
+        prefetch=0,
+        parallel=0,
+        pages=None,
+        cursor=None,
+        page_size=None,
+        fields=None,
+    ):
+        """
+        Returns an iterator over the resources of the list, deserialized page by page, so only one page is held in memory at a time.
+
+        :param params: dict of params for your list request
+        :param prefetch: number of pages to fetch ahead on a background thread while the current one is deserialized
+        :param parallel: if set, fetch all pages after the first with this many concurrent requests, provided the response gives a total count
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1), in ascending order
+        :param cursor: a paperless.pagination.ListCursor to resume from. It is advanced once every resource of a page has been consumed, so saving it while iterating allows picking up where a crashed run left off.
+        :param page_size: number of resources per page to ask for, or a paperless.pagination.AdaptivePageSize to grow the page size while the API answers quickly
+        :param fields: names of the fields to return; if given, each resource is returned as a read-only record of the raw JSON values of these fields instead
+        :return: iterator of resources
+        """
+        responses = cls.iter_pages(
+            params,
+            prefetch=prefetch,
+            parallel=parallel,
+            pages=pages,
+            cursor=cursor,
+            page_size=page_size,
+        )
+        decode = cls.list_decoder(fields)
+        return (
+            decode(resource)
+            for page in responses
+            for resource in cls.parse_list_response(page)
+        )
+
+    @classmethod
+    def list(
+        cls,
+        params=None,
+        pages=None,
+        prefetch=pagination.DEFAULT_PREFETCH,
+        parallel=0,
+        cursor=None,
+        page_size=None,
+        fields=None,
+    ):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
-        :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1), in ascending order
+        :param prefetch: number of pages to fetch ahead on a background thread while the current one is deserialized
+        :param parallel: if set, fetch all pages after the first with this many concurrent requests, provided the response gives a total count
+        :param cursor: a paperless.pagination.ListCursor to resume from, which is advanced as pages are loaded
+        :param page_size: number of resources per page to ask for, or a paperless.pagination.AdaptivePageSize to grow the page size while the API answers quickly
+        :param fields: names of the fields to return; if given, each resource is returned as a read-only record of the raw JSON values of these fields instead
         :return: [resource]
         """
-        client = PaperlessClient.get_instance()
-        response = client.get_resource_list(cls.construct_list_url(), params=params)
-        resource_list = cls.parse_list_response(response)
-        while response["next"] is not None:
-            next_url = response["next"]
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(), params=next_query_params
+        return list(
+            cls.iter_list(
+                params,
+                prefetch=prefetch,
+                parallel=parallel,
+                pages=pages,
+                cursor=cursor,
+                page_size=page_size,
+                fields=fields,
             )
-            resource_list.extend(cls.parse_list_response(response))
-        if cls._list_object_representation:
+        )
+
+    @classmethod
+    def count(cls, params=None):
+        """
+        Returns the number of resources in the list, requesting a single resource rather than every page.
+
+        :param params: dict of params for your list request
+        :return: int
+        """
+        client = PaperlessClient.get_instance()
+        return pagination.count(
+            client, cls.construct_list_url(), params=params, resource_type=cls
+        )
+
+    @classmethod
+    def exists(cls, params=None):
+        """
+        Returns whether the list has any resources, requesting a single resource rather than every page.
+
+        :param params: dict of params for your list request
+        :return: bool
+        """
+        client = PaperlessClient.get_instance()
+        return pagination.exists(
+            client, cls.construct_list_url(), params=params, resource_type=cls
+        )
+
+    @classmethod
+    def list_many(cls, param, values, params=None, workers=4, fields=None):
+        """
+        Lists the resources for each of several values of one query param, running up to workers list calls concurrently. Duplicates are removed before deserializing, so a resource matching several values is deserialized once and shared between them, identified by its primary key.
+
+        :param param: name of the query param, e.g. 'erp_code'
+        :param values: iterable of values for param
+        :param params: dict of further params for every list request
+        :param workers: maximum number of concurrent list calls
+        :param fields: names of the fields to return, as for list
+        :return: dict mapping each value to its [resource]
+        """
+        decode = cls.list_decoder(fields)
+
+        def list_one(value):
+            pages = cls.iter_pages({**(params or {}), param: value})
             return [
-                cls._list_object_representation.from_json(resource)
-                for resource in resource_list
+                resource for page in pages for resource in cls.parse_list_response(page)
             ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
+
+        results = pagination.map_concurrently(list_one, values, workers=workers)
+        primary_key = getattr(cls, '_primary_key', 'id')
+        by_key = {}
+
+        def decode_once(resource):
+            key = resource.get(primary_key)
+            if key is None:
+                return decode(resource)
+            if key not in by_key:
+                by_key[key] = decode(resource)
+            return by_key[key]
+
+        return {
+            value: [decode_once(resource) for resource in resources]
+            for value, resources in results.items()
+        }
 
 
 class ToDictMixin(object):
@@ -236,6 +424,14 @@ class CreateMixin(object):
         resp = client.create_resource(self.construct_post_url(), data=data)
         self.update_with_response_data(resp)
 
+    async def acreate(self, *args, **kwargs):
+        """
+        Coroutine version of ``create``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            self.create, *args, **kwargs
+        )
+
 
 class UpdateMixin(object):
     _primary_key = "id"
@@ -256,6 +452,14 @@ class UpdateMixin(object):
         )
         self.update_with_response_data(resp)
 
+    async def aupdate(self, *args, **kwargs):
+        """
+        Coroutine version of ``update``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            self.update, *args, **kwargs
+        )
+
 
 class DeleteMixin(object):
     _primary_key = "id"
@@ -271,11 +475,17 @@ class DeleteMixin(object):
         primary_key = getattr(self, self._primary_key)
         client.delete_resource(self.construct_delete_url(), primary_key)
 
+    async def adelete(self, *args, **kwargs):
+        """
+        Coroutine version of ``delete``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            self.delete, *args, **kwargs
+        )
+
 
 class BatchMixin(object):
-    _list_key = (
-        "override_this"
-    )  # The field in the request schema in which to supply the list of objects
+    _list_key = "override_this"  # The field in the request schema in which to supply the list of objects
 
     @classmethod
     def construct_batch_url(cls, **kwargs):
@@ -305,11 +515,19 @@ class BatchCreateMixin(BatchMixin):
         data = cls.get_request_payload_from_instances(instances)
 
         response = client.create_resource(
-            resource_url=cls.construct_batch_url(**kwargs), data=data
+            resource_url=cls.construct_batch_url(**kwargs), data=data, compress=True
         )
 
-        for response_dict, original_instance in zip(response, instances):
-            original_instance.update_with_response_data(response_dict)
+        cls.update_instances_with_response_data(instances, response)
+
+    @classmethod
+    async def acreate_many(cls, *args, **kwargs):
+        """
+        Coroutine version of ``create_many``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            cls.create_many, *args, **kwargs
+        )
 
 
 class BatchUpdateMixin(BatchMixin):
@@ -323,11 +541,19 @@ class BatchUpdateMixin(BatchMixin):
         data = cls.get_request_payload_from_instances(instances)
 
         response = client.patch_resource(
-            resource_url=cls.construct_batch_url(**kwargs), data=data
+            resource_url=cls.construct_batch_url(**kwargs), data=data, compress=True
         )
 
-        for response_dict, original_instance in zip(response, instances):
-            original_instance.update_with_response_data(response_dict)
+        cls.update_instances_with_response_data(instances, response)
+
+    @classmethod
+    async def aupdate_many(cls, *args, **kwargs):
+        """
+        Coroutine version of ``update_many``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            cls.update_many, *args, **kwargs
+        )
 
 
 class BatchUpsertMixin(BatchMixin):
@@ -345,7 +571,7 @@ class BatchUpsertMixin(BatchMixin):
             data = cls.get_request_payload_from_instances(instance_chunk)
 
             response = client.put_resource(
-                resource_url=cls.construct_batch_url(**kwargs), data=data
+                resource_url=cls.construct_batch_url(**kwargs), data=data, compress=True
             )
 
             for successful_object in response["successes"]:
@@ -364,6 +590,15 @@ class BatchUpsertMixin(BatchMixin):
 
         return BatchResponse[cls](successes=successes, failures=failures)
 
+    @classmethod
+    async def aupsert_many(cls, *args, **kwargs):
+        """
+        Coroutine version of ``upsert_many``. Accepts the same arguments.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            cls.upsert_many, *args, **kwargs
+        )
+
     @classmethod
     def split_every(cls, n, iterable) -> list:
         try:
@@ -12,7 +12,7 @@ ROUND_TO = Decimal('0.01')
 DECIMAL_PLACES = 2
 
 
-@attr.s(frozen=True, cmp=False)
+@attr.s(frozen=True, cmp=False, slots=True)
 class Money:
     """Represents a USD currency value, encapsulates rounding logic and conversion to cents."""
 
@@ -60,7 +60,7 @@ class Money:
         return bool(self.dollars)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Salesperson:
     email: str = attr.ib(validator=attr.validators.instance_of(str))
     first_name: Optional[str] = attr.ib(
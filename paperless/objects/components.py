@@ -11,7 +11,7 @@ if TYPE_CHECKING:
     from paperless.objects.quotes import QuoteComponent
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class Material:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     display_name: Optional[str] = attr.ib(
@@ -22,9 +22,9 @@ class Material:
     name: str = attr.ib(validator=attr.validators.instance_of(str))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class BaseOperation:
-    @attr.s(frozen=True)
+    @attr.s(frozen=True, slots=True)
     class OperationQuantity:
         price: Optional[Money] = attr.ib(
             converter=optional_convert(Money),
@@ -71,7 +71,7 @@ class BaseOperation:
     )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class Process:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     external_name: Optional[str] = attr.ib(
@@ -80,7 +80,7 @@ class Process:
     name: str = attr.ib(validator=attr.validators.instance_of(str))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class SupportingFile:
     filename: str = attr.ib(validator=attr.validators.instance_of(str))
     url: Optional[str] = attr.ib(
@@ -92,7 +92,7 @@ class SupportingFile:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PurchasedComponentProperty:
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     code_name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -100,7 +100,7 @@ class PurchasedComponentProperty:
     value: Optional[Union[str, float, bool]] = attr.ib()
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PurchasedComponent:
     oem_part_number: str = attr.ib(validator=attr.validators.instance_of(str))
     piece_price: Money = attr.ib(
@@ -125,13 +125,13 @@ class PurchasedComponent:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class ChildComponent:
     child_id = attr.ib(validator=attr.validators.instance_of(int))
     quantity = attr.ib(validator=attr.validators.instance_of(int))
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class BaseComponent:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     child_ids: List[int] = attr.ib(converter=convert_iterable(int))
@@ -211,6 +211,8 @@ class AssemblyComponent(NamedTuple):
 class AssemblyMixin:
     """Add `iterate_assembly` method for use in OrderItems and QuoteItems."""
 
+    __slots__ = ()
+
     def iterate_assembly_with_duplicates(
         self
     ) -> Generator[AssemblyComponent, None, None]:
@@ -109,7 +109,9 @@ class BillingAddress(
         """
         client = PaperlessClient.get_instance()
         resource_list = cls.parse_list_response(
-            client.get_resource_list(cls.construct_list_url(account_id), params=params)
+            client.get_resource_list(
+                cls.construct_list_url(account_id), params=params, resource_type=cls
+            )
         )
         if cls._list_object_representation:
             return [
@@ -218,13 +220,29 @@ class Account(
         return 'accounts/public'
 
     @classmethod
-    def list(cls):
-        return AccountList.list()
+    def list(cls, fields=None):
+        return AccountList.list(fields=fields)
+
+    @classmethod
+    def iter_list(
+        cls, params=None, pages=None, cursor=None, page_size=None, fields=None
+    ):
+        return AccountList.iter_list(
+            params=params,
+            pages=pages,
+            cursor=cursor,
+            page_size=page_size,
+            fields=fields,
+        )
 
     @classmethod
     def filter(cls, erp_code=None):
         return AccountList.filter(erp_code=erp_code)
 
+    @classmethod
+    def filter_many(cls, erp_codes, workers=4):
+        return AccountList.filter_many(erp_codes, workers=workers)
+
     @classmethod
     def search(cls, search_term):
         return AccountList.search(search_term)
@@ -256,6 +274,15 @@ class AccountList(FromJSONMixin, PaginatedListMixin):
             params={'erp_code': erp_code, 'name': name, 'null_erp_code': null_erp_code}
         )
 
+    @classmethod
+    def filter_many(cls, erp_codes, workers=4):
+        """
+        Filters by each of several erp codes concurrently.
+
+        :return: dict mapping each erp code to its [AccountList]
+        """
+        return cls.list_many('erp_code', erp_codes, workers=workers)
+
     @classmethod
     def search(cls, search_term):
         return cls.list(params={'search': search_term})
@@ -364,13 +391,29 @@ class Contact(
         return 'contacts/public'
 
     @classmethod
-    def list(cls):
-        return ContactList.list()
+    def list(cls, fields=None):
+        return ContactList.list(fields=fields)
+
+    @classmethod
+    def iter_list(
+        cls, params=None, pages=None, cursor=None, page_size=None, fields=None
+    ):
+        return ContactList.iter_list(
+            params=params,
+            pages=pages,
+            cursor=cursor,
+            page_size=page_size,
+            fields=fields,
+        )
 
     @classmethod
     def filter(cls, account_id=None):
         return ContactList.filter(account_id=account_id)
 
+    @classmethod
+    def filter_many(cls, account_ids, workers=4):
+        return ContactList.filter_many(account_ids, workers=workers)
+
     @classmethod
     def search(cls, search_term):
         return ContactList.search(search_term)
@@ -406,6 +449,15 @@ class ContactList(FromJSONMixin, PaginatedListMixin):
             params['account_id'] = account_id
         return cls.list(params=params)
 
+    @classmethod
+    def filter_many(cls, account_ids, workers=4):
+        """
+        Filters by each of several account ids concurrently.
+
+        :return: dict mapping each account id to its [ContactList]
+        """
+        return cls.list_many('account_id', account_ids, workers=workers)
+
     @classmethod
     def search(cls, search_term):
         return cls.list(params={'search': search_term})
@@ -488,7 +540,9 @@ class Facility(
         """
         client = PaperlessClient.get_instance()
         resource_list = cls.parse_list_response(
-            client.get_resource_list(cls.construct_list_url(account_id), params=params)
+            client.get_resource_list(
+                cls.construct_list_url(account_id), params=params, resource_type=cls
+            )
         )
         if cls._list_object_representation:
             return [
@@ -510,6 +564,7 @@ class PaymentTerms(
     ListMixin,
 ):
     _json_encoder = PaymentTermsEncoder
+    _cache_ttl = 60 * 5
 
     period: int = attr.ib(validator=attr.validators.instance_of(int))
     erp_code: Optional[str] = attr.ib(
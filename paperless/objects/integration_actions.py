@@ -1,10 +1,10 @@
-import urllib.parse as urlparse
+from collections import OrderedDict, deque
 from typing import Optional, Union
-from urllib.parse import parse_qs
 
 import attr
 import dateutil.parser
 
+from paperless import pagination
 from paperless.api_mappers import BaseMapper
 from paperless.client import PaperlessClient
 from paperless.json_encoders.integration_actions import (
@@ -12,6 +12,7 @@ from paperless.json_encoders.integration_actions import (
     IntegrationActionErrorEncoder,
     ManagedIntegrationEncoder,
 )
+from paperless.local import LocalStorage
 from paperless.mixins import (
     BatchCreateMixin,
     BatchUpdateMixin,
@@ -161,39 +162,41 @@ class IntegrationAction(
         return results['results']
 
     @classmethod
-    def list(cls, managed_integration_uuid, params=None, pages=None):
+    def list(
+        cls,
+        managed_integration_uuid,
+        params=None,
+        pages=None,
+        prefetch=pagination.DEFAULT_PREFETCH,
+        cursor=None,
+    ):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
-        :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1), in ascending order
+        :param prefetch: number of pages to fetch ahead on a background thread while the current one is deserialized
+        :param cursor: a paperless.pagination.ListCursor to resume from, which is advanced as pages are loaded
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
+        responses = pagination.paginate(
+            client,
             cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
             params=params,
+            pages=pages,
+            cursor=cursor,
+            prefetch_pages=prefetch,
         )
-        resource_list = cls.parse_list_response(response)
-        while response['next'] is not None:
-            next_url = response['next']
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(
-                    managed_integration_uuid=managed_integration_uuid
-                ),
-                params=next_query_params,
-            )
-            resource_list.extend(cls.parse_list_response(response))
-        if cls._list_object_representation:
-            return [
+        return [
+            (
                 cls._list_object_representation.from_json(resource)
-                for resource in resource_list
-            ]
-        else:
-            return [cls.from_json(resource) for resource in resource_list]
+                if cls._list_object_representation
+                else cls.from_json(resource)
+            )
+            for response in responses
+            for resource in cls.parse_list_response(response)
+        ]
 
     @classmethod
     def construct_get_url(cls):
@@ -215,6 +218,40 @@ class IntegrationAction(
             params={'status': status, "type": type},
         )
 
+    @classmethod
+    def count(
+        cls,
+        managed_integration_uuid: uuid,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+    ):
+        """
+        Returns the number of integration actions matching the filters, requesting a single action rather than every page.
+        """
+        client = PaperlessClient.get_instance()
+        return pagination.count(
+            client,
+            cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
+            params={'status': status, "type": type},
+        )
+
+    @classmethod
+    def exists(
+        cls,
+        managed_integration_uuid: uuid,
+        status: Optional[str] = None,
+        type: Optional[str] = None,
+    ):
+        """
+        Returns whether any integration action matches the filters, requesting a single action rather than every page.
+        """
+        client = PaperlessClient.get_instance()
+        return pagination.exists(
+            client,
+            cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
+            params={'status': status, "type": type},
+        )
+
     @classmethod
     def get_first_record(
         cls,
@@ -226,14 +263,14 @@ class IntegrationAction(
         params = {'status': status, "type": type}
 
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
+        response = pagination.first_page(
+            client,
             cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
             params=params,
         )
         resource_list = cls.parse_list_response(response)
-        clean_list = [cls.from_json(resource) for resource in resource_list]
-        if len(clean_list) > 0:
-            return clean_list[0]
+        if len(resource_list) > 0:
+            return cls.from_json(resource_list[0])
         return None
 
     @classmethod
@@ -261,32 +298,28 @@ class IntegrationActionDefinition(FromJSONMixin, ToJSONMixin):
     )
 
     @classmethod
-    def list(cls, managed_integration_uuid, params=None, pages=None):
+    def list(cls, managed_integration_uuid, params=None, pages=None, cursor=None):
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
 
         :param params: dict of params for your list request
-        :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1), in ascending order
+        :param cursor: a paperless.pagination.ListCursor to resume from, which is advanced as pages are loaded
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
+        responses = pagination.paginate(
+            client,
             cls.construct_list_url(managed_integration_uuid=managed_integration_uuid),
             params=params,
+            pages=pages,
+            cursor=cursor,
         )
-        resource_list = cls.parse_list_response(response)
-        while response['next'] is not None:
-            next_url = response['next']
-            next_query_params = parse_qs(urlparse.urlparse(next_url).query)
-            if params is not None:
-                next_query_params = {**next_query_params, **params}
-            response = client.get_resource_list(
-                cls.construct_list_url(
-                    managed_integration_uuid=managed_integration_uuid
-                ),
-                params=next_query_params,
-            )
-            resource_list.extend(cls.parse_list_response(response))
+        resource_list = [
+            resource
+            for response in responses
+            for resource in cls.parse_list_response(response)
+        ]
         if cls._list_object_representation:
             return [
                 cls._list_object_representation.from_json(resource)
@@ -317,6 +350,7 @@ class IntegrationActionDefinition(FromJSONMixin, ToJSONMixin):
 class ManagedIntegration(FromJSONMixin, ToJSONMixin, ReadMixin, ListMixin, UpdateMixin):
     _primary_key = 'uuid'
     _json_encoder = ManagedIntegrationEncoder
+    _cache_ttl = 60 * 5
     erp_name = attr.ib(validator=attr.validators.instance_of(str))
     is_active: bool = attr.ib(validator=attr.validators.instance_of((bool, object)))
     erp_version: Optional[str] = attr.ib(
@@ -352,21 +386,83 @@ class ManagedIntegration(FromJSONMixin, ToJSONMixin, ReadMixin, ListMixin, Updat
         """
         Returns a list of (1) either the minimal representation of this resource as defined by _list_object_representation or (2) a list of this resource.
         :param params: dict of params for your list request
-        :param pages: iterable of ints describing the indices of the pages you want (starting from 1)
+        :param pages: iterable of ints describing the indices of the pages you want (starting from 1). The poll endpoint hands out each batch of events once and cannot seek, so this only limits polling to the highest page given.
         :return: [resource]
         """
         client = PaperlessClient.get_instance()
-        response = client.get_resource_list(
-            cls.construct_event_list_url(uuid), params=params
+        responses = pagination.paginate(
+            client,
+            cls.construct_event_list_url(uuid),
+            params=params,
+            pages=pages,
+            more_key='has_more_events',
         )
-        resource_list = response['results']
-        while response['has_more_events'] is True:
-            response = client.get_resource_list(
-                cls.construct_event_list_url(uuid), params=params
-            )
-            resource_list.extend(response['results'])
+        resource_list = [
+            resource for response in responses for resource in response['results']
+        ]
         return [Event.from_json(resource) for resource in resource_list]
 
+    @classmethod
+    def iter_events(cls, uuid, params=None, storage=None, dedupe_window=1000):
+        """
+        Yields the events of the managed integration as each poll returns them, so only one batch of events is held in memory at a time. The next batch is polled once the current one has been consumed. Events with the uuid of one of the last dedupe_window events are skipped.
+
+        :param params: dict of params for your poll request
+        :param storage: a paperless.local.LocalStorage, or the filename of one, to checkpoint to. Each batch is checkpointed when it arrives, and the position within it once iteration ends, including when the loop consuming the events raises and the generator is closed. Iterating again with the same storage then yields the rest of the interrupted batch, starting with the event being handled at the time. If the process dies without closing the generator, the interrupted batch is yielded again from its start.
+        :param dedupe_window: number of recent event uuids to remember
+        :return: iterator of Event
+        """
+        if isinstance(storage, str):
+            storage = LocalStorage.get_instance(storage)
+        # resolve the client now, not when iteration starts
+        client = PaperlessClient.get_instance()
+        responses = pagination.paginate(
+            client,
+            cls.construct_event_list_url(uuid),
+            params=params,
+            more_key='has_more_events',
+        )
+        return cls._iter_checkpointed_events(
+            responses,
+            storage,
+            'ManagedIntegration.iter_events:{}'.format(uuid),
+            dedupe_window,
+        )
+
+    @staticmethod
+    def _iter_checkpointed_events(responses, storage, checkpoint_name, dedupe_window):
+        checkpoint = storage.get_checkpoint(checkpoint_name) if storage else None
+        checkpoint = checkpoint or {'pending': [], 'seen': []}
+        # the events of the current batch that were not consumed yet
+        pending = deque(checkpoint['pending'])
+        seen = OrderedDict.fromkeys(checkpoint['seen'])
+
+        def save():
+            if storage is not None:
+                storage.save_checkpoint(
+                    checkpoint_name, {'pending': list(pending), 'seen': list(seen)}
+                )
+
+        try:
+            while True:
+                while pending:
+                    resource = pending[0]
+                    if resource['uuid'] not in seen:
+                        yield Event.from_json(resource)
+                        seen[resource['uuid']] = None
+                        if len(seen) > dedupe_window:
+                            seen.popitem(last=False)
+                    pending.popleft()
+                response = next(responses, None)
+                if response is None:
+                    return
+                # the poll endpoint hands out a batch only once
+                pending.extend(response['results'])
+                save()
+        finally:
+            # where the caller left off, or the end of the backlog
+            save()
+
 
 @attr.s(frozen=False)
 class IntegrationActionError(FromJSONMixin, ToJSONMixin, BatchCreateMixin):
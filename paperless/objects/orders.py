@@ -27,7 +27,7 @@ from .utils import convert_cls, convert_iterable, optional_convert
 DATE_FMT = '%Y-%m-%d'
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderCostingVariable:
     label: str = attr.ib(validator=attr.validators.instance_of(str))
     value = attr.ib()
@@ -40,23 +40,32 @@ class OrderCostingVariable:
     value_type: str = attr.ib(attr.validators.instance_of(str))
 
 
+def _costing_variables():
+    return attr.ib(converter=convert_iterable(OrderCostingVariable))
+
+
 @attr.s(frozen=True)
 class OrderCostingVariableMixin:
     """
     Mixin for order objects that have a costing_variables field (e.g. operations, add-ons, pricing items)
+
+    Like QuoteCostingVariableMixin, the mixin has no slots of its own and the
+    slotted classes using it declare costing_variables again.
     """
 
-    costing_variables: List[OrderCostingVariable] = attr.ib(
-        converter=convert_iterable(OrderCostingVariable)
-    )
+    __slots__ = ()
+
+    costing_variables: List[OrderCostingVariable] = _costing_variables()
 
     def get_variable(self, label) -> Optional[OrderCostingVariable]:
         """Return the value of the variable object with the specified label or None if that variable does not exist."""
         return {cv.label: cv for cv in self.costing_variables}.get(label, None)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderOperation(BaseOperation, OrderCostingVariableMixin):
+    costing_variables: List[OrderCostingVariable] = _costing_variables()
+
     def get_variable(self, label) -> Optional[Union[float, int, str, bool]]:
         """Return the value of the variable with the specified label or None if that variable does not exist."""
         variable = super().get_variable(label)
@@ -67,7 +76,7 @@ class OrderOperation(BaseOperation, OrderCostingVariableMixin):
         return {cv.label: cv for cv in self.costing_variables}.get(label, None)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderComponent(BaseComponent):
     deliver_quantity: int = attr.ib(validator=attr.validators.instance_of(int))
     make_quantity: int = attr.ib(validator=attr.validators.instance_of(int))
@@ -79,8 +88,9 @@ class OrderComponent(BaseComponent):
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderedAddOn(OrderCostingVariableMixin):
+    costing_variables: List[OrderCostingVariable] = _costing_variables()
     is_required: bool = attr.ib(validator=attr.validators.instance_of(bool))
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     notes: Optional[str] = attr.ib(
@@ -95,8 +105,9 @@ class OrderedAddOn(OrderCostingVariableMixin):
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderedPricingItem(OrderCostingVariableMixin):
+    costing_variables: List[OrderCostingVariable] = _costing_variables()
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     category: str = attr.ib(validator=attr.validators.instance_of(str))
     calculation_type: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -122,7 +133,7 @@ class OrderedPricingItem(OrderCostingVariableMixin):
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderItem(AssemblyMixin):
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     components: List[OrderComponent] = attr.ib(
@@ -201,7 +212,7 @@ class OrderItem(AssemblyMixin):
                 return component
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PaymentDetails:
     card_brand: Optional[str] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(str))
@@ -249,7 +260,7 @@ class PaymentDetails:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ShippingOption:
     customers_account_number: Optional[str] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(str))
@@ -321,14 +332,14 @@ class ShippingOption:
             )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ShipmentItem:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     order_item_id: int = attr.ib(validator=attr.validators.instance_of(int))
     quantity: int = attr.ib(validator=attr.validators.instance_of(int))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderShipment:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     pickup_recipient: Optional[str] = attr.ib(
@@ -347,7 +358,7 @@ class OrderShipment:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderCompany:
     id: Optional[int] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(int))
@@ -361,7 +372,7 @@ class OrderCompany:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderCustomer:
     id: Optional[int] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(int))
@@ -384,7 +395,7 @@ class OrderCustomer:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderAccount:
     id: Optional[int] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(int))
@@ -404,7 +415,7 @@ class OrderAccount:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class OrderContact:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     first_name: str = attr.ib(validator=attr.validators.instance_of(str))
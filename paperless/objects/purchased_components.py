@@ -31,6 +31,7 @@ class PurchasedComponentColumn(
     ListMixin,
 ):
     _json_encoder = PurchasedComponentColumnEncoder
+    _cache_ttl = 60 * 5
 
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     code_name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -160,3 +161,12 @@ class PurchasedComponent(
     @classmethod
     def search(cls, search_term):
         return cls.list(params={'search': search_term})
+
+    @classmethod
+    def search_many(cls, search_terms, workers=4):
+        """
+        Searches for each of several search terms concurrently.
+
+        :return: dict mapping each search term to its [PurchasedComponent]
+        """
+        return cls.list_many('search', search_terms, workers=workers)
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Union
 import attr
 
 from paperless.api_mappers.quotes import QuoteDetailsMapper
+from paperless.async_client import AsyncPaperlessClient
 from paperless.client import PaperlessClient
 from paperless.json_encoders.quotes import QuoteEncoder
 from paperless.mixins import (
@@ -24,12 +25,13 @@ from .utils import (
     convert_cls,
     convert_dictionary,
     convert_iterable,
+    decoding,
     numeric_validator,
     optional_convert,
 )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class CostingVariablePayload:
     value: Optional[Union[float, int, str, bool]] = attr.ib()
     # NOTE: row will only not be None if parent QuoteCostingVariable.variable_class == 'drop_down'
@@ -38,7 +40,7 @@ class CostingVariablePayload:
     options: Optional[List[Union[float, int, str]]] = attr.ib()
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class QuoteCostingVariable:
     value = attr.ib()
     label: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -50,15 +52,23 @@ class QuoteCostingVariable:
     value_type: str = attr.ib(attr.validators.instance_of(str))
 
 
+def _costing_variables():
+    return attr.ib(converter=convert_iterable(QuoteCostingVariable))
+
+
 @attr.s(frozen=True)
 class QuoteCostingVariableMixin:
     """
     Mixin for quote objects that have a costing_variables field (e.g. operations, add-ons, pricing items)
+
+    The mixin has no slots of its own, so that slotted classes can combine it
+    with BaseOperation. They declare costing_variables again to hold it in
+    their own slot.
     """
 
-    costing_variables: List[QuoteCostingVariable] = attr.ib(
-        converter=convert_iterable(QuoteCostingVariable)
-    )
+    __slots__ = ()
+
+    costing_variables: List[QuoteCostingVariable] = _costing_variables()
 
     def get_variable_for_qty(
         self, label: str, qty: int
@@ -72,8 +82,10 @@ class QuoteCostingVariableMixin:
         )
 
 
-@attr.s(frozen=True)
+@attr.s(frozen=True, slots=True)
 class QuoteOperation(BaseOperation, QuoteCostingVariableMixin):
+    costing_variables: List[QuoteCostingVariable] = _costing_variables()
+
     # TODO: deprecate this
     def get_variable(self, label):
         """Return the value of the variable with the specified label or None if
@@ -81,7 +93,7 @@ class QuoteOperation(BaseOperation, QuoteCostingVariableMixin):
         return {cv.label: cv.value for cv in self.costing_variables}.get(label, None)
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class AddOnQuantity:
     price: Optional[Money] = attr.ib(
         converter=optional_convert(Money),
@@ -94,8 +106,9 @@ class AddOnQuantity:
     quantity: int = attr.ib(validator=attr.validators.instance_of(int))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class AddOn(QuoteCostingVariableMixin):
+    costing_variables: List[QuoteCostingVariable] = _costing_variables()
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     is_required: bool = attr.ib(validator=attr.validators.instance_of(bool))
     name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -108,7 +121,7 @@ class AddOn(QuoteCostingVariableMixin):
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class DiscountQuantity:
     uuid: int = attr.ib(validator=attr.validators.instance_of(str))
     discount: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -127,8 +140,9 @@ class DiscountQuantity:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Discount(QuoteCostingVariableMixin):
+    costing_variables: List[QuoteCostingVariable] = _costing_variables()
     uuid: int = attr.ib(validator=attr.validators.instance_of(str))
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     notes: Optional[str] = attr.ib(
@@ -141,7 +155,7 @@ class Discount(QuoteCostingVariableMixin):
     discount_quantities: List[DiscountQuantity] = attr.ib(converter=convert_iterable(DiscountQuantity))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PricingItemQuantity:
     calculated_profit: Optional[Money] = attr.ib(
         converter=optional_convert(Money),
@@ -162,8 +176,9 @@ class PricingItemQuantity:
     quantity: int = attr.ib(validator=attr.validators.instance_of(int))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class PricingItem(QuoteCostingVariableMixin):
+    costing_variables: List[QuoteCostingVariable] = _costing_variables()
     name: str = attr.ib(validator=attr.validators.instance_of(str))
     uuid: int = attr.ib(validator=attr.validators.instance_of(str))
     category: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -176,7 +191,7 @@ class PricingItem(QuoteCostingVariableMixin):
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Expedite:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     lead_time: int = attr.ib(validator=attr.validators.instance_of(int))
@@ -189,7 +204,7 @@ class Expedite:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Quantity:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     quantity: int = attr.ib(validator=attr.validators.instance_of(int))
@@ -268,7 +283,7 @@ class Quantity:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class QuoteComponent(BaseComponent):
     add_ons: List[AddOn] = attr.ib(converter=convert_iterable(AddOn))
     discounts: List[Discount] = attr.ib(converter=convert_iterable(Discount))
@@ -282,7 +297,7 @@ class QuoteComponent(BaseComponent):
     quantities: List[Quantity] = attr.ib(converter=convert_iterable(Quantity))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Metrics:
     order_revenue_all_time: Money = attr.ib(
         converter=Money, validator=attr.validators.instance_of(Money)
@@ -296,7 +311,7 @@ class Metrics:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Company:
     id: Optional[int] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(int))
@@ -311,7 +326,7 @@ class Company:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Account:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     notes: Optional[str] = attr.ib(
@@ -323,7 +338,7 @@ class Account:
     )
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Customer:
     id: Optional[int] = attr.ib(
         validator=attr.validators.optional(attr.validators.instance_of(int))
@@ -337,7 +352,7 @@ class Customer:
     company: Company = attr.ib(converter=convert_cls(Company))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class Contact:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     first_name: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -355,7 +370,7 @@ class Contact:
     account: Account = attr.ib(converter=convert_cls(Account))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class QuoteItem(AssemblyMixin):
     NOT_STARTED = 'not_started'
     IN_PROGRESS = 'in_progress'
@@ -398,21 +413,21 @@ class QuoteItem(AssemblyMixin):
                 return component
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ParentQuote:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     number: int = attr.ib(validator=attr.validators.instance_of(int))
     status: str = attr.ib(validator=attr.validators.instance_of(str))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class ParentSupplierOrder:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     number: int = attr.ib(validator=attr.validators.instance_of(int))
     status: str = attr.ib(validator=attr.validators.instance_of(str))
 
 
-@attr.s(frozen=False)
+@attr.s(frozen=False, slots=True)
 class RequestForQuote:
     id: int = attr.ib(validator=attr.validators.instance_of(int))
     email: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -549,19 +564,33 @@ class Quote(
         return {'revision': revision}
 
     @classmethod
-    def get(cls, id, revision=None):
+    def get(cls, id, revision=None, validate=True, lazy=False):
         """
         Retrieves the resource specified by the id and revision.
         :raise PaperlessNotFoundException: Raised when the requested id 404s aka is not found.
         :param id: int
         :param revision: Optional[int]
+        :param validate: bool, False to trust the response and skip the attrs validators
+        :param lazy: bool, True to build the objects of nested lists only when they are accessed
         :return: resource
         """
         client = PaperlessClient.get_instance()
-        return cls.from_json(
-            client.get_resource(
-                cls.construct_get_url(), id, params=cls.construct_get_params(revision)
-            )
+        decode = decoding(cls.from_json, validate, lazy)
+        return client.get_resource_object(
+            cls.construct_get_url(),
+            id,
+            decode,
+            params=cls.construct_get_params(revision),
+            resource_type=cls,
+        )
+
+    @classmethod
+    async def aget(cls, id, revision=None, validate=True, lazy=False):
+        """
+        Coroutine version of ``get``.
+        """
+        return await AsyncPaperlessClient.get_instance().run(
+            cls.get, id, revision, validate, lazy
         )
 
     @classmethod
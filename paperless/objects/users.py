@@ -16,6 +16,7 @@ from paperless.mixins import (
 class User(FromJSONMixin, ToJSONMixin, ReadMixin, UpdateMixin, ListMixin):
     _primary_key = 'uuid'
     _json_encoder = UserEncoder
+    _cache_ttl = 60 * 5
 
     email: str = attr.ib(validator=attr.validators.instance_of(str))
     uuid: str = attr.ib(validator=attr.validators.instance_of(str))
@@ -1,3 +1,6 @@
+import contextlib
+import contextvars
+
 import attr
 
 NO_UPDATE = object()
@@ -5,26 +8,36 @@ NO_UPDATE = object()
 
 def convert_cls(cl):
     """If the attribute is an instance of cls and not None, pass, else try constructing."""
+    decode = None
 
     def converter(val):
+        nonlocal decode
         if val is None:
             return None
         elif isinstance(val, cl):
             return val
-        else:
-            return safe_init(cl, val)
+        if decode is None:
+            decode = get_decoder(cl)
+        return decode(val)
 
     return converter
 
 
 def convert_iterable(cl):
+    decode = None
+
     def converter(iterable):
+        nonlocal decode
+        if decode is None:
+            decode = get_decoder(cl)
+        if is_lazy() and attr.has(cl):
+            return LazyList(iterable, cl, decode)
         result = []
         for val in iterable:
             if isinstance(val, cl):
                 result.append(val)
             else:
-                result.append(safe_init(cl, val))
+                result.append(decode(val))
         return result
 
     return converter
@@ -45,13 +58,18 @@ def optional_convert(convert):
 
 
 def convert_dictionary(cl):
+    decode = None
+
     def converter(d):
+        nonlocal decode
+        if decode is None:
+            decode = get_decoder(cl)
         result = dict()
         for key, val in d.items():
             if isinstance(val, cl):
                 result[key] = val
             else:
-                result[key] = safe_init(cl, val)
+                result[key] = decode(val)
         return result
 
     return converter
@@ -84,12 +102,392 @@ def numeric_validator(instance, attribute, value):
 def safe_init(attrs_class, value_dict):
     """Safely instantiate an attrs class instance with protection against extra
     kwargs. This ensures forward compatibility with fields added in the API."""
+    return get_decoder(attrs_class)(value_dict)
+
+
+# whether payloads are trusted: None means the process-wide default applies
+_trusted = contextvars.ContextVar('paperless_trusted', default=None)
+_trusted_by_default = False
+
+
+def set_trusted_default(enabled):
+    """Trust the payloads decoded anywhere in the process, unless ``trusted``
+    says otherwise."""
+    global _trusted_by_default
+    _trusted_by_default = enabled
+
+
+def is_trusted():
+    trusted = _trusted.get()
+    return _trusted_by_default if trusted is None else trusted
+
+
+@contextlib.contextmanager
+def trusted(enabled=True):
+    """
+    Trust the payloads decoded within this block (in the current thread or
+    task), or with ``enabled=False`` distrust them despite the process-wide
+    default.
+
+    Objects built from a trusted payload by ``safe_init`` and ``from_json``
+    skip the attrs validators of their fields, while converters such as the
+    ones creating Money and Decimal values still run. Objects constructed
+    directly are always validated.
+    """
+    token = _trusted.set(enabled)
+    try:
+        yield
+    finally:
+        _trusted.reset(token)
+
+
+def construct(attrs_class, kwargs):
+    """Return ``attrs_class(**kwargs)``, built without running the validators
+    if payloads are trusted."""
+    if is_trusted():
+        return get_builder(attrs_class)(kwargs)
+    return attrs_class(**kwargs)
+
+
+def trusting(decode):
+    """Wrap ``decode`` so that the payloads it decodes are trusted."""
+
+    def decode_trusted(resource):
+        with trusted():
+            return decode(resource)
+
+    return decode_trusted
+
+
+# whether nested lists are decoded lazily
+_lazy = contextvars.ContextVar('paperless_lazy', default=False)
+
+
+def is_lazy():
+    return _lazy.get()
+
+
+@contextlib.contextmanager
+def lazy(enabled=True):
+    """
+    Decode the lists of objects nested in the payloads decoded within this
+    block (in the current thread or task) lazily, as ``LazyList``s.
+    """
+    token = _lazy.set(enabled)
+    try:
+        yield
+    finally:
+        _lazy.reset(token)
+
+
+def lazily(decode):
+    """Wrap ``decode`` so that the lists nested in what it decodes are lazy."""
+
+    def decode_lazily(resource):
+        with lazy():
+            return decode(resource)
+
+    return decode_lazily
+
+
+def decoding(decode, validate=True, lazy=False):
+    """
+    Return ``decode``, trusting its payloads unless ``validate`` and decoding
+    them lazily if ``lazy``.
+    """
+    if not validate:
+        decode = trusting(decode)
+    if lazy:
+        decode = lazily(decode)
+    return decode
+
+
+class LazyList(list):
+    """
+    A list of attrs objects that are only built when first accessed.
+
+    The list starts out holding the JSON dicts of its elements and replaces
+    each one with its object the first time it is read, by index or while
+    iterating. Elements are decoded as trusted or not as the list itself was,
+    and their own nested lists are lazy too. Comparing, searching, sorting,
+    printing or pickling the list builds all of its elements first.
+    """
+
+    __slots__ = ('_type', '_decode', '_trusted')
+
+    def __init__(self, iterable, item_type, decode):
+        super().__init__(iterable)
+        self._type = item_type
+        self._decode = decode
+        self._trusted = is_trusted()
+
+    def _load(self, index):
+        value = list.__getitem__(self, index)
+        if isinstance(value, self._type):
+            return value
+        lazy_token = _lazy.set(True)
+        trusted_token = _trusted.set(self._trusted)
+        try:
+            value = self._decode(value)
+        finally:
+            _trusted.reset(trusted_token)
+            _lazy.reset(lazy_token)
+        list.__setitem__(self, index, value)
+        return value
+
+    def _load_all(self):
+        for index in range(len(self)):
+            self._load(index)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._load(i) for i in range(*index.indices(len(self)))]
+        return self._load(index)
+
+    def __iter__(self):
+        index = 0
+        # like a list, follow elements appended while iterating
+        while index < len(self):
+            yield self._load(index)
+            index += 1
+
+    def __reversed__(self):
+        for index in range(len(self) - 1, -1, -1):
+            yield self._load(index)
+
+    def __repr__(self):
+        self._load_all()
+        return list.__repr__(self)
+
+    def __radd__(self, other):
+        if not isinstance(other, list):
+            return NotImplemented
+        return other + list(self)
+
+    def __reduce_ex__(self, protocol):
+        # pickle and copy as a plain list
+        return list, (list(self),)
+
+    def copy(self):
+        return list(self)
+
+    __copy__ = copy
+
+
+def _loading_all(method):
+    def load_all_first(self, *args, **kwargs):
+        self._load_all()
+        for arg in args:
+            if isinstance(arg, LazyList):
+                arg._load_all()
+        return method(self, *args, **kwargs)
+
+    load_all_first.__name__ = method.__name__
+    load_all_first.__doc__ = method.__doc__
+    return load_all_first
+
+
+for _name in (
+    '__contains__',
+    '__eq__',
+    '__ne__',
+    '__lt__',
+    '__le__',
+    '__gt__',
+    '__ge__',
+    '__add__',
+    '__mul__',
+    '__rmul__',
+    'count',
+    'index',
+    'pop',
+    'remove',
+    'sort',
+):
+    setattr(LazyList, _name, _loading_all(getattr(list, _name)))
+del _name
+
+
+# compiled decoders, builders, updaters and field names, by class
+_decoders = {}
+_builders = {}
+_updaters = {}
+_field_names = {}
+
+
+def get_decoder(attrs_class):
+    """Return the function ``safe_init`` uses to build ``attrs_class`` from a
+    dict, compiling it the first time the class is decoded."""
+    try:
+        return _decoders[attrs_class]
+    except KeyError:
+        return _decoders.setdefault(attrs_class, _compile_decoder(attrs_class))
+
+
+def _compile_decoder(attrs_class):
     if not attr.has(attrs_class):
-        return attrs_class(**value_dict)
-    safe_dict = {
-        attr.name: value_dict.get(attr.name) for attr in attr.fields(attrs_class)
+        return lambda value_dict: attrs_class(**value_dict)
+    # generate a call passing every field by name, as attrs generates __init__
+    names = get_field_names(attrs_class)
+    namespace = {'cls': attrs_class, 'is_trusted': is_trusted}
+    lines = ['def decode(value_dict):', '    get = value_dict.get']
+    if _has_plain_converters(attrs_class):
+        lines.append('    if is_trusted():')
+        # every field is passed, so none of the defaults of init fields applies
+        lines += [
+            '    ' + line
+            for line in _init_lines(
+                attrs_class, namespace, lambda a, default: 'get(%r)' % a.name
+            )
+        ]
+    lines.append('    return cls(%s)' % ', '.join('%s=get(%r)' % (n, n) for n in names))
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['decode']
+
+
+def get_builder(attrs_class):
+    """Return a function building ``attrs_class`` from a dict of arguments to
+    its ``__init__`` without running validators, compiling it the first time
+    it is needed."""
+    try:
+        return _builders[attrs_class]
+    except KeyError:
+        return _builders.setdefault(attrs_class, _compile_builder(attrs_class))
+
+
+def _compile_builder(attrs_class):
+    if not _has_plain_converters(attrs_class):
+        return lambda kwargs: attrs_class(**kwargs)
+    fields = attr.fields(attrs_class)
+    namespace = {
+        'cls': attrs_class,
+        'init_names': frozenset(a.name for a in fields if a.init),
+        'required': frozenset(
+            a.name for a in fields if a.init and a.default is attr.NOTHING
+        ),
+        'bad_arguments': _bad_arguments,
     }
-    return attrs_class(**safe_dict)
+    lines = [
+        'def build(kwargs):',
+        '    keys = kwargs.keys()',
+        '    if not (keys <= init_names and required <= keys):',
+        '        bad_arguments(cls, keys, init_names, required)',
+    ]
+
+    def argument(a, default):
+        if default is None:
+            return 'kwargs[%r]' % a.name
+        return 'kwargs[%r] if %r in kwargs else %s' % (a.name, a.name, default)
+
+    lines += _init_lines(attrs_class, namespace, argument)
+    exec('\n'.join(lines) + '\n', namespace)
+    return namespace['build']
+
+
+def _bad_arguments(attrs_class, keys, init_names, required):
+    unexpected = keys - init_names
+    if unexpected:
+        raise TypeError(
+            '{}() got unexpected arguments {}'.format(
+                attrs_class.__name__, sorted(unexpected)
+            )
+        )
+    raise TypeError(
+        '{}() missing arguments {}'.format(
+            attrs_class.__name__, sorted(required - keys)
+        )
+    )
+
+
+def _has_plain_converters(attrs_class):
+    # converters attrs wraps itself (such as attrs.Converter) are left to __init__
+    return all(
+        a.converter is None or callable(a.converter) for a in attr.fields(attrs_class)
+    )
+
+
+def _init_lines(attrs_class, namespace, argument):
+    """
+    Return the lines of code setting up an instance of ``attrs_class`` as its
+    ``__init__`` does, minus the validators, and returning it.
+    ``argument(attribute, default)`` gives the expression of the value passed
+    for an init field, ``default`` being the expression of its default or None
+    if it has none.
+    """
+    namespace['setattr'] = object.__setattr__
+    lines = [
+        '    self = cls.__new__(cls)',
+        # works for frozen and slotted classes alike
+        '    set = setattr.__get__(self)',
+    ]
+    for i, a in enumerate(attr.fields(attrs_class)):
+        if isinstance(a.default, attr.Factory):
+            namespace['factory_%d' % i] = a.default.factory
+            default = 'factory_%d(%s)' % (i, 'self' if a.default.takes_self else '')
+        elif a.default is not attr.NOTHING:
+            namespace['default_%d' % i] = a.default
+            default = 'default_%d' % i
+        else:
+            default = None
+        if a.init:
+            value = argument(a, default)
+        elif default is not None:
+            value = default
+        else:
+            continue
+        if a.converter is not None:
+            namespace['convert_%d' % i] = a.converter
+            value = 'convert_%d(%s)' % (i, value)
+        lines.append('    set(%r, %s)' % (a.name, value))
+    if hasattr(attrs_class, '__attrs_post_init__'):
+        lines.append('    self.__attrs_post_init__()')
+    lines.append('    return self')
+    return lines
+
+
+def get_updater(attrs_class):
+    """
+    Return a function ``update(instance, values)`` setting the fields of an
+    ``attrs_class`` instance found in the dict ``values``, converted and
+    validated as ``__init__`` would (validators are skipped for trusted
+    payloads). Fields missing from ``values`` are left alone.
+    """
+    try:
+        return _updaters[attrs_class]
+    except KeyError:
+        return _updaters.setdefault(attrs_class, _compile_updater(attrs_class))
+
+
+def _compile_updater(attrs_class):
+    fields = [a for a in attr.fields(attrs_class) if a.init]
+
+    def update(instance, values):
+        changes = []
+        for a in fields:
+            if a.name in values:
+                value = values[a.name]
+                if a.converter is not None:
+                    value = a.converter(value)
+                changes.append((a, value))
+        if not is_trusted():
+            # validate every field before changing any
+            for a, value in changes:
+                if a.validator is not None:
+                    a.validator(instance, a, value)
+        for a, value in changes:
+            setattr(instance, a.name, value)
+
+    return update
+
+
+def get_field_names(attrs_class):
+    """Return the frozenset of the field names of ``attrs_class``, computed
+    once per class."""
+    try:
+        return _field_names[attrs_class]
+    except KeyError:
+        names = frozenset(a.name for a in attr.fields(attrs_class))
+        return _field_names.setdefault(attrs_class, names)
 
 
 def get_metadata_filter_query_params(metadata: dict):
@@ -0,0 +1,513 @@
+"""The pagination engine behind every list call.
+
+List endpoints return one page at a time, along with either the URL of the
+next page or, for poll endpoints handing out a backlog, a flag saying whether
+there is more. ``paginate`` walks both kinds and is what ``list``,
+``iter_list`` and friends of all resources use, so they share these features:
+
+- pages are requested lazily, as the caller gets to them;
+- ``prefetch`` keeps a background thread up to ``depth`` pages ahead, so the
+  next request is in flight while the current page is turned into objects;
+- when a page reports the total ``count``, the remaining page numbers are
+  worked out from the first response and fetched concurrently;
+- a ``page_size`` is sent with every page, or grown by ``AdaptivePageSize``
+  while the API keeps answering quickly;
+- only selected pages can be fetched, and a ``ListCursor`` tracks the first
+  page the caller has not finished with yet. It can be saved and passed back
+  in to carry on after a crash::
+
+    cursor = ListCursor.from_dict(saved) if saved else ListCursor()
+    for account in Account.iter_list(cursor=cursor):
+        reconcile(account)
+        saved = cursor.to_dict()
+
+Every page is requested through a ``fetch(list_url, params)`` callable, by
+default ``page_fetcher(client)``. Wrapping it is the place to add retries or
+instrumentation for a single listing; ``on_page`` is told about every page as
+the caller receives it.
+"""
+
+import contextvars
+import itertools
+import math
+import queue
+import threading
+import urllib.parse as urlparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import parse_qs
+
+import attr
+
+from .exceptions import PaperlessNotFoundException
+from .retry import SYSTEM_CLOCK
+
+# pages fetched ahead by default when a whole list is loaded
+DEFAULT_PREFETCH = 1
+
+# query parameter setting the number of objects per page
+PAGE_SIZE_PARAM = 'page_size'
+
+_ITEM = 'item'
+_ERROR = 'error'
+_DONE = 'done'
+
+
+def page_fetcher(client, resource_type=None):
+    """
+    Return a ``fetch(list_url, params)`` callable requesting one page with
+    ``client``.
+    """
+
+    def fetch(list_url, params):
+        return client.get_resource_list(
+            list_url, params=params, resource_type=resource_type
+        )
+
+    return fetch
+
+
+def iter_pages(client, list_url, params=None, resource_type=None):
+    """
+    Yield the JSON of each page of ``list_url``. The query of each ``next``
+    link is combined with ``params``, so filters apply to every page.
+    """
+    yield from _iter_linked(page_fetcher(client, resource_type), list_url, params)
+
+
+def _iter_linked(fetch, list_url, params):
+    response = fetch(list_url, params)
+    yield response
+    yield from _follow(fetch, list_url, params, response.get("next"))
+
+
+def _follow(fetch, list_url, params, next_url):
+    while next_url is not None:
+        response = fetch(list_url, _next_params(next_url, params))
+        next_url = response.get("next")
+        yield response
+
+
+def _next_params(next_url, params, page=None):
+    page_params = parse_qs(urlparse.urlparse(next_url).query)
+    if params is not None:
+        # a page in params only selects the first page, the link picks the rest
+        page_params.update((k, v) for k, v in params.items() if k != 'page')
+    if page is not None:
+        page_params['page'] = [str(page)]
+    return page_params
+
+
+def _page_numbers(response):
+    """
+    Return the numbers of the pages after ``response``, or None if they
+    cannot be worked out because the count or page number is missing.
+    """
+    try:
+        count = int(response["count"])
+        page_size = len(response["results"])
+        next_page = int(parse_qs(urlparse.urlparse(response["next"]).query)['page'][0])
+    except (KeyError, IndexError, TypeError, ValueError):
+        return None
+    if not page_size:
+        return None
+    return range(next_page, math.ceil(count / page_size) + 1)
+
+
+def iter_pages_parallel(client, list_url, params=None, resource_type=None, workers=4):
+    """
+    Yield the JSON of each page of ``list_url`` in order, like ``iter_pages``,
+    but fetch the pages after the first with up to ``workers`` concurrent
+    requests, at most ``workers`` pages ahead of the caller. The page numbers
+    are derived from the ``count`` and the page size of the first response;
+    without them the ``next`` links are followed one at a time. Should the
+    list grow meanwhile, the pages past the original count are followed
+    sequentially as well.
+    """
+    yield from _iter_parallel(
+        page_fetcher(client, resource_type), list_url, params, workers
+    )
+
+
+def _iter_parallel(fetch, list_url, params, workers):
+    response = fetch(list_url, params)
+    yield response
+    next_url = response.get("next")
+    page_numbers = _page_numbers(response) if next_url is not None else None
+    if not page_numbers:
+        yield from _follow(fetch, list_url, params, next_url)
+        return
+
+    def fetch_page(page):
+        return fetch(list_url, _next_params(next_url, params, page=page))
+
+    page_numbers = iter(page_numbers)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+
+        def submit(pages):
+            futures.extend(
+                pool.submit(contextvars.copy_context().run, fetch_page, page)
+                for page in pages
+            )
+
+        futures = deque()
+        submit(itertools.islice(page_numbers, workers))
+        try:
+            while futures:
+                try:
+                    response = futures.popleft().result()
+                except PaperlessNotFoundException:
+                    # the list shrank since the first page was fetched
+                    return
+                # keep workers pages in flight while the caller has this one
+                submit(itertools.islice(page_numbers, 1))
+                yield response
+        finally:
+            for future in futures:
+                future.cancel()
+    yield from _follow(fetch, list_url, params, response.get("next"))
+
+
+class AdaptivePageSize:
+    """
+    Lets ``paginate`` choose the page size: starting from ``initial``, the
+    size is doubled after every page that took less than ``target`` seconds,
+    up to ``maximum``, and halved after one that took longer, down to
+    ``minimum``. Fewer, larger pages mean fewer round trips as long as the API
+    can produce them quickly.
+
+    Page numbers depend on the page size, so the size only changes where the
+    objects read so far fill a whole number of pages of the new size. If the
+    API returns fewer objects than asked for, it caps the page size, and the
+    size is kept within that cap from then on.
+    """
+
+    def __init__(self, initial=100, maximum=1000, minimum=25, target=1.0, clock=None):
+        self.initial = initial
+        self.maximum = maximum
+        self.minimum = minimum
+        self.target = target
+        self.clock = clock or SYSTEM_CLOCK
+
+    def resize(self, size, elapsed, offset):
+        """Return the size of the page starting at object ``offset``."""
+        if elapsed < self.target:
+            if size * 2 <= self.maximum and offset % (size * 2) == 0:
+                return size * 2
+        elif elapsed > self.target:
+            if size % 2 == 0 and size // 2 >= self.minimum:
+                return size // 2
+        return size
+
+
+def _aligned_size(offset, maximum):
+    """Return the largest page size up to ``maximum`` with a page starting
+    at object ``offset``."""
+    return next(size for size in range(maximum, 0, -1) if offset % size == 0)
+
+
+def _iter_adaptive(fetch, list_url, params, page_size):
+    size = page_size.initial
+    maximum = page_size.maximum
+    offset = 0
+    while True:
+        page = offset // size + 1
+        start = page_size.clock.time()
+        response = fetch(
+            list_url, {**(params or {}), 'page': page, PAGE_SIZE_PARAM: size}
+        )
+        elapsed = page_size.clock.time() - start
+        results = response["results"]
+        next_url = response.get("next")
+        if next_url is not None and 0 < len(results) < size:
+            # the API caps the page size and numbers the pages by its own size
+            maximum = len(results)
+            if (page - 1) * maximum != offset:
+                size = _aligned_size(offset, maximum)
+                continue
+            size = maximum
+        yield response
+        if next_url is None:
+            return
+        offset += size
+        new_size = page_size.resize(size, elapsed, offset)
+        if new_size <= maximum:
+            size = new_size
+
+
+def first_page(client, list_url, params=None, resource_type=None):
+    """
+    Return the JSON of a page of ``list_url`` holding at most one object,
+    which is enough to learn the total ``count`` or whether there are any.
+    """
+    return client.get_resource_list(
+        list_url,
+        params={**(params or {}), PAGE_SIZE_PARAM: 1},
+        resource_type=resource_type,
+    )
+
+
+def count(client, list_url, params=None, resource_type=None):
+    """
+    Return the number of objects in ``list_url``. Only a page of one object
+    is requested, unless the response has no ``count``; then the results of
+    all pages are counted.
+    """
+    response = first_page(client, list_url, params, resource_type)
+    try:
+        return int(response["count"])
+    except (KeyError, TypeError, ValueError):
+        pass
+    return sum(
+        len(page["results"])
+        for page in iter_pages(client, list_url, params, resource_type)
+    )
+
+
+def exists(client, list_url, params=None, resource_type=None):
+    """Return whether ``list_url`` has any objects, from a page of one."""
+    return bool(first_page(client, list_url, params, resource_type)["results"])
+
+
+def map_concurrently(fn, items, workers=4):
+    """
+    Return ``{item: fn(item)}`` for each distinct item, calling ``fn`` on up
+    to ``workers`` threads. Each call runs in a copy of the caller's context,
+    so the active client carries over. The first error is raised once the
+    calls already running have finished; the others are cancelled.
+    """
+    items = list(dict.fromkeys(items))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, fn, item) for item in items
+        ]
+        try:
+            return {item: future.result() for item, future in zip(items, futures)}
+        finally:
+            for future in futures:
+                future.cancel()
+
+
+def iter_polls(
+    client, url, params=None, resource_type=None, more_key='has_more_events'
+):
+    """
+    Yield the JSON of each response of a poll endpoint, which hands out a
+    backlog one batch per request and sets ``more_key`` while there is more.
+    Every request is sent with the same ``params``.
+    """
+    yield from _iter_polled(page_fetcher(client, resource_type), url, params, more_key)
+
+
+def _iter_polled(fetch, url, params, more_key):
+    while True:
+        response = fetch(url, params)
+        yield response
+        if response.get(more_key) is not True:
+            return
+
+
+@attr.s
+class ListCursor:
+    """
+    Where a paginated listing got to.
+
+    :param page: the first page that has not been completely consumed, where
+    a resumed listing starts
+    :param done: whether the listing was consumed to the end
+    """
+
+    page = attr.ib(default=1)
+    done = attr.ib(default=False)
+
+    def to_dict(self):
+        """Return the cursor as a JSON serializable dict."""
+        return {'page': self.page, 'done': self.done}
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(page=int(data['page']), done=bool(data['done']))
+
+
+def iter_selected_pages(client, list_url, pages, params=None, resource_type=None):
+    """
+    Yield ``(page number, JSON)`` for each of ``pages`` (numbered from 1) of
+    ``list_url``. Pages are expected in ascending order and the iteration
+    ends at the first one past the end of the list, so an unbounded iterable
+    such as ``itertools.count(k)`` reads from page ``k`` to the end.
+    """
+    yield from _iter_selected(
+        page_fetcher(client, resource_type), list_url, pages, params
+    )
+
+
+def _iter_selected(fetch, list_url, pages, params):
+    last_page = None
+    for page in pages:
+        if last_page is not None and page > last_page:
+            return
+        try:
+            response = fetch(list_url, {**(params or {}), 'page': page})
+        except PaperlessNotFoundException:
+            # asking for a page past the end is an error for the API
+            return
+        if response.get("next") is None:
+            # the last page, handed out even when empty so a cursor is done
+            last_page = page
+        yield page, response
+
+
+def _track(numbered_pages, cursor, on_page):
+    for page, response in numbered_pages:
+        if on_page is not None:
+            on_page(page, response)
+        yield response
+        # the caller asked for more, so it is done with this page
+        cursor.page = page + 1
+        # a selection of pages can run out before the list does
+        if response.get("next") is None:
+            cursor.done = True
+
+
+def paginate(
+    client,
+    list_url,
+    params=None,
+    resource_type=None,
+    pages=None,
+    cursor=None,
+    prefetch_pages=0,
+    workers=0,
+    more_key=None,
+    fetch=None,
+    on_page=None,
+    page_size=None,
+):
+    """
+    Return an iterator over the JSON of the pages of ``list_url``.
+
+    :param pages: iterable of page numbers (starting from 1) to fetch, in
+    ascending order; by default every page is fetched
+    :param cursor: a ``ListCursor`` to start from and keep up to date. A
+    cursor that is ``done`` yields nothing.
+    :param prefetch_pages: number of pages to fetch ahead on a background
+    thread
+    :param workers: if set, fetch all pages after the first with this many
+    concurrent requests, see ``iter_pages_parallel``. Ignored when ``pages``
+    is given.
+    :param more_key: for poll endpoints, the key of the flag saying whether
+    there is more, see ``iter_polls``. A poll endpoint cannot seek, so
+    ``pages`` only limits the number of polls to the highest page given,
+    and ``cursor`` is not supported.
+    :param fetch: callable ``fetch(list_url, params)`` returning the JSON of
+    a page, used instead of ``page_fetcher(client, resource_type)``
+    :param on_page: callable ``on_page(page_number, response)``, called as
+    each page is handed to the caller
+    :param page_size: number of objects per page to ask for, or an
+    ``AdaptivePageSize``. An adaptive size cannot be combined with ``pages``,
+    ``cursor`` or ``workers``, which count pages of a fixed size.
+    """
+    if fetch is None:
+        fetch = page_fetcher(client, resource_type)
+    if isinstance(page_size, AdaptivePageSize):
+        if pages is not None or cursor is not None or workers:
+            raise ValueError(
+                'An adaptive page size cannot be used with pages, cursor or workers'
+            )
+        numbered = enumerate(_iter_adaptive(fetch, list_url, params, page_size), 1)
+        return _track(prefetch(numbered, prefetch_pages), ListCursor(), on_page)
+    if page_size is not None:
+        params = {**(params or {}), PAGE_SIZE_PARAM: page_size}
+    if more_key is not None:
+        if cursor is not None:
+            raise ValueError('A poll endpoint cannot be resumed with a cursor')
+        numbered = enumerate(_iter_polled(fetch, list_url, params, more_key), 1)
+        if pages is not None:
+            numbered = itertools.islice(numbered, max(pages, default=0))
+        return _track(prefetch(numbered, prefetch_pages), ListCursor(), on_page)
+
+    if cursor is None:
+        cursor = ListCursor()
+    elif cursor.done:
+        return iter(())
+    if pages is not None:
+        numbered = _iter_selected(
+            fetch,
+            list_url,
+            (page for page in pages if page >= cursor.page),
+            params,
+        )
+    else:
+        params = dict(params or {})
+        if cursor.page > 1:
+            params['page'] = cursor.page
+        first_page = int(params.get('page', 1))
+        if not params:
+            params = None
+        if workers:
+            responses = _iter_parallel(fetch, list_url, params, workers)
+        else:
+            responses = _iter_linked(fetch, list_url, params)
+        numbered = enumerate(responses, start=first_page)
+    if not workers or pages is not None:
+        numbered = prefetch(numbered, prefetch_pages)
+    return _track(numbered, cursor, on_page)
+
+
+def prefetch(iterable, depth=DEFAULT_PREFETCH):
+    """
+    Return an iterator over ``iterable`` that is advanced on a background
+    thread, up to ``depth`` items ahead of the caller. Exceptions are raised
+    to the caller in order. With a ``depth`` of 0 ``iterable`` is returned as
+    an iterator, unchanged.
+
+    The thread starts on the first ``next()`` and stops once the returned
+    iterator is exhausted, closed or garbage collected.
+    """
+    if not depth or depth < 1:
+        return iter(iterable)
+    return _prefetch(iter(iterable), depth)
+
+
+def _prefetch(iterator, depth):
+    items = queue.Queue()
+    # one slot per item fetched ahead, taken before the item is fetched and
+    # given back once the caller has it
+    slots = threading.Semaphore(depth)
+    stopped = threading.Event()
+
+    def acquire():
+        # give up once the consumer went away instead of blocking forever
+        while not stopped.is_set():
+            if slots.acquire(timeout=0.1):
+                return True
+        return False
+
+    def produce():
+        try:
+            while acquire():
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    items.put((_DONE, None))
+                    return
+                items.put((_ITEM, item))
+        except BaseException as e:
+            items.put((_ERROR, e))
+
+    context = contextvars.copy_context()
+    thread = threading.Thread(
+        target=context.run, args=(produce,), name='paperless-prefetch', daemon=True
+    )
+    thread.start()
+    try:
+        while True:
+            kind, value = items.get()
+            if kind == _DONE:
+                return
+            if kind == _ERROR:
+                raise value
+            slots.release()
+            yield value
+    finally:
+        stopped.set()
@@ -0,0 +1,248 @@
+"""Client side rate limiting.
+
+The Paperless Parts API throttles clients that send too many requests with a
+429 response. Instead of finding out about the limit that way, a
+``RateLimiter`` can be given to ``PaperlessClient`` to space requests out ahead
+of time, so throughput stays just under the limit.
+"""
+
+import sqlite3
+import threading
+
+from .retry import SYSTEM_CLOCK, WallClock
+
+
+class TokenBucket:
+    """
+    Token bucket shared by the threads of one process. Tokens accumulate at
+    ``rate`` per second up to ``burst``; each request takes one token and waits
+    if none is left.
+    """
+
+    def __init__(self, rate, burst, clock=None):
+        self.clock = clock or SYSTEM_CLOCK
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._tokens = float(burst)
+        self._updated = self.clock.time()
+        self._blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        if now > self._updated:
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+
+    def _try_take(self):
+        """Take a token and return 0, or return the seconds to wait."""
+        with self._lock:
+            now = self.clock.time()
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self):
+        """Block until a token is available and take it. Returns the number of
+        seconds spent waiting."""
+        waited = 0.0
+        wait = self._try_take()
+        while wait > 0:
+            self.clock.sleep(wait)
+            waited += wait
+            wait = self._try_take()
+        return waited
+
+    def get_rate(self):
+        return self.rate
+
+    def set_rate(self, rate):
+        with self._lock:
+            self._refill(self.clock.time())
+            self.rate = float(rate)
+
+    def pause(self, seconds):
+        """Hold back all requests for ``seconds`` and empty the bucket."""
+        with self._lock:
+            now = self.clock.time()
+            self._blocked_until = max(self._blocked_until, now + seconds)
+            self._tokens = 0.0
+            self._updated = max(now, self._blocked_until)
+
+
+class SQLiteTokenBucket:
+    """
+    Token bucket stored in a SQLite database, so that several processes on the
+    same machine can share one limit. Every acquisition runs in an immediate
+    transaction, which SQLite serializes across connections. The learned rate is
+    stored with the bucket and shared as well.
+    """
+
+    def __init__(self, path, name, rate, burst, clock=None, timeout=30.0):
+        self.path = path
+        self.name = name
+        self.burst = float(burst)
+        self.clock = clock or WallClock()
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            path, timeout=timeout, isolation_level=None, check_same_thread=False
+        )
+        with self._lock:
+            self._conn.execute(
+                'CREATE TABLE IF NOT EXISTS token_buckets ('
+                'name TEXT PRIMARY KEY, tokens REAL, updated REAL, '
+                'blocked_until REAL, rate REAL)'
+            )
+            self._conn.execute(
+                'INSERT OR IGNORE INTO token_buckets VALUES (?, ?, ?, ?, ?)',
+                (name, self.burst, self.clock.time(), 0.0, float(rate)),
+            )
+
+    def _transaction(self, update):
+        """Run ``update(tokens, updated, blocked_until, rate, now)`` on the
+        stored state in one transaction. ``update`` returns the new state and a
+        result value."""
+        with self._lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                row = self._conn.execute(
+                    'SELECT tokens, updated, blocked_until, rate '
+                    'FROM token_buckets WHERE name = ?',
+                    (self.name,),
+                ).fetchone()
+                state, result = update(*row, self.clock.time())
+                self._conn.execute(
+                    'UPDATE token_buckets SET tokens = ?, updated = ?, '
+                    'blocked_until = ?, rate = ? WHERE name = ?',
+                    (*state, self.name),
+                )
+                self._conn.execute('COMMIT')
+            except BaseException:
+                self._conn.execute('ROLLBACK')
+                raise
+        return result
+
+    def _take(self, tokens, updated, blocked_until, rate, now):
+        if now < blocked_until:
+            return (tokens, updated, blocked_until, rate), blocked_until - now
+        if now > updated:
+            tokens = min(self.burst, tokens + (now - updated) * rate)
+            updated = now
+        if tokens >= 1:
+            return (tokens - 1, updated, blocked_until, rate), 0.0
+        return (tokens, updated, blocked_until, rate), (1 - tokens) / rate
+
+    def acquire(self):
+        waited = 0.0
+        wait = self._transaction(self._take)
+        while wait > 0:
+            self.clock.sleep(wait)
+            waited += wait
+            wait = self._transaction(self._take)
+        return waited
+
+    def get_rate(self):
+        with self._lock:
+            return self._conn.execute(
+                'SELECT rate FROM token_buckets WHERE name = ?', (self.name,)
+            ).fetchone()[0]
+
+    def set_rate(self, rate):
+        def update(tokens, updated, blocked_until, old_rate, now):
+            if now > updated:
+                tokens = min(self.burst, tokens + (now - updated) * old_rate)
+                updated = now
+            return (tokens, updated, blocked_until, float(rate)), None
+
+        self._transaction(update)
+
+    def pause(self, seconds):
+        def update(tokens, updated, blocked_until, rate, now):
+            blocked_until = max(blocked_until, now + seconds)
+            return (0.0, blocked_until, blocked_until, rate), None
+
+        self._transaction(update)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class RateLimiter:
+    """
+    Keeps one token bucket per key (the client's ``group_slug``), so every
+    supplier group gets its own limit.
+
+    The limiter adapts to the server: after a 429 it pauses the bucket for the
+    time the server asked for and multiplies the rate by ``decrease_factor``.
+    Every successful request then raises the rate again by
+    ``increase_fraction`` of the configured rate, until it is back at ``rate``.
+
+    :param rate: requests per second
+    :param burst: maximum number of requests sent back to back
+    :param path: optional SQLite database file used to share the buckets
+    between processes
+    :param min_rate: lower bound for the learned rate
+    """
+
+    DEFAULT_KEY = 'default'
+
+    def __init__(
+        self,
+        rate=100 / 60.0,
+        burst=10,
+        path=None,
+        min_rate=None,
+        decrease_factor=0.8,
+        increase_fraction=0.01,
+        clock=None,
+    ):
+        self.rate = float(rate)
+        self.burst = burst
+        self.path = path
+        self.min_rate = min_rate if min_rate is not None else self.rate / 10
+        self.decrease_factor = decrease_factor
+        self.increase_fraction = increase_fraction
+        self.clock = clock
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket(self, key=None):
+        """Return the bucket for ``key``, creating it on first use."""
+        key = key or self.DEFAULT_KEY
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    if self.path is not None:
+                        bucket = SQLiteTokenBucket(
+                            self.path, key, self.rate, self.burst, clock=self.clock
+                        )
+                    else:
+                        bucket = TokenBucket(self.rate, self.burst, clock=self.clock)
+                    self._buckets[key] = bucket
+        return bucket
+
+    def acquire(self, key=None):
+        """Wait until a request for ``key`` may be sent. Returns the number of
+        seconds spent waiting."""
+        return self.bucket(key).acquire()
+
+    def on_success(self, key=None):
+        bucket = self.bucket(key)
+        rate = bucket.get_rate()
+        if rate < self.rate:
+            bucket.set_rate(min(self.rate, rate + self.rate * self.increase_fraction))
+
+    def on_throttled(self, key=None, retry_after=None):
+        """Slow down after the server answered with a 429."""
+        bucket = self.bucket(key)
+        bucket.set_rate(max(self.min_rate, bucket.get_rate() * self.decrease_factor))
+        if retry_after:
+            bucket.pause(retry_after)
@@ -0,0 +1,214 @@
+"""Retry handling for requests made by ``PaperlessClient``.
+
+A ``RetryPolicy`` decides whether a failed attempt is retried and how long to
+wait before the next one. Waiting goes through a ``Clock`` so that tests can
+substitute a fake one and never actually sleep.
+"""
+
+import email.utils
+import logging
+import random
+import re
+import threading
+import time
+from collections import deque
+
+import requests
+
+LOGGER = logging.getLogger(__name__)
+
+
+class Clock:
+    """Source of time for retries and rate limiting."""
+
+    def time(self):
+        """Seconds on a monotonic clock."""
+        return time.monotonic()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+
+SYSTEM_CLOCK = Clock()
+
+
+class WallClock(Clock):
+    """A clock based on wall time, which is comparable between processes."""
+
+    def time(self):
+        return time.time()
+
+
+class RetryBudget:
+    """Caps the number of retries a client may perform within a rolling window
+    of ``period`` seconds, across all calls and threads. This keeps a struggling
+    API from being flooded with retries by many workers at once."""
+
+    def __init__(self, max_retries=60, period=60.0, clock=None):
+        self.max_retries = max_retries
+        self.period = period
+        self.clock = clock or SYSTEM_CLOCK
+        self._retries = deque()
+        self._lock = threading.Lock()
+
+    def try_acquire(self):
+        """Record a retry and return True, or return False if the budget is
+        spent."""
+        with self._lock:
+            now = self.clock.time()
+            while self._retries and self._retries[0] <= now - self.period:
+                self._retries.popleft()
+            if len(self._retries) >= self.max_retries:
+                return False
+            self._retries.append(now)
+            return True
+
+
+class RetryPolicy:
+    """
+    Decides which failures are retried and how long to wait in between.
+
+    * 429 responses are always retried. The server rejected the request before
+      doing any work, so this is safe even for POST and PATCH. The wait honors
+      the ``Retry-After`` header or the wait time given in the response body.
+    * Other status codes in ``retry_status_codes`` (502, 503 and 504 by
+      default) and connection errors are retried only for methods in
+      ``retry_methods``, which defaults to the idempotent HTTP methods. A POST
+      that timed out might have been applied, so it is not sent again.
+    * Waits grow exponentially from ``backoff_base`` up to ``backoff_max``
+      seconds. With ``jitter`` each wait is drawn uniformly from zero to that
+      value, which spreads out workers that failed at the same moment.
+    * A single call makes at most ``max_attempts`` attempts and sleeps at most
+      ``max_total_delay`` seconds in total. An optional ``budget`` limits the
+      retries made by the whole client.
+    """
+
+    IDEMPOTENT_METHODS = frozenset({'get', 'head', 'options', 'put', 'delete'})
+    RETRY_STATUS_CODES = frozenset({502, 503, 504})
+    THROTTLED = 429
+
+    def __init__(
+        self,
+        max_attempts=6,
+        backoff_base=1.0,
+        backoff_max=60.0,
+        jitter=True,
+        max_total_delay=None,
+        retry_status_codes=RETRY_STATUS_CODES,
+        retry_methods=IDEMPOTENT_METHODS,
+        retry_on_connection_errors=True,
+        budget=None,
+        clock=None,
+        random=random.random,
+    ):
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_total_delay = max_total_delay
+        self.retry_status_codes = frozenset(retry_status_codes)
+        self.retry_methods = frozenset(m.lower() for m in retry_methods)
+        self.retry_on_connection_errors = retry_on_connection_errors
+        self.budget = budget
+        self.clock = clock or SYSTEM_CLOCK
+        self.random = random
+
+    def is_retryable(self, method, response=None, exception=None):
+        """Whether the failure is of a kind that may be retried, regardless
+        of the attempts made so far."""
+        idempotent = method.lower() in self.retry_methods
+        if exception is not None:
+            return (
+                self.retry_on_connection_errors
+                and idempotent
+                and isinstance(exception, (requests.ConnectionError, requests.Timeout))
+            )
+        if response.status_code == self.THROTTLED:
+            return True
+        return response.status_code in self.retry_status_codes and idempotent
+
+    def backoff(self, attempt):
+        """Wait before retry number ``attempt`` (starting at 0) when the
+        server gave no hint."""
+        delay = min(self.backoff_max, self.backoff_base * (2**attempt))
+        if self.jitter:
+            delay = delay * self.random()
+        return delay
+
+    def get_delay(self, attempt, response=None):
+        if response is not None:
+            retry_after = get_retry_after(response)
+            if retry_after is not None:
+                return retry_after
+        return self.backoff(attempt)
+
+    def sleep(self, seconds):
+        self.clock.sleep(seconds)
+
+    def start(self):
+        """Return the retry state for a new call."""
+        return RetryState(self)
+
+
+class RetryState:
+    """Tracks attempts and time slept for one call under a ``RetryPolicy``."""
+
+    def __init__(self, policy):
+        self.policy = policy
+        self.attempt = 0
+        self.total_delay = 0.0
+
+    def next_delay(self, method, response=None, exception=None):
+        """
+        Return the number of seconds to wait before retrying, or None if the
+        call must not be retried.
+        """
+        policy = self.policy
+        if self.attempt + 1 >= policy.max_attempts:
+            return None
+        if not policy.is_retryable(method, response=response, exception=exception):
+            return None
+        delay = policy.get_delay(self.attempt, response=response)
+        if (
+            policy.max_total_delay is not None
+            and self.total_delay + delay > policy.max_total_delay
+        ):
+            return None
+        if policy.budget is not None and not policy.budget.try_acquire():
+            LOGGER.warning('Retry budget exhausted, not retrying')
+            return None
+        self.attempt += 1
+        self.total_delay += delay
+        return delay
+
+
+_WAIT_MESSAGE_RE = re.compile(r'in (\d+) second')
+
+
+def get_retry_after(response):
+    """
+    Return the number of seconds the server asked us to wait, taken from the
+    ``Retry-After`` header or, for throttled requests, from a message such as
+    "Request was throttled. Expected available in 12 seconds." in the body.
+    Returns None if the response gives no hint.
+    """
+    header = response.headers.get('Retry-After')
+    if header:
+        try:
+            return max(0.0, float(header))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(header)
+            return max(0.0, retry_at.timestamp() - time.time())
+        except (TypeError, ValueError, IndexError):
+            pass
+    if response.status_code == RetryPolicy.THROTTLED:
+        try:
+            message = response.json().get('message')
+            match = _WAIT_MESSAGE_RE.search(message)
+        except (TypeError, AttributeError, ValueError):
+            match = None
+        if match:
+            return float(match.group(1)) + 1
+    return None
@@ -0,0 +1,225 @@
+"""Transports carry the requests of a ``PaperlessClient`` to the API.
+
+The client builds each request (URL, headers, body, retries) and hands it to
+its transport, which returns a ``requests.Response``. By default this is an
+``HTTPTransport`` sending over the client's pooled session. Other transports
+record and replay traffic, or answer from memory, see
+``paperless.fake_server.FakePaperlessServer``.
+
+``AsyncPaperlessClient`` runs the client on worker threads, so whatever
+transport the client uses serves coroutine calls as well.
+"""
+
+import base64
+import json
+import threading
+from collections import defaultdict, deque
+from urllib.parse import urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .exceptions import PaperlessException
+
+
+class Transport:
+    """Interface every transport implements."""
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+        timeout=None,
+        stream=False,
+    ):
+        """
+        Send one request and return the ``requests.Response``. Connection
+        problems are raised as ``requests.ConnectionError`` or
+        ``requests.Timeout`` so the client's retry policy can handle them.
+        """
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class HTTPTransport(Transport):
+    """
+    Sends requests over HTTP.
+
+    :param get_session: callable returning the ``requests.Session`` to use;
+    ``PaperlessClient`` passes its ``get_session`` so the connection pool is
+    shared
+    """
+
+    def __init__(self, get_session):
+        self.get_session = get_session
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+        timeout=None,
+        stream=False,
+    ):
+        return self.get_session().request(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+
+
+def make_response(status_code, body=b'', headers=None, url=None):
+    """
+    Build a ``requests.Response`` whose content is already read, as
+    transports that do not talk HTTP return.
+
+    :param body: bytes, or any other value to be encoded as JSON
+    """
+    if not isinstance(body, bytes):
+        body = json.dumps(body).encode('utf-8')
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response.headers.setdefault('Content-Type', 'application/json')
+    response.headers['Content-Length'] = str(len(body))
+    response.encoding = 'utf-8'
+    response.url = url
+    response._content = body
+    response._content_consumed = True
+    return response
+
+
+def request_key(method, url, params=None):
+    """Identify a request by method, URL path and query parameters."""
+    return (
+        method.lower(),
+        urlsplit(url).path.strip('/'),
+        json.dumps(params, sort_keys=True, default=str),
+    )
+
+
+class RecordingTransport(Transport):
+    """
+    Passes requests on to ``transport`` and records every exchange, for
+    replaying them later with ``ReplayTransport``::
+
+        recorder = RecordingTransport(HTTPTransport(client.get_session))
+        client.transport = recorder
+        run_sync_job()
+        recorder.save('sync_job.json')
+    """
+
+    def __init__(self, transport):
+        self.transport = transport
+        self.exchanges = []
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+        timeout=None,
+        stream=False,
+    ):
+        response = self.transport.send(
+            method,
+            url,
+            headers=headers,
+            data=data,
+            params=params,
+            timeout=timeout,
+            stream=stream,
+        )
+        # reading the content here means streamed downloads are buffered
+        body = response.content
+        exchange = {
+            'method': method.lower(),
+            'url': url,
+            'params': params,
+            'status_code': response.status_code,
+            'headers': {
+                k: v
+                for k, v in response.headers.items()
+                # the recorded body is stored decoded
+                if k.lower() not in ('content-encoding', 'content-length')
+            },
+        }
+        try:
+            exchange['body'] = body.decode('utf-8')
+        except UnicodeDecodeError:
+            exchange['body_base64'] = base64.b64encode(body).decode('ascii')
+        with self._lock:
+            self.exchanges.append(exchange)
+        return response
+
+    def save(self, path):
+        with self._lock:
+            exchanges = list(self.exchanges)
+        with open(path, 'w') as f:
+            json.dump(exchanges, f, indent=2, default=str)
+
+    def close(self):
+        self.transport.close()
+
+
+class ReplayTransport(Transport):
+    """
+    Answers requests with exchanges recorded by ``RecordingTransport``.
+
+    A request matches a recorded exchange with the same method, URL path and
+    query parameters; identical requests get their recorded responses in the
+    original order. A request without a match raises ``PaperlessException``.
+
+    :param exchanges: path of a file written by ``RecordingTransport.save``,
+    or the list of exchanges itself
+    """
+
+    def __init__(self, exchanges):
+        if isinstance(exchanges, str):
+            with open(exchanges) as f:
+                exchanges = json.load(f)
+        self._responses = defaultdict(deque)
+        for exchange in exchanges:
+            key = request_key(exchange['method'], exchange['url'], exchange['params'])
+            self._responses[key].append(exchange)
+        self._lock = threading.Lock()
+
+    def send(
+        self,
+        method,
+        url,
+        headers=None,
+        data=None,
+        params=None,
+        timeout=None,
+        stream=False,
+    ):
+        key = request_key(method, url, params)
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                raise PaperlessException(
+                    message='No recorded response for {} {}'.format(method.upper(), url)
+                )
+            exchange = responses.popleft()
+        if 'body_base64' in exchange:
+            body = base64.b64decode(exchange['body_base64'])
+        else:
+            body = exchange['body'].encode('utf-8')
+        return make_response(
+            exchange['status_code'], body, headers=exchange['headers'], url=url
+        )
@@ -0,0 +1,16 @@
+from paperless.retry import Clock
+
+
+class FakeClock(Clock):
+    """A clock whose time only moves when told to, recording every sleep."""
+
+    def __init__(self, now=0.0):
+        self.now = now
+        self.sleeps = []
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
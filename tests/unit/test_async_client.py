@@ -0,0 +1,99 @@
+import asyncio
+import json
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import MagicMock
+
+from paperless.async_client import AsyncPaperlessClient
+from paperless.client import PaperlessClient
+from paperless.exceptions import PaperlessNotFoundException
+from paperless.objects.users import User
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    in_flight = 0
+    max_in_flight = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        cls = type(self)
+        with cls.lock:
+            cls.in_flight += 1
+            cls.max_in_flight = max(cls.max_in_flight, cls.in_flight)
+        time.sleep(0.05)
+        with cls.lock:
+            cls.in_flight -= 1
+        uuid = self.path.rsplit('/', 1)[-1]
+        if uuid == 'missing':
+            status, body = 404, {'message': 'not found'}
+        else:
+            status, body = 200, {'uuid': uuid, 'email': f'{uuid}@example.com'}
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestAsyncClient(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), StubHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.client = PaperlessClient(
+            set_default=True,
+            access_token='test_accesstoken',
+            base_url='http://127.0.0.1:{}'.format(self.server.server_address[1]),
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+        StubHandler.max_in_flight = 0
+
+    async def test_get_resource(self):
+        async_client = AsyncPaperlessClient(max_concurrency=2)
+        resource = await async_client.get_resource('users/public', 'abc')
+        self.assertEqual(resource['uuid'], 'abc')
+        async_client.close()
+
+    async def test_forwards_keyword_arguments(self):
+        async_client = AsyncPaperlessClient(client=self.client)
+        self.client.get_resource_list = MagicMock(return_value={})
+        self.client.put_resource = MagicMock(return_value={})
+        self.client.request = MagicMock()
+        await async_client.get_resource_list('users/public', resource_type=User)
+        self.assertIs(self.client.get_resource_list.call_args[1]['resource_type'], User)
+        await async_client.put_resource('users/public', '{}', compress=True)
+        self.assertTrue(self.client.put_resource.call_args[1]['compress'])
+        await async_client.request(
+            'users/public', method='get', headers={'If-None-Match': '"1"'}
+        )
+        self.assertEqual(
+            self.client.request.call_args[1]['headers'], {'If-None-Match': '"1"'}
+        )
+        async_client.close()
+
+    async def test_not_found(self):
+        async_client = AsyncPaperlessClient()
+        with self.assertRaises(PaperlessNotFoundException):
+            await async_client.get_resource('users/public', 'missing')
+        async_client.close()
+
+    async def test_aget_is_concurrent_and_bounded(self):
+        async_client = AsyncPaperlessClient.get_instance()
+        users = await asyncio.gather(*[User.aget(str(i)) for i in range(12)])
+        self.assertEqual([u.uuid for u in users], [str(i) for i in range(12)])
+        self.assertGreater(StubHandler.max_in_flight, 1)
+        self.assertLessEqual(StubHandler.max_in_flight, async_client.max_concurrency)
@@ -0,0 +1,313 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from paperless.cache import (
+    MemoryCacheBackend,
+    ResponseCache,
+    RevalidationStore,
+    SQLiteCacheBackend,
+)
+from paperless.client import ClientRegistry, PaperlessClient, use_client
+from paperless.objects.customers import PaymentTerms
+from paperless.objects.orders import Order
+from paperless.objects.quotes import Quote
+from paperless.objects.utils import LazyList, is_trusted
+from tests.unit.clock import FakeClock
+
+
+def json_response(body, status_code=200, headers=None):
+    content = json.dumps(body).encode()
+    response = Mock(status_code=status_code, content=content, headers=headers or {})
+    response.json.side_effect = lambda: json.loads(content)
+    return response
+
+
+class TestMemoryCacheBackend(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        backend = MemoryCacheBackend(maxsize=2)
+        backend.set('a', 'a', 0, b'a')
+        backend.set('b', 'b', 0, b'b')
+        backend.get('a')
+        self.assertEqual(backend.set('c', 'c', 0, b'c'), 1)
+        self.assertIsNone(backend.get('b'))
+        self.assertIsNotNone(backend.get('a'))
+        self.assertIsNotNone(backend.get('c'))
+
+
+class TestSQLiteCacheBackend(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_entries_survive_reopening(self):
+        backend = SQLiteCacheBackend(self.path)
+        backend.set('key', 'users/public', 1.0, b'{}')
+        backend.close()
+        backend = SQLiteCacheBackend(self.path)
+        self.assertEqual(backend.get('key'), ('users/public', 1.0, b'{}'))
+        backend.close()
+
+    def test_eviction_and_prefix_delete(self):
+        backend = SQLiteCacheBackend(self.path, maxsize=2)
+        backend.set('a', 'users/public/1', 0, b'a')
+        backend.set('b', 'users/public/2', 0, b'b')
+        backend.get('a')
+        self.assertEqual(backend.set('c', 'customers/public/3', 0, b'c'), 1)
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.delete_prefix('users/public'), 1)
+        self.assertEqual(len(backend), 1)
+        backend.close()
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock(now=1000.0)
+        self.cache = ResponseCache(clock=self.clock)
+        self.client = PaperlessClient(
+            set_default=True, access_token='test_accesstoken', cache=self.cache
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+
+    def test_ttl_lookup(self):
+        self.assertEqual(self.cache.ttl_for(PaymentTerms), PaymentTerms._cache_ttl)
+        self.assertIsNone(self.cache.ttl_for(Order))
+        cache = ResponseCache(ttls={Order: 10}, default_ttl=5)
+        self.assertEqual(cache.ttl_for(Order), 10)
+        self.assertEqual(cache.ttl_for(PaymentTerms), PaymentTerms._cache_ttl)
+        self.assertIsNone(cache.ttl_for(None))
+
+    def test_hit_and_expiry(self):
+        body = {'results': [], 'next': None}
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[json_response(body), json_response(body)],
+        ) as request:
+            first = self.client.get_resource_list(
+                'customers/public/payment_terms', resource_type=PaymentTerms
+            )
+            second = self.client.get_resource_list(
+                'customers/public/payment_terms', resource_type=PaymentTerms
+            )
+            self.assertEqual(request.call_count, 1)
+            self.assertEqual(first, second)
+            # callers get their own objects
+            self.assertIsNot(first, second)
+
+            self.clock.now += PaymentTerms._cache_ttl + 1
+            self.client.get_resource_list(
+                'customers/public/payment_terms', resource_type=PaymentTerms
+            )
+            self.assertEqual(request.call_count, 2)
+        self.assertEqual(self.cache.stats()['hits'], 1)
+        self.assertEqual(self.cache.stats()['misses'], 2)
+
+    def test_resource_without_ttl_is_not_cached(self):
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[json_response({}), json_response({})],
+        ) as request:
+            self.client.get_resource('orders/public', 1, resource_type=Order)
+            self.client.get_resource('orders/public', 1, resource_type=Order)
+            self.assertEqual(request.call_count, 2)
+        self.assertEqual(len(self.cache.backend), 0)
+
+    def test_writes_invalidate(self):
+        url = 'suppliers/public/purchased_component_columns'
+        self.cache.set(url, None, b'[]', 60)
+        self.cache.set(url + '/1', None, b'{}', 60)
+        self.cache.set('users/public', None, b'[]', 60)
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[json_response({'id': 1})],
+        ):
+            self.client.update_resource(url, 1, data={})
+        self.assertIsNone(self.cache.get(url))
+        self.assertIsNone(self.cache.get(url + '/1'))
+        self.assertIsNotNone(self.cache.get('users/public'))
+        self.assertEqual(self.cache.stats()['invalidations'], 2)
+
+    def test_batch_writes_invalidate_collection(self):
+        url = 'suppliers/public/purchased_components'
+        self.cache.set(url, {'page': 1}, b'{}', 60)
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[json_response({'successes': [], 'failures': []})],
+        ):
+            self.client.create_resource(url + '/batch', data={})
+        self.assertIsNone(self.cache.get(url, {'page': 1}))
+
+    def test_clients_sharing_a_cache_are_kept_apart(self):
+        registry = ClientRegistry(cache=self.cache)
+        acme = registry.register('acme', access_token='acme_token')
+        globex = registry.register('globex', access_token='globex_token')
+        other_token = PaperlessClient(
+            set_default=False, access_token='other_token', group_slug='acme'
+        )
+        self.assertNotEqual(acme.cache_scope(), globex.cache_scope())
+        self.assertNotEqual(acme.cache_scope(), other_token.cache_scope())
+        self.assertNotIn('acme_token', acme.cache_scope())
+
+        bodies = {}
+        for client in (acme, globex):
+            body = {'results': [{'id': 1, 'label': client.group_slug}], 'next': None}
+            bodies[client.group_slug] = body
+            with patch.object(
+                client.get_session(), 'request', side_effect=[json_response(body)]
+            ) as request:
+                for _ in range(2):
+                    self.assertEqual(
+                        client.get_resource_list(
+                            'customers/public/payment_terms',
+                            resource_type=PaymentTerms,
+                        ),
+                        body,
+                    )
+                self.assertEqual(request.call_count, 1)
+        self.assertEqual(len(self.cache.backend), 2)
+
+
+class TestConditionalGet(unittest.TestCase):
+    def setUp(self):
+        self.store = RevalidationStore()
+        self.client = PaperlessClient(
+            set_default=True,
+            access_token='test_accesstoken',
+            revalidation_store=self.store,
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+        with open('tests/unit/mock_data/quote.json') as data_file:
+            self.quote_json = json.load(data_file)
+
+    def test_not_modified_decodes_stored_body(self):
+        etag = '"abc"'
+        with (
+            patch.object(
+                self.client.get_session(),
+                'request',
+                side_effect=[
+                    json_response(self.quote_json, headers={'ETag': etag}),
+                    json_response(None, status_code=304),
+                ],
+            ) as request,
+            patch.object(Quote, 'from_json', wraps=Quote.from_json) as from_json,
+        ):
+            first = Quote.get(1)
+            second = Quote.get(1)
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(from_json.call_count, 2)
+        self.assertNotIn('If-None-Match', request.call_args_list[0][1]['headers'])
+        self.assertEqual(request.call_args_list[1][1]['headers']['If-None-Match'], etag)
+        self.assertEqual(self.store.stats(), {'hits': 1, 'misses': 1, 'size': 1})
+
+    def test_one_entry_decoded_as_each_get_asks(self):
+        from_json = Quote.from_json
+        trusted_calls = []
+
+        def record_trust(resource):
+            trusted_calls.append(is_trusted())
+            return from_json(resource)
+
+        with (
+            patch.object(
+                self.client.get_session(),
+                'request',
+                side_effect=[
+                    json_response(self.quote_json, headers={'ETag': '"v1"'}),
+                    json_response(None, status_code=304),
+                    json_response(None, status_code=304),
+                    json_response(None, status_code=304),
+                ],
+            ) as request,
+            patch.object(Quote, 'from_json', side_effect=record_trust),
+        ):
+            lazy_quote = Quote.get(1, lazy=True)
+            quote = Quote.get(1)
+            trusted_quote = Quote.get(1, validate=False)
+            lazy_again = Quote.get(1, lazy=True)
+        for call in request.call_args_list[1:]:
+            self.assertEqual(call[1]['headers']['If-None-Match'], '"v1"')
+        self.assertEqual(trusted_calls, [False, False, True, False])
+        self.assertIsInstance(lazy_quote.quote_items, LazyList)
+        self.assertNotIsInstance(quote.quote_items, LazyList)
+        self.assertNotIsInstance(trusted_quote.quote_items, LazyList)
+        self.assertIsInstance(lazy_again.quote_items, LazyList)
+        self.assertIsNot(lazy_again, lazy_quote)
+        self.assertEqual(self.store.stats(), {'hits': 3, 'misses': 1, 'size': 1})
+
+    def test_modified_resource_is_replaced(self):
+        changed = dict(self.quote_json, number=2)
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[
+                json_response(
+                    self.quote_json,
+                    headers={'Last-Modified': 'Wed, 21 Oct 2026 07:28:00 GMT'},
+                ),
+                json_response(changed, headers={'ETag': '"v2"'}),
+            ],
+        ) as request:
+            Quote.get(1)
+            quote = Quote.get(1)
+        self.assertEqual(quote.number, 2)
+        self.assertEqual(
+            request.call_args_list[1][1]['headers']['If-Modified-Since'],
+            'Wed, 21 Oct 2026 07:28:00 GMT',
+        )
+        self.assertEqual(
+            self.store.conditional_headers(
+                'quotes/public/1', {'revision': None}, self.client.cache_scope()
+            ),
+            {'If-None-Match': '"v2"'},
+        )
+
+    def test_without_validators_nothing_is_stored(self):
+        with patch.object(
+            self.client.get_session(),
+            'request',
+            side_effect=[json_response(self.quote_json)] * 2,
+        ) as request:
+            Quote.get(1)
+            Quote.get(1)
+        self.assertNotIn('If-None-Match', request.call_args_list[1][1]['headers'])
+        self.assertEqual(self.store.stats()['size'], 0)
+
+    def test_writes_invalidate(self):
+        self.store.store(
+            'orders/public/1', None, json_response({}, headers={'ETag': '"x"'})
+        )
+        with patch.object(
+            self.client.get_session(), 'request', side_effect=[json_response({})]
+        ):
+            self.client.update_resource('orders/public', 1, data={})
+        self.assertIsNone(self.store.conditional_headers('orders/public/1'))
+
+    def test_clients_sharing_a_store_are_kept_apart(self):
+        registry = ClientRegistry(revalidation_store=self.store)
+        acme = registry.register('acme', access_token='acme_token')
+        globex = registry.register('globex', access_token='globex_token')
+        for client, number in ((acme, 1), (globex, 2)):
+            with patch.object(
+                client.get_session(),
+                'request',
+                side_effect=[
+                    json_response(
+                        dict(self.quote_json, number=number), headers={'ETag': '"v1"'}
+                    )
+                ],
+            ) as request:
+                with use_client(client):
+                    self.assertEqual(Quote.get(1).number, number)
+            self.assertNotIn('If-None-Match', request.call_args[1]['headers'])
+        self.assertEqual(self.store.stats()['size'], 2)
@@ -1,25 +1,85 @@
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
 
-from paperless.client import PaperlessClient
-from paperless.exceptions import PaperlessAuthorizationException
+from paperless.client import ClientRegistry, PaperlessClient, use_client
+from paperless.exceptions import PaperlessAuthorizationException, PaperlessException
 
 
 class TestClient(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
         self.client = PaperlessClient()
         self.access_token = "test_accesstoken"
 
-    def test_client_is_singleton(self):
-        # singleton by get_instance
-        new_client1 = PaperlessClient.get_instance()
-        self.assertTrue(new_client1 is self.client)
-        new_client1.access_token = self.access_token
-        self.assertEqual(self.access_token, self.client.access_token)
-        # singleton by new instance
-        new_client2 = PaperlessClient()
-        self.assertTrue(new_client2 is self.client)
-        self.assertEqual(self.access_token, new_client2.access_token)
+    def test_new_client_becomes_default(self):
+        self.assertIs(PaperlessClient.get_instance(), self.client)
+        other = PaperlessClient(set_default=True, access_token=self.access_token)
+        self.addCleanup(PaperlessClient.set_default_instance, self.client)
+        self.assertIsNot(other, self.client)
+        self.assertIs(PaperlessClient.get_instance(), other)
+        tenant = PaperlessClient(access_token='tenant', set_default=False)
+        self.assertIs(PaperlessClient.get_instance(), other)
+        self.assertIsNot(tenant.get_session(), other.get_session())
+
+    def test_first_client_becomes_default(self):
+        self.addCleanup(PaperlessClient.set_default_instance, self.client)
+        PaperlessClient.set_default_instance(None)
+        client = PaperlessClient(access_token=self.access_token)
+        self.assertIs(PaperlessClient.get_instance(), client)
+
+    def test_later_calls_update_the_default_client(self):
+        self.addCleanup(PaperlessClient.set_default_instance, self.client)
+        PaperlessClient.set_default_instance(None)
+        configured = PaperlessClient(access_token=self.access_token)
+        session = configured.get_session()
+        self.assertIs(PaperlessClient(group_slug='acme'), configured)
+        self.assertIs(PaperlessClient(), configured)
+        self.assertEqual(configured.access_token, self.access_token)
+        self.assertEqual(configured.group_slug, 'acme')
+        self.assertIs(configured.get_session(), session)
+
+    def test_use_client(self):
+        tenant = PaperlessClient(access_token='tenant', set_default=False)
+        with use_client(tenant):
+            self.assertIs(PaperlessClient.get_instance(), tenant)
+            with PaperlessClient(set_default=False).activate() as inner:
+                self.assertIs(PaperlessClient.get_instance(), inner)
+            self.assertIs(PaperlessClient.get_instance(), tenant)
+        self.assertIs(PaperlessClient.get_instance(), self.client)
+
+    def test_use_client_is_context_local(self):
+        clients = [
+            PaperlessClient(group_slug=str(i), set_default=False) for i in range(8)
+        ]
+        barrier = threading.Barrier(len(clients))
+
+        def work(client):
+            with use_client(client):
+                barrier.wait()
+                return PaperlessClient.get_instance().group_slug
+
+        with ThreadPoolExecutor(max_workers=len(clients)) as pool:
+            slugs = list(pool.map(work, clients))
+        self.assertEqual(slugs, [c.group_slug for c in clients])
+
+    def test_client_registry(self):
+        registry = ClientRegistry(base_url='http://localhost')
+        acme = registry.register('acme', access_token='acme-token')
+        globex = registry.register('globex', access_token='globex-token')
+        self.assertEqual(acme.base_url, 'http://localhost')
+        # each client retries within a budget of its own
+        self.assertIsNot(acme.retry_policy, globex.retry_policy)
+        self.assertEqual(sorted(registry), ['acme', 'globex'])
+        self.assertIn('acme', registry)
+        self.assertIs(PaperlessClient.get_instance(), self.client)
+        with registry.use('globex'):
+            client = PaperlessClient.get_instance()
+            self.assertEqual(client.group_slug, 'globex')
+            self.assertEqual(client.access_token, 'globex-token')
+        with self.assertRaises(PaperlessException):
+            registry.get('initech')
+        registry.close()
 
     def test_without_bearer_token_throws_an_error(self):
         """
@@ -43,3 +103,37 @@ class TestClient(unittest.TestCase):
         self.assertEqual(
             headers['Authorization'], 'API-Token {}'.format(self.access_token)
         )
+
+    def test_requests_share_pooled_session(self):
+        """
+        Every request goes through the same keep-alive session.
+        """
+        client = PaperlessClient.get_instance()
+        client.access_token = self.access_token
+        session = client.get_session()
+        self.assertIs(session, client.get_session())
+        response = Mock(status_code=200)
+        response.json.return_value = {'id': 1}
+        with patch.object(session, 'request', return_value=response) as request:
+            self.assertEqual(client.get_resource('orders/public', 1), {'id': 1})
+            client.patch_resource('orders/public/1', data='{}')
+        self.assertEqual(request.call_count, 2)
+        self.assertEqual(request.call_args_list[0][0][0], PaperlessClient.METHODS.GET)
+        self.assertEqual(request.call_args_list[1][0][0], PaperlessClient.METHODS.PATCH)
+
+    def test_configure_pool(self):
+        client = PaperlessClient(set_default=False, pool_connections=2, pool_maxsize=32)
+        session = client.get_session()
+        adapter = session.get_adapter(client.base_url)
+        self.assertEqual(adapter._pool_connections, 2)
+        self.assertEqual(adapter._pool_maxsize, 32)
+        # reconfiguring replaces the session
+        client.configure_pool(pool_maxsize=4)
+        self.assertIsNot(session, client.get_session())
+        self.assertEqual(
+            client.get_session().get_adapter(client.base_url)._pool_maxsize, 4
+        )
+        client.configure_pool(
+            pool_connections=PaperlessClient.DEFAULT_POOL_CONNECTIONS,
+            pool_maxsize=PaperlessClient.DEFAULT_POOL_MAXSIZE,
+        )
@@ -1,11 +1,13 @@
 import json
+import threading
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from paperless.client import PaperlessClient
 from paperless.objects.common import Money
 from paperless.objects.customers import (
     Account,
+    AccountList,
     BillingAddress,
     Contact,
     Facility,
@@ -194,6 +196,63 @@ class TestAccountList(unittest.TestCase):
         self.assertEqual(a[1].phone_ext, "12")
         self.assertEqual(a[1].type, "customer")
 
+    def test_list_only_some_fields(self):
+        self.client.get_resource_list = MagicMock(
+            return_value=self.mock_account_list_json
+        )
+        del self.mock_account_list_json['results'][0]['phone_ext']
+        a = AccountList.list(fields=['id', 'erp_code', 'phone_ext'])
+        self.assertEqual([account.id for account in a], [1, 2, 3])
+        self.assertEqual(a[1].erp_code, "AMC")
+        self.assertIsNone(a[2].erp_code)
+        # keys missing from the response are None
+        self.assertIsNone(a[0].phone_ext)
+        self.assertNotIsInstance(a[0], AccountList)
+        with self.assertRaises(AttributeError):
+            a[0].erp_code = "PPI2"
+        self.assertEqual(
+            type(a[0]),
+            type(next(Account.iter_list(fields=['id', 'erp_code', 'phone_ext']))),
+        )
+
+    def test_list_unknown_fields(self):
+        self.client.get_resource_list = MagicMock(
+            return_value=self.mock_account_list_json
+        )
+        with self.assertRaisesRegex(ValueError, 'erp_cod, website'):
+            AccountList.list(fields=['id', 'erp_cod', 'website'])
+        self.client.get_resource_list.assert_not_called()
+
+    def test_filter_many(self):
+        accounts = self.mock_account_list_json['results']
+        started = threading.Barrier(2, timeout=5)
+
+        def get_resource_list(list_url, params=None, resource_type=None):
+            # both filters are in flight at the same time
+            started.wait()
+            erp_code = params['erp_code']
+            return {
+                'count': 2,
+                'next': None,
+                'previous': None,
+                # the first account matches every code
+                'results': [accounts[0]]
+                + [a for a in accounts[1:] if a['erp_code'] == erp_code],
+            }
+
+        self.client.get_resource_list = MagicMock(side_effect=get_resource_list)
+        with patch.object(
+            AccountList, 'from_list_json', wraps=AccountList.from_list_json
+        ) as from_list_json:
+            by_code = Account.filter_many(['AMC', 'XYZ', 'AMC'], workers=2)
+        # the account matching both codes is deserialized once
+        self.assertEqual(from_list_json.call_count, 2)
+        self.assertEqual(list(by_code), ['AMC', 'XYZ'])
+        self.assertEqual([a.id for a in by_code['AMC']], [1, 2])
+        self.assertEqual([a.id for a in by_code['XYZ']], [1])
+        self.assertIs(by_code['AMC'][0], by_code['XYZ'][0])
+        self.assertEqual(self.client.get_resource_list.call_count, 2)
+
 
 class TestBillingAddress(unittest.TestCase):
     def setUp(self):
@@ -20,12 +20,12 @@ class TestGetPaginatedAPIObjects(unittest.TestCase):
             self.list = list_of_maps
             self.called = 0
 
-        def next_item(self, _url, _params={}):
+        def next_item(self, _url, params=None, resource_type=None):
             self.called += 1
             return self.list.pop(0)
 
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/quote.json') as data_file:
             quote_json = json.load(data_file)
@@ -124,7 +124,7 @@ class TestGetPaginatedAPIObjects(unittest.TestCase):
 
 class TestCostingVariableUpdate(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/quote.json') as data_file:
             quote_json = json.load(data_file)
@@ -1,10 +1,13 @@
 import datetime
 import json
+import os
+import tempfile
 import unittest
 from typing import Optional, Union
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 from paperless.client import PaperlessClient
+from paperless.local import LocalStorage
 from paperless.objects.integration_actions import (
     IntegrationAction,
     IntegrationActionDefinition,
@@ -158,6 +161,37 @@ class TestIntegrationAction(unittest.TestCase):
         )
         self.assertEqual(integration_action_list, None)
 
+    def test_batch_create_updates_instances(self):
+        self.client.create_resource = MagicMock(
+            return_value=self.mock_integration_action_list_unwrapped_json
+        )
+        actions = [
+            IntegrationAction(type="test_type", entity_id="test_entity_id"),
+            IntegrationAction(type="test_type_2", entity_id="test_entity_id_2"),
+        ]
+        IntegrationAction.create_many(actions)
+        for action, data in zip(
+            actions, self.mock_integration_action_list_unwrapped_json
+        ):
+            self.assertEqual(action.uuid, data["uuid"])
+            self.assertEqual(action.type, data["type"])
+            self.assertEqual(action.status, data["status"])
+
+    def test_update_with_response_data_sets_fields_only(self):
+        action = IntegrationAction(type="test_type", entity_id="test_entity_id")
+        action.update_with_response_data(
+            {"uuid": "1234", "status": "completed", "unknown_field": 1}
+        )
+        self.assertEqual(action.uuid, "1234")
+        self.assertEqual(action.status, "completed")
+        # fields the response does not have are left alone
+        self.assertEqual(action.type, "test_type")
+        self.assertFalse(hasattr(action, "unknown_field"))
+        # the values are still validated, before any field changes
+        with self.assertRaises(TypeError):
+            action.update_with_response_data({"uuid": "5678", "type": 1})
+        self.assertEqual(action.uuid, "1234")
+
     def test_batch_update_integration_actions(self):
         self.client.patch_resource = MagicMock(
             return_value=self.mock_integration_action_list_unwrapped_json
@@ -235,3 +269,94 @@ class TestIntegrationAction(unittest.TestCase):
             "ef7fc2f3-556f-434d-bfb4-bfb69b8beefb",
         )
         self.assertEqual(integration_action_list, None)
+
+
+class TestManagedIntegrationEvents(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient()
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.filename = os.path.join(tmp.name, 'processed.json')
+
+    def event(self, uuid):
+        return {
+            'uuid': uuid,
+            'type': 'part.created',
+            'created': '2022-02-01T22:21:58.718957Z',
+            'data': {},
+            'related_object': 'x',
+            'related_object_type': 'part',
+        }
+
+    def poll(self, uuids, more):
+        return {
+            'results': [self.event(uuid) for uuid in uuids],
+            'has_more_events': more,
+        }
+
+    def test_events_are_streamed_and_deduplicated(self):
+        self.client.get_resource_list = MagicMock(
+            side_effect=[
+                self.poll(['a', 'b'], True),
+                self.poll(['b', 'c'], False),
+            ]
+        )
+        events = ManagedIntegration.iter_events('abc')
+        self.assertEqual(next(events).uuid, 'a')
+        # the second batch is polled once the first is consumed
+        self.assertEqual(self.client.get_resource_list.call_count, 1)
+        self.assertEqual([e.uuid for e in events], ['b', 'c'])
+        self.assertEqual(self.client.get_resource_list.call_count, 2)
+
+    def test_resumes_from_checkpoint_after_a_crash(self):
+        self.client.get_resource_list = MagicMock(
+            side_effect=[
+                self.poll(['a', 'b', 'c'], True),
+                self.poll(['d'], False),
+            ]
+        )
+        handled = []
+        with self.assertRaises(RuntimeError):
+            for event in ManagedIntegration.iter_events('abc', storage=self.filename):
+                if event.uuid == 'b':
+                    raise RuntimeError('crashed')
+                handled.append(event.uuid)
+
+        # the rest of the interrupted batch comes from the checkpoint
+        self.client.get_resource_list.reset_mock()
+        events = ManagedIntegration.iter_events('abc', storage=self.filename)
+        self.assertEqual(next(events).uuid, 'b')
+        self.assertEqual(self.client.get_resource_list.call_count, 0)
+        handled.extend(['b'] + [e.uuid for e in events])
+        self.assertEqual(handled, ['a', 'b', 'c', 'd'])
+
+        storage = LocalStorage.get_instance(self.filename)
+        checkpoint = storage.get_checkpoint('ManagedIntegration.iter_events:abc')
+        self.assertEqual(checkpoint, {'pending': [], 'seen': ['a', 'b', 'c', 'd']})
+
+    def test_batches_are_checkpointed_once(self):
+        self.client.get_resource_list = MagicMock(
+            side_effect=[
+                self.poll(['a', 'b', 'c'], True),
+                self.poll(['d', 'e'], False),
+            ]
+        )
+        storage = LocalStorage.get_instance(self.filename)
+        with patch.object(
+            storage, 'save_checkpoint', wraps=storage.save_checkpoint
+        ) as save_checkpoint:
+            events = ManagedIntegration.iter_events('abc', storage=storage)
+            self.assertEqual(next(events).uuid, 'a')
+            # a hard crash now yields the whole batch again
+            checkpoint = storage.get_checkpoint('ManagedIntegration.iter_events:abc')
+            self.assertEqual(len(checkpoint['pending']), 3)
+            self.assertEqual([e.uuid for e in events], ['b', 'c', 'd', 'e'])
+        # one save per batch and one at the end
+        self.assertEqual(save_checkpoint.call_count, 3)
+
+    def test_dedupe_window_is_bounded(self):
+        self.client.get_resource_list = MagicMock(
+            side_effect=[self.poll(['a', 'b', 'c', 'a'], False)]
+        )
+        events = ManagedIntegration.iter_events('abc', dedupe_window=2)
+        self.assertEqual([e.uuid for e in events], ['a', 'b', 'c', 'a'])
@@ -32,3 +32,22 @@ class TestLocalStorage(unittest.TestCase):
         storage.clear_cache()
         self.assertIsNone(storage.get_last_processed(QuoteOperation))
         os.remove(filename)
+
+    def test_checkpoints_are_not_implemented_by_the_base_class(self):
+        storage = LocalStorage('/tmp/test')
+        with self.assertRaises(NotImplementedError):
+            storage.get_checkpoint('name')
+        with self.assertRaises(NotImplementedError):
+            storage.save_checkpoint('name', {})
+
+    def test_clear_cache_keeps_checkpoints(self):
+        filename = '/tmp/test_checkpoints'
+        if os.path.exists(filename):
+            os.remove(filename)
+        storage = LocalStorage.get_instance(filename)
+        storage.save_checkpoint('events', {'pending': []})
+        storage.clear_cache()
+        self.assertEqual(storage.get_checkpoint('events'), {'pending': []})
+        storage.save_checkpoint('events', None)
+        self.assertIsNone(storage.get_checkpoint('events'))
+        os.remove(filename)
@@ -1,7 +1,19 @@
+import pickle
 import unittest
+from decimal import Decimal
 
+from paperless.objects.common import Money, Salesperson
 from paperless.objects.quotes import CostingVariablePayload
-from paperless.objects.utils import safe_init
+from paperless.objects.utils import (
+    LazyList,
+    construct,
+    get_decoder,
+    get_field_names,
+    lazy,
+    safe_init,
+    set_trusted_default,
+    trusted,
+)
 
 
 class TestObjects(unittest.TestCase):
@@ -18,3 +30,96 @@ class TestObjects(unittest.TestCase):
         d = safe_init(dict, dict(value=2, row=None, options=None, new_kwarg=1))
         self.assertTrue(isinstance(d, dict))
         self.assertEqual(2, d['value'])
+
+    def test_decoder_is_compiled_once_per_class(self):
+        decode = get_decoder(CostingVariablePayload)
+        self.assertIs(get_decoder(CostingVariablePayload), decode)
+        cvp = decode(dict(value=3, new_kwarg=1))
+        self.assertEqual(3, cvp.value)
+        # missing fields are passed as None, like safe_init always did
+        self.assertIsNone(cvp.row)
+        self.assertEqual(
+            get_field_names(CostingVariablePayload),
+            frozenset(['value', 'row', 'options']),
+        )
+
+    def test_trusted_payloads_skip_validators(self):
+        with self.assertRaises(TypeError):
+            safe_init(Salesperson, dict(email=1))
+        with trusted():
+            salesperson = safe_init(Salesperson, dict(email=1))
+            self.assertEqual(1, salesperson.email)
+            self.assertIsNone(salesperson.first_name)
+            # objects constructed directly are still validated
+            with self.assertRaises(TypeError):
+                Salesperson(email=1)
+            # converters still run
+            money = safe_init(Money, dict(raw_amount='1.50'))
+            self.assertEqual(Decimal('1.50'), money.raw_amount)
+            self.assertEqual('USD', money.currency)
+            with trusted(False):
+                with self.assertRaises(TypeError):
+                    safe_init(Salesperson, dict(email=1))
+
+    def test_trusted_default(self):
+        set_trusted_default(True)
+        try:
+            self.assertEqual(1, safe_init(Salesperson, dict(email=1)).email)
+        finally:
+            set_trusted_default(False)
+        with self.assertRaises(TypeError):
+            safe_init(Salesperson, dict(email=1))
+
+    def test_construct_checks_arguments(self):
+        with trusted():
+            money = construct(Money, dict(raw_amount=2))
+            self.assertEqual(Decimal(2), money.raw_amount)
+            self.assertEqual(Decimal(0), construct(Money, {}).raw_amount)
+            with self.assertRaises(TypeError):
+                construct(Salesperson, {})
+            with self.assertRaises(TypeError):
+                construct(Money, dict(raw_amount=2, new_kwarg=1))
+
+    def test_lazy_list(self):
+        decoded = []
+
+        def decode(value_dict):
+            decoded.append(value_dict['email'])
+            return safe_init(Salesperson, value_dict)
+
+        emails = ['a@example.com', 'b@example.com', 'c@example.com']
+        people = LazyList([dict(email=e) for e in emails], Salesperson, decode)
+        self.assertIsInstance(people, list)
+        self.assertEqual(3, len(people))
+        self.assertEqual([], decoded)
+        # elements are built on access, once
+        self.assertIs(people[1], people[1])
+        self.assertEqual(['b@example.com'], decoded)
+        self.assertEqual(emails[1:], [p.email for p in people[1:]])
+        self.assertEqual(emails, [p.email for p in people])
+        self.assertCountEqual(emails, decoded)
+        people.append(Salesperson(email='d@example.com'))
+        self.assertEqual('d@example.com', people[-1].email)
+
+    def test_lazy_list_compares_and_pickles_as_list(self):
+        def make():
+            return LazyList(
+                [dict(raw_amount=1), dict(raw_amount=2)],
+                Money,
+                get_decoder(Money),
+            )
+
+        self.assertEqual(make(), make())
+        self.assertEqual([Money(1), Money(2)], make())
+        self.assertIn(Money(2), make())
+        self.assertEqual([Money(0), Money(1), Money(2)], [Money(0)] + make())
+        self.assertEqual([Money(2)], make()[1:])
+        copy = pickle.loads(pickle.dumps(make()))
+        self.assertIs(list, type(copy))
+        self.assertEqual([Money(1), Money(2)], copy)
+
+    def test_lazy_list_keeps_trust(self):
+        with lazy(), trusted():
+            people = LazyList([dict(email=1)], Salesperson, get_decoder(Salesperson))
+        # decoded later, outside of the block, still as trusted
+        self.assertEqual(1, people[0].email)
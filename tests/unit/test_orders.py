@@ -10,7 +10,7 @@ from paperless.objects.orders import Order, OrderComponent
 
 class TestOrders(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/order.json') as data_file:
             self.mock_order_json = json.load(data_file)
@@ -0,0 +1,467 @@
+import itertools
+import json
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from paperless.client import PaperlessClient
+from paperless.exceptions import PaperlessNotFoundException
+from paperless.fake_server import FakePaperlessServer
+from paperless.objects.events import Event
+from paperless.objects.integration_actions import (
+    IntegrationAction,
+    ManagedIntegration,
+)
+from paperless.objects.purchased_components import PurchasedComponent
+from paperless.pagination import (
+    AdaptivePageSize,
+    ListCursor,
+    iter_pages,
+    iter_pages_parallel,
+    paginate,
+    prefetch,
+)
+from tests.unit.clock import FakeClock
+
+MOCK_DATA = os.path.join(os.path.dirname(__file__), 'mock_data')
+
+
+def make_pages(n, per_page=2, count=True):
+    pages = []
+    for page in range(1, n + 1):
+        pages.append(
+            {
+                'count': n * per_page if count else None,
+                'next': (
+                    'https://api.paperlessparts.com/events/public?page={}'.format(
+                        page + 1
+                    )
+                    if page < n
+                    else None
+                ),
+                'results': [
+                    {
+                        'uuid': '{}-{}'.format(page, i),
+                        'type': 'part.created',
+                        'created': '2022-02-01T22:21:58.718957Z',
+                        'data': {},
+                        'related_object': 'x',
+                        'related_object_type': 'part',
+                    }
+                    for i in range(per_page)
+                ],
+            }
+        )
+    return pages
+
+
+class TestPrefetch(unittest.TestCase):
+    def test_depth_zero_is_plain_iteration(self):
+        items = [1, 2, 3]
+        self.assertEqual(list(prefetch(items, 0)), items)
+
+    def test_fetches_ahead_while_consumer_works(self):
+        fetched = []
+        second_fetched = threading.Event()
+
+        def produce():
+            for i in range(3):
+                fetched.append(i)
+                if i == 1:
+                    second_fetched.set()
+                yield i
+
+        items = prefetch(produce(), 1)
+        self.assertEqual(next(items), 0)
+        # the consumer is still on item 0, yet item 1 is being fetched
+        self.assertTrue(second_fetched.wait(5))
+        self.assertEqual(list(items), [1, 2])
+
+    def test_depth_bounds_work_ahead(self):
+        fetched = []
+
+        def produce():
+            for i in range(100):
+                fetched.append(i)
+                yield i
+
+        items = prefetch(produce(), 2)
+        next(items)
+        # wait until the producer is blocked, two items ahead
+        for _ in range(100):
+            if len(fetched) >= 3:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        self.assertEqual(fetched, [0, 1, 2])
+        items.close()
+
+    def test_errors_are_raised_in_order(self):
+        def produce():
+            yield 1
+            raise ValueError('boom')
+
+        items = prefetch(produce(), 2)
+        self.assertEqual(next(items), 1)
+        with self.assertRaises(ValueError):
+            next(items)
+
+
+class TestPrefetchingLists(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient()
+
+    def test_list_prefetches_pages(self):
+        self.client.get_resource_list = MagicMock(side_effect=make_pages(4))
+        events = Event.list(params={'type': 'part.created'}, prefetch=2)
+        self.assertEqual(len(events), 8)
+        self.assertEqual(events[-1].uuid, '4-1')
+        self.assertEqual(self.client.get_resource_list.call_count, 4)
+
+    def test_prefetch_fetches_one_page_ahead(self):
+        self.client.get_resource_list = MagicMock(side_effect=make_pages(4))
+        events = Event.iter_list(prefetch=1)
+        self.assertEqual([next(events).uuid for _ in range(2)], ['1-0', '1-1'])
+        for _ in range(100):
+            if self.client.get_resource_list.call_count >= 2:
+                break
+            threading.Event().wait(0.01)
+        threading.Event().wait(0.05)
+        # the caller is on page 1 and page 2 was fetched ahead
+        self.assertEqual(self.client.get_resource_list.call_count, 2)
+        events.close()
+
+    def test_iter_pages_keeps_filters(self):
+        self.client.get_resource_list = MagicMock(side_effect=make_pages(2))
+        pages = list(
+            iter_pages(self.client, 'events/public', params={'type': 'part.created'})
+        )
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(
+            self.client.get_resource_list.call_args[1]['params'],
+            {'page': ['2'], 'type': 'part.created'},
+        )
+
+
+class TestParallelPages(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient()
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.lock = threading.Lock()
+
+    def serve(self, pages):
+        def get_resource_list(list_url, params=None, resource_type=None):
+            page = int((params or {}).get('page', ['1'])[0])
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            # later pages answer sooner, so they complete out of order
+            time.sleep(0.01 * (len(pages) - page))
+            with self.lock:
+                self.in_flight -= 1
+            return pages[page - 1]
+
+        self.client.get_resource_list = MagicMock(side_effect=get_resource_list)
+
+    def test_pages_are_fetched_concurrently_and_kept_in_order(self):
+        self.serve(make_pages(8))
+        events = Event.list(params={'type': 'part.created'}, parallel=4)
+        self.assertEqual(
+            [e.uuid for e in events],
+            ['{}-{}'.format(page, i) for page in range(1, 9) for i in range(2)],
+        )
+        self.assertEqual(self.client.get_resource_list.call_count, 8)
+        self.assertGreater(self.max_in_flight, 1)
+        self.assertLessEqual(self.max_in_flight, 4)
+        # filters are sent with every page
+        for call in self.client.get_resource_list.call_args_list[1:]:
+            self.assertEqual(call[1]['params']['type'], 'part.created')
+
+    def test_falls_back_to_next_links_without_count(self):
+        self.serve(make_pages(4, count=False))
+        pages = list(iter_pages_parallel(self.client, 'events/public', workers=4))
+        self.assertEqual(len(pages), 4)
+        self.assertEqual(self.max_in_flight, 1)
+
+    def test_follows_pages_added_meanwhile(self):
+        pages = make_pages(3)
+        # the first page still reports the original count of two pages
+        pages[0]['count'] = 4
+        self.serve(pages)
+        self.assertEqual(
+            len(list(iter_pages_parallel(self.client, 'events/public', workers=2))), 3
+        )
+
+    def test_fetches_at_most_workers_pages_ahead(self):
+        self.serve(make_pages(20))
+        events = Event.iter_list(parallel=4)
+        self.assertEqual(len(list(itertools.islice(events, 6))), 6)
+        # pages 1 to 3 were handed out, 4 more were in flight
+        self.assertLessEqual(self.client.get_resource_list.call_count, 7)
+        events.close()
+        self.assertLessEqual(self.client.get_resource_list.call_count, 7)
+
+
+class TestPageSelection(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient()
+        self.pages = make_pages(5)
+
+        def get_resource_list(list_url, params=None, resource_type=None):
+            page = (params or {}).get('page', 1)
+            if isinstance(page, list):
+                page = page[0]
+            page = int(page)
+            if page > len(self.pages):
+                raise PaperlessNotFoundException(message='Invalid page.')
+            return self.pages[page - 1]
+
+        self.client.get_resource_list = MagicMock(side_effect=get_resource_list)
+
+    def requested_pages(self):
+        pages = []
+        for call in self.client.get_resource_list.call_args_list:
+            page = (call[1]['params'] or {}).get('page', 1)
+            pages.append(int(page[0] if isinstance(page, list) else page))
+        return pages
+
+    def test_list_fetches_only_the_pages_asked_for(self):
+        events = Event.list(pages=[2, 4])
+        self.assertEqual([e.uuid for e in events], ['2-0', '2-1', '4-0', '4-1'])
+        self.assertEqual(self.requested_pages(), [2, 4])
+
+    def test_range_stops_at_the_end_of_the_list(self):
+        events = Event.list(pages=range(4, 100))
+        self.assertEqual(len(events), 4)
+        self.assertEqual(self.requested_pages(), [4, 5])
+
+    def test_start_at_page_with_unbounded_pages(self):
+        events = Event.list(pages=itertools.count(3), prefetch=0)
+        self.assertEqual(len(events), 6)
+        self.assertEqual(self.requested_pages(), [3, 4, 5])
+
+    def test_page_past_the_end_yields_nothing(self):
+        self.assertEqual(Event.list(pages=[9]), [])
+
+    def test_cursor_resumes_after_a_crash(self):
+        cursor = ListCursor()
+        seen = []
+        with self.assertRaises(RuntimeError):
+            for event in Event.iter_list(cursor=cursor):
+                if event.uuid == '3-1':
+                    raise RuntimeError('crashed')
+                seen.append(event.uuid)
+        # page 3 was not finished, so it is where to pick up
+        self.assertEqual(cursor, ListCursor(page=3))
+
+        saved = json.loads(json.dumps(cursor.to_dict()))
+        self.client.get_resource_list.reset_mock()
+        resumed = ListCursor.from_dict(saved)
+        events = Event.list(cursor=resumed)
+        self.assertEqual(events[0].uuid, '3-0')
+        self.assertEqual(len(events), 6)
+        self.assertEqual(self.requested_pages(), [3, 4, 5])
+        self.assertEqual(resumed, ListCursor(page=6, done=True))
+        self.assertEqual(Event.list(cursor=resumed), [])
+
+    def test_cursor_with_parallel_pages(self):
+        cursor = ListCursor(page=2)
+        events = Event.list(cursor=cursor, parallel=2)
+        self.assertEqual(len(events), 8)
+        self.assertEqual(sorted(self.requested_pages()), [2, 3, 4, 5])
+        self.assertTrue(cursor.done)
+
+    def test_cursor_skips_finished_selected_pages(self):
+        cursor = ListCursor(page=3)
+        events = Event.list(pages=[1, 2, 4], cursor=cursor)
+        self.assertEqual([e.uuid for e in events], ['4-0', '4-1'])
+        self.assertEqual(cursor, ListCursor(page=5))
+
+    def test_cursor_resumes_after_selected_pages(self):
+        cursor = ListCursor()
+        self.assertEqual(len(Event.list(pages=[1, 2], cursor=cursor)), 4)
+        self.assertEqual(cursor, ListCursor(page=3))
+        self.client.get_resource_list.reset_mock()
+        events = Event.list(cursor=cursor)
+        self.assertEqual(events[0].uuid, '3-0')
+        self.assertEqual(len(events), 6)
+        self.assertEqual(self.requested_pages(), [3, 4, 5])
+        self.assertEqual(cursor, ListCursor(page=6, done=True))
+
+    def test_cursor_is_done_after_an_empty_listing(self):
+        self.pages = [{'count': 0, 'next': None, 'results': []}]
+        for pages in ([1, 2], None):
+            cursor = ListCursor()
+            self.assertEqual(Event.list(pages=pages, cursor=cursor), [])
+            self.assertEqual(cursor, ListCursor(page=2, done=True))
+
+    def test_cursor_is_done_after_selecting_the_last_page(self):
+        cursor = ListCursor()
+        Event.list(pages=[4, 5, 6], cursor=cursor)
+        self.assertEqual(cursor, ListCursor(page=6, done=True))
+
+
+class TestPaginationEngine(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient()
+
+    def test_polls_while_there_are_more_events(self):
+        polls = [
+            {'has_more_events': True, 'results': page['results']}
+            for page in make_pages(3)
+        ]
+        polls[-1]['has_more_events'] = False
+        self.client.get_resource_list = MagicMock(side_effect=polls)
+        events = ManagedIntegration.event_list('abc', params={'limit': 2})
+        self.assertEqual(len(events), 6)
+        self.assertEqual(self.client.get_resource_list.call_count, 3)
+        for call in self.client.get_resource_list.call_args_list:
+            self.assertEqual(call[1]['params'], {'limit': 2})
+
+    def test_pages_limit_the_number_of_polls(self):
+        polls = [{'has_more_events': True, 'results': []} for _ in range(5)]
+        self.client.get_resource_list = MagicMock(side_effect=polls)
+        ManagedIntegration.event_list('abc', pages=[1, 2])
+        self.assertEqual(self.client.get_resource_list.call_count, 2)
+
+    def test_fetch_and_on_page_hooks(self):
+        pages = make_pages(3)
+        fetched = []
+        seen = []
+
+        def fetch(list_url, params):
+            fetched.append(params)
+            return pages[len(fetched) - 1]
+
+        responses = paginate(
+            None,
+            'events/public',
+            params={'type': 'part.created'},
+            fetch=fetch,
+            on_page=lambda page, response: seen.append(page),
+        )
+        self.assertEqual(list(responses), pages)
+        self.assertEqual(len(fetched), 3)
+        self.assertEqual(fetched[2]['type'], 'part.created')
+        self.assertEqual(seen, [1, 2, 3])
+
+    def test_poll_endpoints_cannot_be_resumed(self):
+        with self.assertRaises(ValueError):
+            paginate(self.client, 'poll', more_key='has_more', cursor=ListCursor())
+
+
+class TestPageSize(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.server = FakePaperlessServer(page_size=5, clock=self.clock)
+        self.events = self.server.add_collection(
+            'events/public',
+            [
+                {
+                    'uuid': str(i),
+                    'type': 'part.created',
+                    'created': '2022-02-01T22:21:58.718957Z',
+                    'data': {},
+                    'related_object': 'x',
+                    'related_object_type': 'part',
+                }
+                for i in range(200)
+            ],
+            key='uuid',
+        )
+        self.sizes = []
+        self.client = PaperlessClient(
+            set_default=True, access_token='fake', transport=self.server
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+        self.client.get_resource_list = MagicMock(side_effect=self.get_resource_list)
+
+    def get_resource_list(self, list_url, params=None, resource_type=None):
+        page_size = (params or {}).get('page_size')
+        if isinstance(page_size, list):
+            page_size = page_size[0]
+        self.sizes.append(page_size and int(page_size))
+        return PaperlessClient.get_resource_list(
+            self.client, list_url, params=params, resource_type=resource_type
+        )
+
+    def uuids(self, responses):
+        return [
+            event['uuid'] for response in responses for event in response['results']
+        ]
+
+    def test_page_size_is_sent_with_every_page(self):
+        responses = paginate(
+            self.client, 'events/public', params={'o': 'uuid'}, page_size=50
+        )
+        self.assertEqual(len(self.uuids(responses)), 200)
+        self.assertEqual(self.sizes, [50, 50, 50, 50])
+
+    def test_adaptive_page_size_grows_while_pages_are_fast(self):
+        self.server.latency = 0.1
+        adaptive = AdaptivePageSize(
+            initial=10, maximum=80, target=0.5, clock=self.clock
+        )
+        uuids = self.uuids(paginate(self.client, 'events/public', page_size=adaptive))
+        self.assertEqual(uuids, [str(i) for i in range(200)])
+        self.assertEqual(self.sizes, [10, 10, 20, 40, 80, 80])
+
+    def test_adaptive_page_size_shrinks_when_pages_are_slow(self):
+        self.server.latency = 1.0
+        adaptive = AdaptivePageSize(
+            initial=80, minimum=20, target=0.5, clock=self.clock
+        )
+        uuids = self.uuids(paginate(self.client, 'events/public', page_size=adaptive))
+        self.assertEqual(uuids, [str(i) for i in range(200)])
+        self.assertEqual(self.sizes[:4], [80, 40, 20, 20])
+
+    def test_adaptive_page_size_respects_the_api_maximum(self):
+        self.server.max_page_size = 30
+        adaptive = AdaptivePageSize(initial=25, maximum=1000, clock=self.clock)
+        events = Event.list(page_size=adaptive)
+        self.assertEqual([e.uuid for e in events], [str(i) for i in range(200)])
+        # asking for 50 at object 50 gets the cap of 30, which is then avoided
+        self.assertEqual(self.sizes[:4], [25, 25, 50, 25])
+        self.assertLessEqual(max(self.sizes[3:]), 30)
+
+    def test_adaptive_page_size_needs_a_fixed_page_numbering(self):
+        with self.assertRaises(ValueError):
+            Event.list(page_size=AdaptivePageSize(), cursor=ListCursor())
+
+
+class TestCountAndExists(unittest.TestCase):
+    def setUp(self):
+        self.server = FakePaperlessServer.from_fixtures(MOCK_DATA, page_size=5)
+        self.client = PaperlessClient(
+            set_default=True, access_token='fake', transport=self.server
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+
+    def test_count_requests_a_single_object(self):
+        self.assertEqual(PurchasedComponent.count(), 23)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_exists(self):
+        self.assertTrue(PurchasedComponent.exists())
+        self.server.get_collection('events/public').objects.clear()
+        self.assertFalse(Event.exists(params={'type': 'part.created'}))
+        self.assertEqual(self.server.request_count, 2)
+
+    def test_count_walks_pages_without_a_count(self):
+        pages = make_pages(3, count=False)
+        self.client.get_resource_list = MagicMock(side_effect=[pages[0]] + pages)
+        self.assertEqual(Event.count(), 6)
+
+    def test_integration_action_count(self):
+        self.client.get_resource_list = MagicMock(
+            return_value={'count': 7, 'results': []}
+        )
+        self.assertEqual(IntegrationAction.count('abc', status='queued'), 7)
+        self.assertFalse(IntegrationAction.exists('abc', status='queued'))
+        self.assertEqual(
+            self.client.get_resource_list.call_args[1]['params'],
+            {'status': 'queued', 'type': None, 'page_size': 1},
+        )
@@ -11,7 +11,7 @@ from paperless.objects.purchased_components import (
 
 class TestPurchasedComponents(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/purchased_components.json') as data_file:
             self.mock_purchased_components_json = json.load(data_file)
@@ -37,10 +37,57 @@ class TestPurchasedComponents(unittest.TestCase):
         self.assertEqual(len(response.successes), 1)
         self.assertEqual(len(response.failures), 1)
 
+    def mock_pages(self, page_size=10):
+        components = self.mock_purchased_components_json
+        pages = []
+        for start in range(0, len(components), page_size):
+            page = len(pages) + 1
+            more = start + page_size < len(components)
+            pages.append(
+                {
+                    'count': len(components),
+                    'next': (
+                        'https://api.paperlessparts.com/suppliers/public/'
+                        'purchased_components?page={}'.format(page + 1)
+                        if more
+                        else None
+                    ),
+                    'previous': None,
+                    'results': components[start : start + page_size],
+                }
+            )
+        return pages
+
+    def test_iter_list_fetches_pages_lazily(self):
+        self.client.get_resource_list = MagicMock(side_effect=self.mock_pages())
+        components = PurchasedComponent.iter_list(params={'search': 'x'})
+        self.assertEqual(self.client.get_resource_list.call_count, 0)
+        first = next(components)
+        self.assertEqual(first.id, self.mock_pc1['id'])
+        self.assertEqual(self.client.get_resource_list.call_count, 1)
+        rest = list(components)
+        self.assertEqual(len(rest) + 1, len(self.mock_purchased_components_json))
+        self.assertEqual(self.client.get_resource_list.call_count, 3)
+        # the filters are sent with every page
+        self.assertEqual(
+            self.client.get_resource_list.call_args[1]['params'],
+            {'page': ['3'], 'search': 'x'},
+        )
+
+    def test_iter_pages_and_list(self):
+        self.client.get_resource_list = MagicMock(side_effect=self.mock_pages())
+        pages = list(PurchasedComponent.iter_pages())
+        self.assertEqual([len(p['results']) for p in pages], [10, 10, 3])
+        self.client.get_resource_list = MagicMock(side_effect=self.mock_pages())
+        self.assertEqual(
+            [c.id for c in PurchasedComponent.list()],
+            [c['id'] for c in self.mock_purchased_components_json],
+        )
+
 
 class TestPurchasedComponentColumns(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/purchased_component_columns.json') as data_file:
             self.mock_purchased_component_columns_json = json.load(data_file)
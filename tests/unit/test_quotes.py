@@ -3,13 +3,17 @@ import unittest
 from decimal import Decimal
 from unittest.mock import MagicMock
 
+import attr
+
 from paperless.client import PaperlessClient
+from paperless.objects.common import Money
 from paperless.objects.quotes import Quote
+from paperless.objects.utils import LazyList
 
 
 class TestQuotes(unittest.TestCase):
     def setUp(self):
-        # instantiate client singleton
+        # instantiate the default client
         self.client = PaperlessClient()
         with open('tests/unit/mock_data/quote.json') as data_file:
             self.mock_quote_json = json.load(data_file)
@@ -619,3 +623,44 @@ class TestQuotes(unittest.TestCase):
         self.assertEqual(supplier_facility.id, 1)
         self.assertEqual(supplier_facility.name, "Paperless Parts")
         self.assertEqual(supplier_facility.is_default, True)
+
+    def test_get_quote_without_validation(self):
+        self.client.get_resource = MagicMock(return_value=self.mock_quote_json)
+        validated = Quote.get(1)
+        trusted = Quote.get(1, validate=False)
+        # the same objects are built, converters included
+        self.assertEqual(attr.asdict(trusted), attr.asdict(validated))
+        self.assertIsInstance(
+            trusted.quote_items[0].components[0].quantities[0].unit_price, Money
+        )
+
+    def test_quote_graph_is_slotted(self):
+        self.client.get_resource = MagicMock(return_value=self.mock_quote_json)
+        q = Quote.get(1)
+        component = q.quote_items[0].components[0]
+        operation = component.shop_operations[0]
+        for obj in (
+            q.quote_items[0],
+            component,
+            component.quantities[0],
+            component.quantities[0].unit_price,
+            operation,
+            operation.quantities[0],
+            operation.costing_variables[0],
+        ):
+            self.assertFalse(hasattr(obj, '__dict__'), type(obj).__name__)
+        # the costing variable mixin still works on the slotted operations
+        variable = operation.costing_variables[0]
+        self.assertEqual(variable.value, operation.get_variable(variable.label))
+
+    def test_get_quote_lazily(self):
+        self.client.get_resource = MagicMock(return_value=self.mock_quote_json)
+        q = Quote.get(1, lazy=True)
+        self.assertEqual(q.number, 339)
+        self.assertIsInstance(q.quote_items, LazyList)
+        # nothing nested is built until it is accessed
+        self.assertIsInstance(list.__getitem__(q.quote_items, 0), dict)
+        component = q.quote_items[0].components[0]
+        self.assertIsInstance(component.shop_operations, LazyList)
+        self.assertIs(component, q.quote_items[0].components[0])
+        self.assertEqual(attr.asdict(q), attr.asdict(Quote.get(1)))
@@ -0,0 +1,96 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+from paperless.client import PaperlessClient
+from paperless.ratelimit import RateLimiter, SQLiteTokenBucket, TokenBucket
+from paperless.retry import RetryPolicy
+from tests.unit.clock import FakeClock
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_then_rate(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        for _ in range(3):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0.5)
+        self.assertEqual(bucket.acquire(), 0.5)
+        clock.now += 10
+        # refills up to the burst size only
+        for _ in range(3):
+            self.assertEqual(bucket.acquire(), 0)
+        self.assertEqual(bucket.acquire(), 0.5)
+
+    def test_pause(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1, burst=5, clock=clock)
+        bucket.pause(30)
+        self.assertEqual(bucket.acquire(), 31)
+
+
+class TestSQLiteTokenBucket(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.sqlite3')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_buckets_share_state(self):
+        clock = FakeClock(now=1000.0)
+        first = SQLiteTokenBucket(self.path, 'group', rate=1, burst=2, clock=clock)
+        second = SQLiteTokenBucket(self.path, 'group', rate=1, burst=2, clock=clock)
+        other = SQLiteTokenBucket(self.path, 'other', rate=1, burst=2, clock=clock)
+        self.assertEqual(first.acquire(), 0)
+        self.assertEqual(second.acquire(), 0)
+        self.assertEqual(first.acquire(), 1)
+        self.assertEqual(other.acquire(), 0)
+        second.set_rate(0.5)
+        self.assertEqual(first.get_rate(), 0.5)
+        first.pause(10)
+        self.assertEqual(second.acquire(), 12)
+        for bucket in (first, second, other):
+            bucket.close()
+
+
+class TestRateLimiter(unittest.TestCase):
+    def test_buckets_per_key(self):
+        limiter = RateLimiter(rate=1, burst=1, clock=FakeClock())
+        self.assertEqual(limiter.acquire('a'), 0)
+        self.assertEqual(limiter.acquire('b'), 0)
+        self.assertEqual(limiter.acquire('a'), 1)
+        self.assertIs(limiter.bucket(None), limiter.bucket(RateLimiter.DEFAULT_KEY))
+
+    def test_learns_from_throttling(self):
+        clock = FakeClock()
+        limiter = RateLimiter(rate=10, burst=1, clock=clock, min_rate=5)
+        limiter.on_throttled('a', retry_after=20)
+        self.assertEqual(limiter.bucket('a').get_rate(), 8)
+        self.assertGreaterEqual(limiter.acquire('a'), 20)
+        for _ in range(5):
+            limiter.on_throttled('a')
+        self.assertEqual(limiter.bucket('a').get_rate(), 5)
+        for _ in range(100):
+            limiter.on_success('a')
+        self.assertEqual(limiter.bucket('a').get_rate(), 10)
+
+    def test_client_uses_limiter(self):
+        clock = FakeClock()
+        limiter = Mock(wraps=RateLimiter(clock=clock))
+        client = PaperlessClient(
+            set_default=False,
+            access_token='test_accesstoken',
+            group_slug='acme',
+            rate_limiter=limiter,
+            retry_policy=RetryPolicy(clock=clock),
+        )
+        throttled = Mock(status_code=429, headers={'Retry-After': '3'})
+        ok = Mock(status_code=200, headers={})
+        with patch.object(client.get_session(), 'request', side_effect=[throttled, ok]):
+            client.request(url='orders/public/1', method='get')
+        self.assertEqual(limiter.acquire.call_count, 2)
+        limiter.acquire.assert_called_with('acme')
+        limiter.on_throttled.assert_called_once_with('acme', 3.0)
+        limiter.on_success.assert_called_once_with('acme')
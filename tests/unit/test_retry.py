@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import Mock, patch
+
+import requests
+
+from paperless.client import PaperlessClient
+from paperless.exceptions import PaperlessException
+from paperless.retry import RetryBudget, RetryPolicy, get_retry_after
+from tests.unit.clock import FakeClock
+
+
+def make_response(status_code, headers=None, body=None):
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.json.return_value = body if body is not None else {}
+    return response
+
+
+class TestRetryPolicy(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.client = PaperlessClient(set_default=True, access_token='test_accesstoken')
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+
+    def send(self, responses, method=PaperlessClient.METHODS.GET, **policy_kwargs):
+        self.client.retry_policy = RetryPolicy(
+            clock=self.clock, jitter=False, **policy_kwargs
+        )
+        session = self.client.get_session()
+        with patch.object(session, 'request', side_effect=responses) as request:
+            try:
+                return self.client.request(url='orders/public/1', method=method)
+            finally:
+                self.call_count = request.call_count
+
+    def test_retry_after_header(self):
+        resp = self.send([make_response(429, {'Retry-After': '7'}), make_response(200)])
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(self.clock.sleeps, [7.0])
+
+    def test_throttle_message(self):
+        message = 'Request was throttled. Expected available in 12 seconds.'
+        self.send([make_response(429, body={'message': message}), make_response(200)])
+        self.assertEqual(self.clock.sleeps, [13.0])
+
+    def test_exponential_backoff(self):
+        responses = [make_response(503)] * 3 + [make_response(200)]
+        self.send(responses, backoff_base=0.5)
+        self.assertEqual(self.clock.sleeps, [0.5, 1.0, 2.0])
+
+    def test_backoff_is_capped_and_jittered(self):
+        policy = RetryPolicy(backoff_base=1, backoff_max=10, random=lambda: 0.5)
+        self.assertEqual(policy.backoff(0), 0.5)
+        self.assertEqual(policy.backoff(8), 5.0)
+
+    def test_max_attempts(self):
+        with self.assertRaises(PaperlessException) as cm:
+            self.send([make_response(502)] * 10, max_attempts=3)
+        self.assertEqual(cm.exception.error_code, 502)
+        self.assertEqual(self.call_count, 3)
+
+    def test_non_idempotent_methods_are_not_retried(self):
+        with self.assertRaises(PaperlessException):
+            self.send([make_response(502), make_response(201)], method='post')
+        self.assertEqual(self.call_count, 1)
+        # but throttled requests were never processed, so they are retried
+        resp = self.send([make_response(429), make_response(201)], method='post')
+        self.assertEqual(resp.status_code, 201)
+
+    def test_connection_errors(self):
+        resp = self.send([requests.ConnectionError(), make_response(200)])
+        self.assertEqual(resp.status_code, 200)
+        with self.assertRaises(requests.Timeout):
+            self.send([requests.Timeout(), make_response(200)], method='patch')
+
+    def test_max_total_delay(self):
+        with self.assertRaises(PaperlessException):
+            self.send(
+                [make_response(429, {'Retry-After': '30'})] * 3, max_total_delay=45
+            )
+        self.assertEqual(self.clock.sleeps, [30.0])
+
+    def test_client_budget(self):
+        budget = RetryBudget(max_retries=2, period=60, clock=self.clock)
+        with self.assertRaises(PaperlessException):
+            self.send([make_response(503)] * 5, budget=budget)
+        self.assertEqual(self.call_count, 3)
+        self.clock.now += 61
+        self.assertTrue(budget.try_acquire())
+
+    def test_get_retry_after_http_date(self):
+        response = make_response(503, {'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'})
+        self.assertEqual(get_retry_after(response), 0.0)
+        self.assertIsNone(get_retry_after(make_response(503)))
@@ -0,0 +1,100 @@
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+from paperless.client import PaperlessClient
+from paperless.exceptions import PaperlessNotFoundException
+from paperless.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    def test_error_fans_out(self):
+        group = SingleFlight()
+        started = threading.Event()
+        release = threading.Event()
+
+        def fail():
+            started.set()
+            release.wait()
+            raise ValueError('boom')
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            leader = pool.submit(group.do, 'key', fail)
+            started.wait()
+            follower = pool.submit(group.do, 'key', fail)
+            while group.stats()['coalesced'] == 0:
+                time.sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with self.assertRaises(ValueError):
+                    future.result()
+        self.assertEqual(group.stats(), {'executed': 1, 'coalesced': 1})
+
+
+class TestRequestCoalescing(unittest.TestCase):
+    def setUp(self):
+        self.client = PaperlessClient(set_default=True, access_token='test_accesstoken')
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+        self.calls = 0
+
+    def slow_request(self, method, url, **kwargs):
+        self.calls += 1
+        time.sleep(0.1)
+        response = Mock(status_code=200 if url.endswith('/1') else 404)
+        response.json.side_effect = lambda: {'number': 1, 'items': []}
+        return response
+
+    def fetch_concurrently(self, fn, n=8):
+        barrier = threading.Barrier(n)
+
+        def work(_):
+            barrier.wait()
+            try:
+                return fn()
+            except Exception as e:
+                return e
+
+        with patch.object(
+            self.client.get_session(), 'request', side_effect=self.slow_request
+        ):
+            with ThreadPoolExecutor(max_workers=n) as pool:
+                return list(pool.map(work, range(n)))
+
+    def test_identical_gets_share_one_request(self):
+        results = self.fetch_concurrently(
+            lambda: self.client.get_resource('orders/public', 1)
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(r == {'number': 1, 'items': []} for r in results))
+        # every caller gets its own parsed copy
+        self.assertEqual(len({id(r) for r in results}), len(results))
+        self.assertEqual(
+            self.client.singleflight.stats(),
+            {'executed': 1, 'coalesced': len(results) - 1},
+        )
+
+    def test_errors_fan_out(self):
+        results = self.fetch_concurrently(
+            lambda: self.client.get_resource('orders/public', 2)
+        )
+        self.assertEqual(self.calls, 1)
+        self.assertTrue(all(isinstance(r, PaperlessNotFoundException) for r in results))
+
+    def test_different_params_are_not_coalesced(self):
+        counter = iter(range(100))
+        lock = threading.Lock()
+
+        def fetch():
+            with lock:
+                page = next(counter)
+            return self.client.get_resource('orders/public', 1, params={'p': page})
+
+        self.fetch_concurrently(fetch, n=4)
+        self.assertEqual(self.calls, 4)
+
+    def test_disabled(self):
+        self.client.coalesce_requests = False
+        self.fetch_concurrently(lambda: self.client.get_resource('orders/public', 1))
+        self.assertEqual(self.calls, 8)
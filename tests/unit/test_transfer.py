@@ -0,0 +1,120 @@
+import gzip
+import json
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from paperless.client import PaperlessClient
+from paperless.objects.purchased_components import PurchasedComponent
+from paperless.transfer import TransferStats, endpoint_name
+
+
+class GzipHandler(BaseHTTPRequestHandler):
+    """Echoes the decoded request body back, gzipped if the client accepts it."""
+
+    protocol_version = 'HTTP/1.1'
+    requests = []
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers['Content-Length']))
+        type(self).requests.append((dict(self.headers), body))
+        if self.headers.get('Content-Encoding') == 'gzip':
+            body = gzip.decompress(body)
+        components = json.loads(body)['purchased_components']
+        self.respond({'successes': components, 'failures': []})
+
+    def do_GET(self):
+        type(self).requests.append((dict(self.headers), b''))
+        self.respond({'id': 1, 'notes': 'x' * 10000})
+
+    def respond(self, body):
+        payload = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            payload = gzip.compress(payload)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestCompressedTransfer(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), GzipHandler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self):
+        self.stats = TransferStats()
+        self.client = PaperlessClient(
+            set_default=True,
+            access_token='test_accesstoken',
+            base_url='http://127.0.0.1:{}'.format(self.server.server_address[1]),
+            compress_min_size=1024,
+            transfer_stats=self.stats,
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+        GzipHandler.requests = []
+
+    def tearDown(self):
+        self.client.close()
+
+    def components(self, n):
+        return [
+            PurchasedComponent(
+                oem_part_number='PART-{}'.format(i), piece_price='1.0000', id=i
+            )
+            for i in range(n)
+        ]
+
+    def test_large_batch_is_gzipped(self):
+        result = PurchasedComponent.upsert_many(self.components(100))
+        self.assertEqual(len(result.successes), 100)
+        headers, body = GzipHandler.requests[0]
+        self.assertEqual(headers['Content-Encoding'], 'gzip')
+        counts = self.stats.stats()['PUT suppliers/public/purchased_components/batch']
+        self.assertEqual(counts['requests'], 1)
+        self.assertEqual(counts['bytes_sent'], len(body))
+        self.assertLess(counts['bytes_sent'], counts['bytes_sent_raw'])
+        self.assertLess(counts['bytes_received'], counts['bytes_received_raw'])
+
+    def test_small_batch_is_not_gzipped(self):
+        PurchasedComponent.upsert_many(self.components(1))
+        headers, body = GzipHandler.requests[0]
+        self.assertNotIn('Content-Encoding', headers)
+        totals = self.stats.totals()
+        self.assertEqual(totals['bytes_sent'], totals['bytes_sent_raw'])
+
+    def test_responses_are_decompressed(self):
+        resource = self.client.get_resource('suppliers/public/purchased_components', 1)
+        self.assertEqual(len(resource['notes']), 10000)
+        self.assertIn('gzip', GzipHandler.requests[0][0]['Accept-Encoding'])
+        counts = self.stats.stats()['GET suppliers/public/purchased_components/{id}']
+        self.assertLess(counts['bytes_received'], 1000)
+        self.assertGreater(counts['bytes_received_raw'], 10000)
+
+
+class TestEndpointName(unittest.TestCase):
+    def test_ids_are_replaced(self):
+        self.assertEqual(
+            endpoint_name('get', 'quotes/public/123'), 'GET quotes/public/{id}'
+        )
+        self.assertEqual(
+            endpoint_name(
+                'patch',
+                'integration_actions/public/0f8fad5b-d9cb-469f-a165-70867728950e',
+            ),
+            'PATCH integration_actions/public/{id}',
+        )
+        self.assertEqual(
+            endpoint_name('get', 'orders/public/new'), 'GET orders/public/new'
+        )
@@ -0,0 +1,132 @@
+import os
+import tempfile
+import unittest
+
+import requests
+
+from paperless.client import PaperlessClient
+from paperless.exceptions import PaperlessException, PaperlessNotFoundException
+from paperless.fake_server import FakePaperlessServer
+from paperless.objects.customers import PaymentTerms
+from paperless.objects.orders import Order
+from paperless.objects.purchased_components import PurchasedComponent
+from paperless.objects.quotes import Quote
+from paperless.retry import RetryPolicy
+from paperless.transport import RecordingTransport, ReplayTransport, make_response
+from tests.unit.clock import FakeClock
+
+MOCK_DATA = os.path.join(os.path.dirname(__file__), 'mock_data')
+
+
+class TestFakePaperlessServer(unittest.TestCase):
+    def setUp(self):
+        self.clock = FakeClock()
+        self.server = FakePaperlessServer.from_fixtures(
+            MOCK_DATA, page_size=5, clock=self.clock
+        )
+        self.client = PaperlessClient(
+            set_default=True,
+            access_token='fake',
+            group_slug='fake-group',
+            transport=self.server,
+            retry_policy=RetryPolicy(clock=self.clock),
+        )
+        self.addCleanup(PaperlessClient.set_default_instance, None)
+
+    def test_read_and_list(self):
+        quote = Quote.get(Quote.get_new()[0]['quote'])
+        self.assertIsInstance(quote, Quote)
+        self.assertEqual(len(PaymentTerms.list()), 2)
+        self.assertEqual(len(Order.list()), 1)
+        with self.assertRaises(PaperlessNotFoundException):
+            Order.get(999999)
+
+    def test_pagination(self):
+        components = PurchasedComponent.list()
+        self.assertEqual(len(components), 23)
+        # five pages of five components
+        self.assertEqual(self.server.request_count, 5)
+
+    def test_batch_upsert(self):
+        new = PurchasedComponent(oem_part_number='NEW', piece_price='1.0000')
+        result = PurchasedComponent.upsert_many([new])
+        self.assertEqual(len(result.successes), 1)
+        collection = self.server.get_collection('suppliers/public/purchased_components')
+        self.assertEqual(len(collection.objects), 24)
+
+    def test_throttling(self):
+        self.server.rate_limit = 2
+        self.server.rate_period = 10
+        for _ in range(3):
+            PaymentTerms.list()
+        self.assertEqual(self.server.throttled_count, 1)
+        self.assertEqual(self.clock.sleeps, [10.0])
+
+    def test_latency(self):
+        self.server.latency = 0.25
+        PaymentTerms.list()
+        self.assertEqual(self.clock.sleeps, [0.25])
+
+
+class StaticTransport:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+
+    def send(self, method, url, **kwargs):
+        return self.responses.pop(0)
+
+    def close(self):
+        pass
+
+
+class TestRecordAndReplay(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp(suffix='.json')
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_replay_recorded_exchanges(self):
+        recorder = RecordingTransport(
+            StaticTransport(
+                make_response(200, {'id': 1}), make_response(404, {'detail': 'no'})
+            )
+        )
+        client = PaperlessClient(
+            set_default=False, access_token='fake', transport=recorder
+        )
+        self.assertEqual(client.get_resource('users/public', 1), {'id': 1})
+        with self.assertRaises(PaperlessNotFoundException):
+            client.get_resource('users/public', 2)
+        recorder.save(self.path)
+
+        client = PaperlessClient(
+            set_default=False, access_token='fake', transport=ReplayTransport(self.path)
+        )
+        self.assertEqual(client.get_resource('users/public', 1), {'id': 1})
+        with self.assertRaises(PaperlessNotFoundException):
+            client.get_resource('users/public', 2)
+        with self.assertRaises(PaperlessException):
+            client.get_resource('users/public', 1)
+
+    def test_connection_errors_reach_retry_policy(self):
+        clock = FakeClock()
+        transport = StaticTransport(make_response(200, {'id': 1}))
+        send = transport.send
+        failures = [requests.ConnectionError('reset')]
+
+        def flaky_send(method, url, **kwargs):
+            if failures:
+                raise failures.pop()
+            return send(method, url, **kwargs)
+
+        transport.send = flaky_send
+        client = PaperlessClient(
+            set_default=False,
+            access_token='fake',
+            transport=transport,
+            retry_policy=RetryPolicy(clock=clock),
+        )
+        self.assertEqual(client.get_resource('users/public', 1), {'id': 1})
+        self.assertEqual(len(clock.sleeps), 1)